@@ -1,14 +1,16 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import gevent
 from more_itertools import peekable
 
+from rotkehlchen.accounting.checkpoints import AccountingCheckpoints
 from rotkehlchen.accounting.constants import FREE_PNL_EVENTS_LIMIT
 from rotkehlchen.accounting.export.csv import CSVExporter
-from rotkehlchen.accounting.pot import AccountingPot
+from rotkehlchen.accounting.pot import PRICE_PREFETCH_WINDOW, AccountingPot
 from rotkehlchen.accounting.structures.types import ActionType
 from rotkehlchen.accounting.types import EventAccountingRuleStatus, MissingPrice
 from rotkehlchen.chain.evm.accounting.aggregator import EVMAccountingAggregators
@@ -90,11 +92,10 @@ class Accountant:
     def _process_skipping_exception(
             self,
             exception: Exception,
-            events: Sequence['AccountingEventMixin'],
+            event: 'AccountingEventMixin',
             count: int,
             reason: str,
     ) -> int:
-        event = events[count]
         ts = event.get_timestamp()
         identifier = event.get_identifier()
         self.msg_aggregator.add_error(
@@ -113,13 +114,16 @@ class Accountant:
             self,
             start_ts: Timestamp,
             end_ts: Timestamp,
-            events: Sequence['AccountingEventMixin'],
+            events: Sequence['AccountingEventMixin'] | Iterator['AccountingEventMixin'],
+            events_num: int | None = None,
     ) -> int:
         """Processes the entire history of cryptoworld actions in order to determine
         the price and time at which every asset was obtained and also
         the general and taxable profit/loss.
 
         The events history is already expected to be sorted when passed to this function.
+        It can also be an iterator that lazily provides the events, in which case events_num
+        should be the number of events it provides.
 
         start_ts here is the timestamp at which to start taking trades and other
         taxable events into account. Not where processing starts from. Processing
@@ -142,7 +146,8 @@ class Accountant:
             self.ignored_asset_ids = self.db.get_ignored_asset_ids(cursor)
             # Create a new pnl report in the DB to be used to save each event generated
             dbpnl = DBAccountingReports(self.db)
-            first_ts = Timestamp(0) if len(events) == 0 else events[0].get_timestamp()
+            peekable_events = peekable(events)
+            first_ts = Timestamp(0) if (first_event := peekable_events.peek(None)) is None else first_event.get_timestamp()  # noqa: E501
             report_id = dbpnl.add_report(
                 first_processed_timestamp=first_ts,
                 start_ts=start_ts,
@@ -158,12 +163,48 @@ class Accountant:
             self.first_processed_timestamp = first_ts
 
             count = 0
-            actions_length = len(events)
+            actions_length = len(events) if events_num is None else events_num  # type: ignore[arg-type]  # events_num is given for iterators
             prev_time = last_event_ts = Timestamp(0)
             ignored_ids_mapping = self.db.get_ignored_action_ids(cursor=cursor, action_type=None)
 
-        events_iter = peekable(events)
+        checkpoints, source = None, cast(Iterator['AccountingEventMixin'], peekable_events)
+        if db_settings.calculate_past_cost_basis:
+            # Resume from the state saved by a previous report if it is still valid
+            checkpoints = AccountingCheckpoints(
+                database=self.db,
+                settings=db_settings,
+                ignored_asset_ids=self.ignored_asset_ids,
+                ignored_ids_mapping=ignored_ids_mapping,
+            )
+            skipped_events_num, last_skipped_ts, source = checkpoints.restore(
+                pot=self.pots[0],
+                events=source,
+                start_ts=start_ts,
+            )
+            if skipped_events_num != 0:
+                count = skipped_events_num
+                prev_time = last_event_ts = last_skipped_ts
+
+        # Query the prices needed by the events concurrently before the sequential pass
+        source = self._prefetch_rates_in_windows(
+            events=source,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            db_settings=db_settings,
+            ignored_ids_mapping=ignored_ids_mapping,
+            events_limit=None if active_premium else FREE_PNL_EVENTS_LIMIT - count,
+        )
+        if checkpoints is not None:
+            source = checkpoints.track(events=source, start_ts=start_ts)
+
+        events_iter = peekable(source)
         while True:
+            if (next_event := events_iter.peek(None)) is None:
+                break  # processed all events
+
+            if checkpoints is not None:
+                checkpoints.maybe_save(pot=self.pots[0], next_event=next_event, start_ts=start_ts)
+
             try:
                 (
                     processed_events_num,
@@ -179,7 +220,7 @@ class Accountant:
             except PriceQueryUnsupportedAsset as e:
                 count = self._process_skipping_exception(
                     exception=e,
-                    events=events,
+                    event=next_event,
                     count=count,
                     reason='not being able to find price for an unsupported asset',
                 )
@@ -197,7 +238,7 @@ class Accountant:
             except RemoteError as e:
                 count = self._process_skipping_exception(
                     exception=e,
-                    events=events,
+                    event=next_event,
                     count=count,
                     reason='inability to reach an external service at that point in time',
                 )
@@ -221,7 +262,7 @@ class Accountant:
                 log.debug(
                     f'PnL reports event processing has hit the event limit of {events_limit}. '
                     f'Processing stopped and the results will not '
-                    f'take into account subsequent events. Total events were {len(events)}',
+                    f'take into account subsequent events. Total events were {actions_length}',
                 )
                 break
 
@@ -239,6 +280,31 @@ class Accountant:
         self.ignored_asset_ids.clear()  # clean ignored assets from memory once PnL report run concludes  # noqa: E501
         return report_id
 
+    def _prefetch_rates_in_windows(
+            self,
+            events: Iterator['AccountingEventMixin'],
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            db_settings: DBSettings,
+            ignored_ids_mapping: dict[ActionType, set[str]],
+            events_limit: int | None,
+    ) -> Iterator['AccountingEventMixin']:
+        """Go through the events in windows of PRICE_PREFETCH_WINDOW events, prefetching
+        the prices needed by each window before it is processed. Only the first
+        events_limit events are prefetched if a limit is given."""
+        prefetched_num = 0
+        while len(window := list(islice(events, PRICE_PREFETCH_WINDOW))) != 0:
+            if events_limit is None or prefetched_num < events_limit:
+                self.pots[0].prefetch_rates_in_profit_currency(
+                    events=window if events_limit is None else window[:events_limit - prefetched_num],  # noqa: E501
+                    start_ts=start_ts,
+                    end_ts=end_ts,
+                    calculate_past_cost_basis=db_settings.calculate_past_cost_basis,
+                    ignored_ids_mapping=ignored_ids_mapping,
+                )
+            prefetched_num += len(window)
+            yield from window
+
     def _process_event(
             self,
             events_iterator: "peekable['AccountingEventMixin']",
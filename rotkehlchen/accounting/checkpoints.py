@@ -0,0 +1,227 @@
+import hashlib
+import json
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
+
+from rotkehlchen.db.reports import DBAccountingCheckpoints
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.types import Timestamp
+from rotkehlchen.utils.serialization import rlk_jsondumps
+
+if TYPE_CHECKING:
+    from rotkehlchen.accounting.mixins.event import AccountingEventMixin
+    from rotkehlchen.accounting.pot import AccountingPot
+    from rotkehlchen.accounting.structures.types import ActionType
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.settings import DBSettings
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+# Bump this when the serialized state or what it depends on changes
+CHECKPOINT_STATE_VERSION = 2
+
+
+def _year_start(timestamp: Timestamp, years_offset: int = 0) -> Timestamp:
+    """Return the timestamp of the start of the UTC year of the given timestamp"""
+    year = datetime.fromtimestamp(timestamp, tz=UTC).year + years_offset
+    return Timestamp(int(datetime(year, 1, 1, tzinfo=UTC).timestamp()))
+
+
+class AccountingCheckpoints:
+    """Saves and restores snapshots of the cost basis state of an accounting pot at
+    yearly boundaries so that PnL reports don't need to reprocess the entire history.
+
+    A checkpoint is keyed by a hash of everything other than the events that affects
+    processing: the accounting settings, rules, ignored assets and ignored actions.
+    It is only used if the events before it still hash to the value they had
+    when it was taken, so adding, editing or removing earlier events invalidates it.
+
+    Checkpoints are only taken at boundaries before the start of the report's period,
+    since from there on the pot also accumulates PnL totals and processed events.
+    """
+
+    def __init__(
+            self,
+            database: 'DBHandler',
+            settings: 'DBSettings',
+            ignored_asset_ids: set[str],
+            ignored_ids_mapping: dict['ActionType', set[str]],
+    ) -> None:
+        self.dbcheckpoints = DBAccountingCheckpoints(database)
+        self.settings_hash = self._calculate_settings_hash(
+            database=database,
+            settings=settings,
+            ignored_asset_ids=ignored_asset_ids,
+            ignored_ids_mapping=ignored_ids_mapping,
+        )
+        # running hash of the events read so far that are before any possible checkpoint
+        self.events_hasher = hashlib.sha256()
+        self.events_num = 0  # number of events read so far
+        self.last_checkpoint_ts = Timestamp(0)
+        self.next_boundary_ts = Timestamp(0)
+        # first event of the last year reached along with the number and hash of the events
+        # before it. Is what a checkpoint at the start of that year would be saved with.
+        self.year_start: tuple[AccountingEventMixin, int, str] | None = None
+
+    @staticmethod
+    def _calculate_settings_hash(
+            database: 'DBHandler',
+            settings: 'DBSettings',
+            ignored_asset_ids: set[str],
+            ignored_ids_mapping: dict['ActionType', set[str]],
+    ) -> str:
+        with database.conn.read_ctx() as cursor:
+            rules = cursor.execute('SELECT * FROM accounting_rules ORDER BY identifier').fetchall()
+            linked_rules = cursor.execute(
+                'SELECT * FROM linked_rules_properties ORDER BY identifier',
+            ).fetchall()
+
+        data = {
+            'version': CHECKPOINT_STATE_VERSION,
+            'main_currency': settings.main_currency.identifier,
+            'taxfree_after_period': settings.taxfree_after_period,
+            'include_crypto2crypto': settings.include_crypto2crypto,
+            'include_gas_costs': settings.include_gas_costs,
+            'account_for_assets_movements': settings.account_for_assets_movements,
+            'cost_basis_method': settings.cost_basis_method.serialize(),
+            'eth_staking_taxable_after_withdrawal_enabled': settings.eth_staking_taxable_after_withdrawal_enabled,  # noqa: E501
+            'include_fees_in_cost_basis': settings.include_fees_in_cost_basis,
+            'treat_eth2_as_eth': settings.treat_eth2_as_eth,
+            'historical_price_oracles': [str(x) for x in settings.historical_price_oracles],
+            'accounting_rules': rules,
+            'linked_rules': linked_rules,
+            'ignored_assets': sorted(ignored_asset_ids),
+            'ignored_actions': sorted(
+                (str(action_type), sorted(ids))
+                for action_type, ids in ignored_ids_mapping.items()
+            ),
+        }
+        return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+    @staticmethod
+    def _serialize_event(event: 'AccountingEventMixin') -> bytes:
+        return rlk_jsondumps(event.serialize_for_debug_import()).encode()
+
+    def restore(
+            self,
+            pot: 'AccountingPot',
+            events: Iterator['AccountingEventMixin'],
+            start_ts: Timestamp,
+    ) -> tuple[int, Timestamp, Iterator['AccountingEventMixin']]:
+        """Find the newest valid checkpoint taken before start_ts and restore the pot's
+        cost basis state from it. Checkpoints found invalid are deleted.
+
+        Events are read from the iterator only as far as needed to validate the checkpoints.
+        Returns the number of events covered by the restored checkpoint which should not be
+        processed again, the timestamp of the last of them and an iterator of the events
+        that should be processed.
+        """
+        restored_ts: Timestamp | None = None
+        restored_state: dict[str, Any] | None = None
+        last_skipped_ts = Timestamp(0)
+        pending: list[AccountingEventMixin] = []  # events read after the restored checkpoint
+        for timestamp, events_num, events_hash in self.dbcheckpoints.get_checkpoints(
+                settings_hash=self.settings_hash,
+                to_timestamp=start_ts,
+        ):
+            # read up to the checkpoint's events and one more to check it starts the year
+            covered_num = events_num - self.events_num
+            pending.extend(islice(events, max(covered_num + 1 - len(pending), 0)))
+            hasher = self.events_hasher.copy()
+            for event in pending[:max(covered_num, 0)]:
+                hasher.update(self._serialize_event(event))
+
+            state: dict[str, Any] | None = None
+            if (
+                    0 <= covered_num <= len(pending) and
+                    hasher.hexdigest() == events_hash and
+                    (covered_num == len(pending) or pending[covered_num].get_timestamp() >= timestamp)  # noqa: E501
+            ):
+                try:
+                    loaded_state = json.loads(self.dbcheckpoints.get_checkpoint_state(  # type: ignore[arg-type]  # exists since it was just queried
+                        settings_hash=self.settings_hash,
+                        timestamp=timestamp,
+                    ))
+                    pot.cost_basis.restore_state(loaded_state)
+                    state = loaded_state
+                except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+                    log.error(f'Failed to restore accounting checkpoint at {timestamp} due to {e!s}')  # noqa: E501
+
+            if state is None:
+                log.debug(f'Accounting checkpoint at {timestamp} is outdated. Deleting it')
+                self.dbcheckpoints.delete_checkpoints(from_timestamp=timestamp)
+                if restored_state is None:
+                    pot.cost_basis.reset(pot.settings)
+                else:  # the failed restore may have left a partial state
+                    pot.cost_basis.restore_state(restored_state)
+                break
+
+            if covered_num != 0:
+                last_skipped_ts = pending[covered_num - 1].get_timestamp()
+            self.events_hasher, self.events_num = hasher, events_num
+            restored_ts, restored_state = timestamp, state
+            pending = pending[covered_num:]
+
+        if restored_ts is not None:
+            log.debug(f'Restored accounting checkpoint at {restored_ts} skipping {self.events_num} events')  # noqa: E501
+            self.last_checkpoint_ts = restored_ts
+
+        return self.events_num, last_skipped_ts, chain(pending, events)
+
+    def track(
+            self,
+            events: Iterator['AccountingEventMixin'],
+            start_ts: Timestamp,
+    ) -> Iterator['AccountingEventMixin']:
+        """Go through the events to be processed keeping the running hash of the ones
+        before start_ts and the position of the first event of each year, which are
+        needed to save a checkpoint when processing reaches that event."""
+        hash_until_ts = _year_start(start_ts)  # no checkpoint is saved after that
+        for event in events:
+            if (timestamp := event.get_timestamp()) >= self.next_boundary_ts:
+                self.next_boundary_ts = _year_start(timestamp, years_offset=1)
+                self.year_start = event, self.events_num, self.events_hasher.hexdigest()
+            if timestamp < hash_until_ts:
+                self.events_hasher.update(self._serialize_event(event))
+            self.events_num += 1
+            yield event
+
+    def maybe_save(
+            self,
+            pot: 'AccountingPot',
+            next_event: 'AccountingEventMixin',
+            start_ts: Timestamp,
+    ) -> None:
+        """Save a checkpoint if the next event to process starts a new year before
+        start_ts and the state of the pot can be fully captured in a checkpoint."""
+        if self.year_start is None or self.year_start[0] is not next_event:
+            # fast path for all events except the first one of each year. If that one was
+            # consumed by processing a group of events that started in the previous year
+            # then no checkpoint can be saved for this year.
+            return
+
+        _, events_num, events_hash = self.year_start
+        self.year_start = None
+        boundary = _year_start(next_event.get_timestamp())
+        if (
+                events_num == 0 or
+                boundary > start_ts or
+                boundary <= self.last_checkpoint_ts or
+                len(pot.cost_basis.missing_prices) != 0 or  # the user is expected to add them
+                pot.events_accountant.evm_accounting_aggregators.has_state()
+        ):
+            return
+
+        self.dbcheckpoints.add_checkpoint(
+            settings_hash=self.settings_hash,
+            timestamp=boundary,
+            events_num=events_num,
+            events_hash=events_hash,
+            state=rlk_jsondumps(pot.cost_basis.serialize_state()),
+        )
+        self.last_checkpoint_ts = boundary
+        log.debug(f'Saved accounting checkpoint at {boundary} after {events_num} events')
@@ -1,7 +1,7 @@
-import heapq
+import bisect
 import logging
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Optional, overload
@@ -101,70 +101,164 @@ class AssetSpendEvent:
         )
 
 
-class AssetAcquisitionHeapElement(NamedTuple):
-    """
-    https://docs.python.org/3/library/heapq.html#basic-examples
+class AcquisitionsConsumption(NamedTuple):
+    """The result of consuming an amount from the acquisitions of an asset"""
+    # the acquisitions used along with the amount used from each, in the order they were used.
+    # All of them are used up except for possibly the last one.
+    matched: list[tuple[AssetAcquisitionEvent, FVal]]
+    missing_amount: FVal  # the amount for which no acquisitions were found
 
-    This represents a heap element for the asset acquisition heap.
-    It is a tuple to also carry a priority which is used by the heap algorithm to
-    preserve the heap invariant.
 
-    Note:`heapq` uses a min heap implementation i.e. the smallest item comes out first.
+class AcquisitionsStore(ABC):
+    """Keeps the acquisitions of an asset in the order in which they are consumed
 
-    For FIFO, a counter is used as the priority so the first acquisition comes out first.
-    For LIFO, a counter is used but negated, so the acquisition added last comes first.
-    For HIFO, the amount of the acquisition is used although negated so the
-    acquisition with the highest amount comes first.
+    Consuming an amount pops all the acquisitions it uses up from the front in constant
+    time each, without going through a generator.
     """
-    priority: FVal  # This is only used by heapq algorithm and not accessed from our code
-    acquisition_event: AssetAcquisitionEvent
 
-    def __str__(self) -> str:
-        return str(self.acquisition_event)
+    @abstractmethod
+    def add(self, acquisition: AssetAcquisitionEvent) -> None:
+        """Add a new acquisition at the place its consumption order dictates"""
 
+    @abstractmethod
+    def _first(self) -> AssetAcquisitionEvent:
+        """Return the acquisition to be consumed next. Should only be called if not empty"""
 
-class BaseCostBasisMethod(ABC):
-    """The base class in which every other cost basis method inherits from."""
-    def __init__(self) -> None:
-        self._acquisitions_heap: list[AssetAcquisitionHeapElement] = []
+    @abstractmethod
+    def _pop_first(self) -> None:
+        """Remove the acquisition to be consumed next. Should only be called if not empty"""
 
     @abstractmethod
-    def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
-        """
-        The core method. Should be implemented by subclasses.
-        This method takes a new acquisition and decides where to insert it
-        and thus determines the PnL order.
-        """
+    def __len__(self) -> int:
+        ...
 
-    def processing_iterator(self) -> Iterator[AssetAcquisitionEvent]:
-        """
-        Iteration method over acquisition events.
-        We can't return here Tuple of AssetAcquisitionEvents as we need to return
-        the first event each time but _acquisitions may be not modified between iterations.
+    @abstractmethod
+    def __iter__(self) -> Iterator[AssetAcquisitionEvent]:
+        """Iterate the acquisitions in the order in which they will be consumed"""
+
+    @abstractmethod
+    def serialize(self) -> list[AssetAcquisitionEvent]:
+        """Return the acquisitions in the order the store can be restored from"""
+
+    @abstractmethod
+    def restore(self, acquisitions: list[AssetAcquisitionEvent]) -> None:
+        """Replace the acquisitions with the ones returned by serialize"""
+
+    def take(self, amount: FVal) -> AcquisitionsConsumption:
+        """Consume the given amount from the acquisitions. Used up acquisitions are removed
+        and have their remaining amount set to zero. If the amount ends in the middle of an
+        acquisition, only its remaining amount is reduced.
         """
-        while len(self._acquisitions_heap) > 0:
-            yield self._acquisitions_heap[0].acquisition_event
+        matched = []
+        while len(self) != 0:
+            acquisition = self._first()
+            if amount < acquisition.remaining_amount:
+                acquisition.remaining_amount -= amount
+                matched.append((acquisition, amount))
+                return AcquisitionsConsumption(matched=matched, missing_amount=ZERO)
+
+            amount -= acquisition.remaining_amount
+            matched.append((acquisition, acquisition.remaining_amount))
+            acquisition.remaining_amount = ZERO
+            self._pop_first()
+
+        return AcquisitionsConsumption(matched=matched, missing_amount=amount)
+
+
+class AcquisitionsQueue(AcquisitionsStore):
+    """Acquisitions consumed in the order they were added"""
+    def __init__(self) -> None:
+        self._acquisitions: deque[AssetAcquisitionEvent] = deque()
+
+    def add(self, acquisition: AssetAcquisitionEvent) -> None:
+        self._acquisitions.append(acquisition)
+
+    def _first(self) -> AssetAcquisitionEvent:
+        return self._acquisitions[0]
+
+    def _pop_first(self) -> None:
+        self._acquisitions.popleft()
+
+    def __len__(self) -> int:
+        return len(self._acquisitions)
+
+    def __iter__(self) -> Iterator[AssetAcquisitionEvent]:
+        return iter(self._acquisitions)
+
+    def serialize(self) -> list[AssetAcquisitionEvent]:
+        return list(self._acquisitions)
+
+    def restore(self, acquisitions: list[AssetAcquisitionEvent]) -> None:
+        self._acquisitions = deque(acquisitions)
+
+
+class AcquisitionsStack(AcquisitionsStore):
+    """Acquisitions consumed in the reverse order they were added"""
+    def __init__(self) -> None:
+        self._acquisitions: list[AssetAcquisitionEvent] = []
+
+    def add(self, acquisition: AssetAcquisitionEvent) -> None:
+        self._acquisitions.append(acquisition)
+
+    def _first(self) -> AssetAcquisitionEvent:
+        return self._acquisitions[-1]
+
+    def _pop_first(self) -> None:
+        self._acquisitions.pop()
+
+    def __len__(self) -> int:
+        return len(self._acquisitions)
+
+    def __iter__(self) -> Iterator[AssetAcquisitionEvent]:
+        return reversed(self._acquisitions)
+
+    def serialize(self) -> list[AssetAcquisitionEvent]:
+        return list(self._acquisitions)
+
+    def restore(self, acquisitions: list[AssetAcquisitionEvent]) -> None:
+        self._acquisitions = list(acquisitions)
+
+
+def _rate_order_key(acquisition: AssetAcquisitionEvent) -> tuple[FVal, int]:
+    """Sort key of the acquisitions for HIFO. The ones with the highest rate sort last and
+    among those with the same rate the earliest ones sort last."""
+    return acquisition.rate, -acquisition.timestamp
+
+
+class AcquisitionsByRate(AcquisitionsStack):
+    """Acquisitions consumed starting from the one with the highest rate
+
+    The acquisitions are kept sorted so new ones are inserted in logarithmic time
+    and used up ones are removed from the end in constant time.
+    """
+    def add(self, acquisition: AssetAcquisitionEvent) -> None:
+        bisect.insort(self._acquisitions, acquisition, key=_rate_order_key)
+
+
+class BaseCostBasisMethod:
+    """The base class in which every other cost basis method inherits from.
+
+    Subclasses determine the PnL order by the store in which they keep the acquisitions.
+    """
+    def __init__(self, acquisitions: AcquisitionsStore) -> None:
+        self._acquisitions = acquisitions
+
+    def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
+        """Adds a new acquisition to the acquisitions store"""
+        self._acquisitions.add(acquisition)
 
     def get_acquisitions(self) -> tuple[AssetAcquisitionEvent, ...]:
-        """Returns read-only _acquisitions"""
-        return tuple(entry.acquisition_event for entry in self._acquisitions_heap)
+        """Returns read-only acquisitions in the order in which they will be consumed"""
+        return tuple(self._acquisitions)
 
-    def consume_result(self, used_amount: FVal, asset: Asset) -> None:
-        """
-        This function should be used to consume results of the
-        currently processed event (received from __next__)
-        The current event's remaining_amount will be decreased by used_amount
-        If event's remaining_amount will become ZERO, the event will be deleted
+    def consume(self, amount: FVal, asset: Asset) -> AcquisitionsConsumption:  # pylint: disable=unused-argument
+        """Consumes `amount` from the acquisitions in the order of the method.
+
+        Used up acquisitions are removed and have their remaining amount set to zero.
         May raise:
-        - IndexError if the method was called when acquisitions were empty
+        - AccountingError if the state of the acquisitions is inconsistent
         """
-        # this is a temporary assertion to test that new accounting tools work properly.
-        # Written on 06.06.2022 and can be removed after a couple of months if everything goes well
-        assert ZERO <= used_amount <= self._acquisitions_heap[0].acquisition_event.remaining_amount, f'Used amount must be in the interval [0, {self._acquisitions_heap[0].acquisition_event.remaining_amount}] but it was {used_amount} for {asset}'  # noqa: E501
-
-        self._acquisitions_heap[0].acquisition_event.remaining_amount -= used_amount
-        if self._acquisitions_heap[0].acquisition_event.remaining_amount == ZERO:
-            heapq.heappop(self._acquisitions_heap)
+        return self._acquisitions.take(amount)
 
     def calculate_spend_cost_basis(
             self,
@@ -187,86 +281,47 @@ class BaseCostBasisMethod(ABC):
 
         Returns the information in a CostBasisInfo object if enough acquisitions have
         been found.
+
+        May raise:
+        - AccountingError if the state of the acquisitions is inconsistent
         """  # noqa: E501
-        remaining_sold_amount = spending_amount
+        consumption = self.consume(amount=spending_amount, asset=spending_asset)
         taxfree_bought_cost = taxable_bought_cost = taxable_amount = taxfree_amount = ZERO
         matched_acquisitions = []
-
-        for acquisition_event in self.processing_iterator():
-            if settings.taxfree_after_period is None:
-                at_taxfree_period = False
-            else:
-                at_taxfree_period = acquisition_event.timestamp + settings.taxfree_after_period < timestamp  # noqa: E501
-
-            if remaining_sold_amount < acquisition_event.remaining_amount:
-                acquisition_rate = acquisition_event.rate if average_cost_basis is None else average_cost_basis  # noqa: E501
-                acquisition_cost = acquisition_rate * remaining_sold_amount
-
-                taxable = True
-                if at_taxfree_period:
-                    taxfree_amount += remaining_sold_amount
-                    taxfree_bought_cost += acquisition_cost
-                    taxable = False
-                else:
-                    taxable_amount += remaining_sold_amount
-                    taxable_bought_cost += acquisition_cost
-
-                log.debug(
-                    'Spend uses up part of historical acquisition',
-                    tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                    used_amount=remaining_sold_amount,
-                    from_amount=acquisition_event.amount,
-                    asset=spending_asset,
-                    acquisition_rate=acquisition_event.rate,
-                    profit_currency=settings.main_currency,
-                    time=timestamp_to_date(acquisition_event.timestamp),
-                )
-                matched_acquisitions.append(MatchedAcquisition(
-                    amount=remaining_sold_amount,
-                    event=acquisition_event,
-                    taxable=taxable,
-                ))
-                self.consume_result(used_amount=remaining_sold_amount, asset=spending_asset)
-                remaining_sold_amount = ZERO
-                # stop iterating since we found all acquisitions to satisfy this spend
-                break
-
-            remaining_sold_amount -= acquisition_event.remaining_amount
+        # acquisitions made before this are at the taxfree period
+        taxfree_before_ts = None if settings.taxfree_after_period is None else timestamp - settings.taxfree_after_period  # noqa: E501
+        for acquisition_event, used_amount in consumption.matched:
             acquisition_rate = acquisition_event.rate if average_cost_basis is None else average_cost_basis  # noqa: E501
-            acquisition_cost = acquisition_rate * acquisition_event.remaining_amount
-            taxable = True
-            if at_taxfree_period:
-                taxfree_amount += acquisition_event.remaining_amount
+            acquisition_cost = acquisition_rate * used_amount
+            if taxfree_before_ts is not None and acquisition_event.timestamp < taxfree_before_ts:
+                taxfree_amount += used_amount
                 taxfree_bought_cost += acquisition_cost
                 taxable = False
             else:
-                taxable_amount += acquisition_event.remaining_amount
+                taxable_amount += used_amount
                 taxable_bought_cost += acquisition_cost
+                taxable = True
 
-            log.debug(
-                'Spend uses up entire historical acquisition',
-                tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                bought_amount=acquisition_event.remaining_amount,
-                asset=spending_asset,
-                acquisition_rate=acquisition_event.rate,
-                profit_currency=settings.main_currency,
-                time=timestamp_to_date(acquisition_event.timestamp),
-            )
             matched_acquisitions.append(MatchedAcquisition(
-                amount=acquisition_event.remaining_amount,
+                amount=used_amount,
                 event=acquisition_event,
                 taxable=taxable,
             ))
-            used_acquisitions.append(acquisition_event)
-            self.consume_result(
-                used_amount=acquisition_event.remaining_amount,
-                asset=spending_asset,
-            )
-            # and since this event is going to be removed, reduce its remaining to zero
-            acquisition_event.remaining_amount = ZERO
-
+            if acquisition_event.remaining_amount == ZERO:
+                used_acquisitions.append(acquisition_event)
+
+        log.debug(
+            'Spend uses up historical acquisitions',
+            asset=spending_asset,
+            amount=spending_amount,
+            acquisitions_num=len(matched_acquisitions),
+            taxable_amount=taxable_amount,
+            taxfree_amount=taxfree_amount,
+            profit_currency=settings.main_currency,
+            time=timestamp_to_date(timestamp),
+        )
         is_complete = True
-        if remaining_sold_amount != ZERO:
+        if consumption.missing_amount != ZERO:
             # if we still have sold amount but no acquisitions to satisfy it then we only
             # found acquisitions to partially satisfy the sell
             adjusted_amount = spending_amount - taxfree_amount
@@ -275,7 +330,7 @@ class BaseCostBasisMethod(ABC):
                     asset=spending_asset,
                     time=timestamp,
                     found_amount=taxable_amount + taxfree_amount,
-                    missing_amount=remaining_sold_amount,
+                    missing_amount=consumption.missing_amount,
                 ),
             )
             taxable_amount = adjusted_amount
@@ -290,7 +345,32 @@ class BaseCostBasisMethod(ABC):
         )
 
     def __len__(self) -> int:
-        return len(self._acquisitions_heap)
+        return len(self._acquisitions)
+
+    def serialize_state(self) -> dict[str, Any]:
+        """Serialize the acquisitions, keeping their order, so that they can be restored"""
+        return {'acquisitions': [{
+            'remaining_amount': str(acquisition.remaining_amount),
+            **acquisition.serialize(),
+        } for acquisition in self._acquisitions.serialize()]}
+
+    def restore_state(self, data: dict[str, Any]) -> None:
+        """Restore the state serialized by serialize_state
+
+        May raise:
+        - KeyError, ValueError if the given data is not valid
+        """
+        acquisitions = []
+        for entry in data['acquisitions']:
+            acquisition = AssetAcquisitionEvent(
+                amount=FVal(entry['full_amount']),
+                timestamp=Timestamp(entry['timestamp']),
+                rate=Price(FVal(entry['rate'])),
+                index=entry['index'],
+            )
+            acquisition.remaining_amount = FVal(entry['remaining_amount'])
+            acquisitions.append(acquisition)
+        self._acquisitions.restore(acquisitions)
 
 
 class FIFOCostBasisMethod(BaseCostBasisMethod):
@@ -299,13 +379,7 @@ class FIFOCostBasisMethod(BaseCostBasisMethod):
     https://www.investopedia.com/terms/f/fifo.asp
     """
     def __init__(self) -> None:
-        super().__init__()
-        self._count = ZERO
-
-    def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
-        """Adds an acquisition to the `_acquisitions_heap` using a counter to achieve the FIFO order."""  # noqa: E501
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(self._count, acquisition))  # noqa: E501
-        self._count += 1
+        super().__init__(acquisitions=AcquisitionsQueue())
 
 
 class LIFOCostBasisMethod(BaseCostBasisMethod):
@@ -314,13 +388,7 @@ class LIFOCostBasisMethod(BaseCostBasisMethod):
     https://www.investopedia.com/terms/l/lifo.asp
     """
     def __init__(self) -> None:
-        super().__init__()
-        self._count = ZERO
-
-    def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
-        """Adds an acquisition to the `_acquisitions_heap` using a negated counter to achieve the LIFO order."""  # noqa: E501
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(-self._count, acquisition))  # noqa: E501
-        self._count += 1
+        super().__init__(acquisitions=AcquisitionsStack())
 
 
 class HIFOCostBasisMethod(BaseCostBasisMethod):
@@ -328,12 +396,8 @@ class HIFOCostBasisMethod(BaseCostBasisMethod):
     Accounting in HIFO (highest-in-first-out) method.
     https://www.investopedia.com/terms/h/hifo.asp
     """
-    def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
-        """
-        Adds an acquisition to the `_acquisitions_heap` using the negated rate
-        of the acquisition to achieve the HIFO order.
-        """
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(-acquisition.rate, acquisition))  # noqa: E501
+    def __init__(self) -> None:
+        super().__init__(acquisitions=AcquisitionsByRate())
 
 
 class AverageCostBasisMethod(BaseCostBasisMethod):
@@ -351,8 +415,7 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         https://github.com/rotki/rotki/issues/5561#issuecomment-1423338938
     """  # noqa: E501
     def __init__(self) -> None:
-        super().__init__()
-        self._count = ZERO
+        super().__init__(acquisitions=AcquisitionsQueue())
         # keeps track of the amount of the asset remaining after every acquisition or spend
         self.current_amount = ZERO
         # the current total cost basis of the asset
@@ -360,7 +423,7 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
 
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
         """
-        Adds an acquisition to the `_acquisitions_heap` in order of time seen.
+        Adds an acquisition to the acquisitions in order of time seen.
 
         It also calculates the average cost basis of that acquisition with respect to the
         previous average cost basis.
@@ -368,33 +431,43 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         The formula used to calculate the average cost basis of an acquisition is:
         [Previous Total ACB] + [Cost of New Shares] + [Transaction Costs]
         """
-        heapq.heappush(
-            self._acquisitions_heap,
-            AssetAcquisitionHeapElement(self._count, acquisition),
-        )
+        super().add_in_event(acquisition)
         self.current_total_acb += acquisition.amount * acquisition.rate
         self.current_amount += acquisition.amount
-        self._count += 1
 
-    def consume_result(self, used_amount: FVal, asset: Asset) -> None:
+    def serialize_state(self) -> dict[str, Any]:
+        return super().serialize_state() | {
+            'current_amount': str(self.current_amount),
+            'current_total_acb': str(self.current_total_acb),
+        }
+
+    def restore_state(self, data: dict[str, Any]) -> None:
+        super().restore_state(data)
+        self.current_amount = FVal(data['current_amount'])
+        self.current_total_acb = FVal(data['current_total_acb'])
+
+    def consume(self, amount: FVal, asset: Asset) -> AcquisitionsConsumption:
         """
-        Same as its parent function but also deducts `used_amount` from `current_amount`.
-        `current_amount` is guaranteed to be greater than zero since `consume_result` is
-        supposed to be called under `processing_iterator`.
+        Same as its parent function but also deducts the amount used from each acquisition
+        from `current_amount` and reduces `current_total_acb` proportionally, one
+        acquisition at a time so that the rounding of the running ACB stays the same.
         """
-        if self.current_amount == ZERO:
-            # this shouldn't happen but a user reported it in
-            # https://github.com/rotki/rotki/issues/7273. We couldn't find the reason for it so we
-            # decided to protect against it by raising an error shown in the frontend
-            log.error(f'Division by zero error when processing report using ACB. {self._acquisitions_heap}')  # noqa: E501
-            raise AccountingError(
-                f'Remaining amount error during ACB calculation for {asset}. Contact support and '
-                'provide the log file for more information',
-            )
+        consumption = super().consume(amount=amount, asset=asset)
+        for _, used_amount in consumption.matched:
+            if self.current_amount == ZERO:
+                # this shouldn't happen but a user reported it in
+                # https://github.com/rotki/rotki/issues/7273. We couldn't find the reason for
+                # it so we decided to protect against it by raising an error shown in the frontend
+                log.error(f'Division by zero error when processing report using ACB. {self.get_acquisitions()}')  # noqa: E501
+                raise AccountingError(
+                    f'Remaining amount error during ACB calculation for {asset}. Contact support '
+                    'and provide the log file for more information',
+                )
+
+            self.current_total_acb *= (self.current_amount - used_amount) / self.current_amount
+            self.current_amount -= used_amount
 
-        self.current_total_acb *= (self.current_amount - used_amount) / self.current_amount
-        self.current_amount -= used_amount
-        super().consume_result(used_amount=used_amount, asset=asset)
+        return consumption
 
     def calculate_spend_cost_basis(
             self,
@@ -435,7 +508,7 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
             settings=settings,
             timestamp_to_date=timestamp_to_date,
             # Important note: calculation of the average cost basis of the current event has to
-            # happen before calling `consume_result`. For correct results `current_total_acb` and
+            # happen before calling `consume`. For correct results `current_total_acb` and
             # `current_amount` have to be used before applying the effect of the event that is
             # being processed.
             average_cost_basis=self.current_total_acb / self.current_amount,
@@ -586,6 +659,34 @@ class CostBasisCalculator(CustomizableDateMixin):
         self.missing_acquisitions: list[MissingAcquisition] = []
         self.missing_prices: set[MissingPrice] = set()
 
+    def serialize_state(self) -> dict[str, Any]:
+        """Serialize the acquisitions of all assets and the missing acquisitions found so far.
+        Spends and used acquisitions are not kept since they are only informational."""
+        return {
+            'assets': {
+                asset.identifier: asset_events.acquisitions_manager.serialize_state()
+                for asset, asset_events in self._events.items()
+            },
+            'missing_acquisitions': [x.serialize() for x in self.missing_acquisitions],
+        }
+
+    def restore_state(self, data: dict[str, Any]) -> None:
+        """Reset the calculator to the state serialized by serialize_state
+
+        May raise:
+        - KeyError, ValueError if the given data is not valid
+        """
+        self.reset(self.settings)
+        for identifier, asset_state in data['assets'].items():
+            self._events[Asset(identifier)].acquisitions_manager.restore_state(asset_state)
+
+        self.missing_acquisitions = [MissingAcquisition(
+            asset=Asset(entry['asset']),
+            time=Timestamp(entry['time']),
+            found_amount=FVal(entry['found_amount']),
+            missing_amount=FVal(entry['missing_amount']),
+        ) for entry in data['missing_acquisitions']]
+
     def get_events(self, asset: Asset) -> CostBasisEvents:
         """Custom getter for events so that we have common cost basis for some assets"""
         if asset == A_WETH:
@@ -606,23 +707,10 @@ class CostBasisCalculator(CustomizableDateMixin):
         if len(asset_events.acquisitions_manager) == 0:
             return False
 
-        remaining_amount = amount
-        for acquisition_event in asset_events.acquisitions_manager.processing_iterator():
-            if remaining_amount < acquisition_event.remaining_amount:
-                asset_events.acquisitions_manager.consume_result(
-                    used_amount=remaining_amount,
-                    asset=asset,
-                )
-                remaining_amount = ZERO
-                # stop iterating since we found all acquisitions to satisfy reduction
-                break
-
-            remaining_amount -= acquisition_event.remaining_amount
-            asset_events.acquisitions_manager.consume_result(
-                used_amount=acquisition_event.remaining_amount,
-                asset=asset,
-            )
-
+        remaining_amount = asset_events.acquisitions_manager.consume(
+            amount=amount,
+            asset=asset,
+        ).missing_amount
         if remaining_amount != ZERO:
             if not asset.is_fiat():
                 self.missing_acquisitions.append(
@@ -1,7 +1,11 @@
 import contextlib
 import logging
+from collections import defaultdict
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Literal
 
+from gevent.pool import Pool
+
 from rotkehlchen.accounting.cost_basis import CostBasisCalculator
 from rotkehlchen.accounting.cost_basis.prefork import (
     handle_prefork_asset_acquisitions,
@@ -15,26 +19,38 @@ from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_KFEE
 from rotkehlchen.constants.prices import ZERO_PRICE
+from rotkehlchen.constants.timing import HOUR_IN_SECONDS
 from rotkehlchen.db.reports import DBAccountingReports
 from rotkehlchen.db.settings import DBSettings
+from rotkehlchen.errors.asset import UnknownAsset, UnprocessableTradePair, UnsupportedAsset
 from rotkehlchen.errors.misc import InputError, RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.types import EventDirection
-from rotkehlchen.history.price import PriceHistorian
+from rotkehlchen.history.price import HISTORICAL_PRICE_CACHE_SIZE, PriceHistorian
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import Location, Price, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.mixins.customizable_date import CustomizableDateMixin
 
 if TYPE_CHECKING:
+    from rotkehlchen.accounting.mixins.event import AccountingEventMixin
+    from rotkehlchen.accounting.structures.types import ActionType
     from rotkehlchen.chain.evm.accounting.aggregator import EVMAccountingAggregators
     from rotkehlchen.db.dbhandler import DBHandler
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Number of asset pairs whose historical prices are queried concurrently before processing
+PRICE_PREFETCH_CONCURRENCY = 4
+# number of events whose prices are prefetched together during processing
+PRICE_PREFETCH_WINDOW = 5000
+# Max asset and hour lookups prefetched at once. Half of the price historian cache so that
+# the lookups made while processing the events don't evict the prefetched prices
+PRICE_PREFETCH_MAX_LOOKUPS = HISTORICAL_PRICE_CACHE_SIZE // 2
+
 
 class AccountingPot(CustomizableDateMixin):
     """
@@ -113,6 +129,113 @@ class AccountingPot(CustomizableDateMixin):
             )
         return rate
 
+    def _prefetch_pair_rates(self, asset: Asset, timestamps: list[Timestamp]) -> bool:
+        """Query the profit currency price of the asset at the given sorted timestamps
+        so that they end up in the price historian cache. Errors are not propagated
+        since the processing pass will query the same price again and handle them.
+
+        The prices already stored locally are read in bulk. Since a query can store the
+        prices of a whole range (e.g. cryptocompare's histohour data), the stored prices
+        of the remaining timestamps are read again after each query.
+
+        Returns False if an oracle got rate limited or could not be reached, in which
+        case prefetching should stop so that it doesn't keep the oracle penalized."""
+        while len(timestamps := PriceHistorian.cache_stored_historical_prices(
+                from_asset=asset,
+                to_asset=self.profit_currency,
+                timestamps=timestamps,
+        )) != 0:
+            timestamp, timestamps = timestamps[0], timestamps[1:]
+            try:
+                self.get_rate_in_profit_currency(asset=asset, timestamp=timestamp)
+            except PriceQueryUnsupportedAsset:
+                continue  # no price for this timestamp. Try the next one
+            except NoPriceForGivenTimestamp as e:
+                if e.rate_limited is False and e.oracles_unavailable is False:
+                    continue
+
+                log.warning(
+                    f'Stopping price prefetching at {asset} since a price oracle is '
+                    f'unavailable. Prices will be queried during processing',
+                )
+                return False
+            except RemoteError as e:
+                log.warning(
+                    f'Stopping price prefetching at {asset} due to {e!s}. '
+                    f'Prices will be queried during processing',
+                )
+                return False
+
+        return True
+
+    def prefetch_rates_in_profit_currency(
+            self,
+            events: Sequence['AccountingEventMixin'],
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            calculate_past_cost_basis: bool,
+            ignored_ids_mapping: dict['ActionType', set[str]],
+    ) -> None:
+        """Scan the given sorted events and query in advance the profit currency
+        prices that processing them will need, so that the sequential processing pass
+        finds them in the price historian cache. Events that the processing skips
+        (before start_ts without past cost basis, with ignored assets or ignored by
+        the user) are skipped here too.
+
+        Lookups are grouped per asset pair and each pair is queried in chronological
+        order by its own greenlet. That way the first query of a pair populates the
+        oracle's local data (e.g. cryptocompare's histohour cache) for the next ones
+        while different pairs are queried concurrently. Only one lookup per asset and
+        hour is made since that is the granularity of the price historian cache.
+
+        All prefetching stops as soon as an oracle is rate limited or unavailable,
+        since querying it concurrently would only prolong its penalty.
+        """
+        pair_timestamps: defaultdict[Asset, list[Timestamp]] = defaultdict(list)
+        seen: set[tuple[Asset, int]] = set()
+        for event in events:
+            if (timestamp := event.get_timestamp()) > end_ts:
+                break  # events are sorted so nothing after this is processed
+
+            if calculate_past_cost_basis is False and timestamp < start_ts:
+                continue
+
+            try:
+                assets = event.get_assets()
+            except (UnknownAsset, UnsupportedAsset, UnprocessableTradePair):
+                continue  # processing will take care of reporting this
+
+            if (
+                    any(x.identifier in self.ignored_asset_ids for x in assets) or
+                    event.should_ignore(ignored_ids_mapping)
+            ):
+                continue
+
+            for asset in assets:
+                if asset == self.profit_currency or (asset, timestamp // HOUR_IN_SECONDS) in seen:
+                    continue
+
+                seen.add((asset, timestamp // HOUR_IN_SECONDS))
+                pair_timestamps[asset].append(timestamp)
+
+            if len(seen) >= PRICE_PREFETCH_MAX_LOOKUPS:
+                break  # more would evict the prices prefetched for the first events
+
+        if len(seen) == 0:
+            return
+
+        log.debug(f'Prefetching {len(seen)} prices for {len(pair_timestamps)} assets')
+        pool = Pool(size=PRICE_PREFETCH_CONCURRENCY)
+        try:
+            for completed in pool.imap_unordered(
+                    lambda item: self._prefetch_pair_rates(asset=item[0], timestamps=item[1]),
+                    pair_timestamps.items(),
+            ):
+                if completed is False:
+                    break
+        finally:
+            pool.kill()
+
     def reset(
             self,
             settings: DBSettings,
@@ -5,8 +5,8 @@ import os
 import sys
 import tempfile
 import traceback
-from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections import defaultdict, deque
+from collections.abc import Callable, Generator, Iterator, Sequence
 from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, get_args, overload
@@ -149,7 +149,7 @@ from rotkehlchen.db.filtering import (
 )
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.queried_addresses import QueriedAddresses
-from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.db.reports import DBAccountingCheckpoints, DBAccountingReports
 from rotkehlchen.db.search_assets import search_assets_levenshtein
 from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.db.snapshots import DBSnapshot
@@ -262,6 +262,7 @@ from rotkehlchen.types import (
     UserNote,
 )
 from rotkehlchen.utils.misc import combine_dicts, ts_ms_to_sec, ts_now
+from rotkehlchen.utils.network import get_hosts_stats
 from rotkehlchen.utils.snapshots import parse_import_snapshot_data
 from rotkehlchen.utils.version_check import get_current_version
 
@@ -342,7 +343,8 @@ def async_api_call() -> Callable:
     asynchronously or not. Defaults to synchronous mode.
 
     Endpoints that it wraps must return a dictionary with result, message and optionally a
-    status code.
+    status code. When called asynchronously the result can also be a generator producing
+    it in chunks, lists of entries which clients can read while the task is still running.
     This decorator reads the dictionary and transforms it to a Reponse object.
     """
     def wrapper(func: Callable[..., dict[str, Any]]) -> Callable[..., Response]:
@@ -376,6 +378,32 @@ def login_lock() -> Callable:
     return wrapper
 
 
+class TaskResultChunks:
+    """The result of an async task that is produced in chunks. Chunks are kept
+    already processed for the API and only until a client reads them."""
+
+    def __init__(self) -> None:
+        self.chunks: deque[Any] = deque()
+        self.changed = Event()  # set when there are new chunks or the task finished
+        self.finished = False
+
+    def put(self, chunk: Any) -> None:
+        self.chunks.append(chunk)
+        self.changed.set()
+
+    def finish(self) -> None:
+        self.finished = True
+        self.changed.set()
+
+    def pop_all(self) -> list[Any]:
+        """Return the chunks produced so far and forget them"""
+        chunks = list(self.chunks)
+        self.chunks.clear()
+        if self.finished is False:
+            self.changed.clear()
+        return chunks
+
+
 class RestAPI:
     """ The Object holding the logic that runs inside all the API calls"""
     def __init__(self, rotkehlchen: Rotkehlchen) -> None:
@@ -389,6 +417,7 @@ class RestAPI:
         self.login_lock = Semaphore()
         self.task_id = 0
         self.task_results: dict[int, Any] = {}
+        self.task_chunks: dict[int, TaskResultChunks] = {}
         self.trade_schema = TradeSchema()
 
     # - Private functions not exposed to the API
@@ -396,6 +425,8 @@ class RestAPI:
         with self.task_lock:
             task_id = self.task_id
             self.task_id += 1
+            # created when the task starts so that its chunks can be read at any time
+            self.task_chunks[task_id] = TaskResultChunks()
         return task_id
 
     def _write_task_result(self, task_id: int, result: Any) -> None:
@@ -421,6 +452,7 @@ class RestAPI:
             )
             # Setting empty message to signify that the death of the greenlet is expected.
             self._write_task_result(task_id, {'result': None, 'message': ''})
+            self._finish_task_chunks(task_id)
             return
 
         log.error(
@@ -436,11 +468,26 @@ class RestAPI:
                 'message': f'The backend query task died unexpectedly: {greenlet.exception!s}',
             }
             self._write_task_result(task_id, result)
+            self._finish_task_chunks(task_id)
+
+    def _finish_task_chunks(self, task_id: int) -> None:
+        """Let the readers of the task's chunks know that the task result is written"""
+        if (chunks := self.task_chunks.get(task_id)) is not None:
+            chunks.finish()
 
     def _do_query_async(self, command: Callable, task_id: int, **kwargs: Any) -> None:
         log.debug(f'Async task with task id {task_id} started')
         result = command(self, **kwargs)
+        if isinstance(result, dict) and isinstance(result.get('result'), Generator):
+            # process each chunk as it's produced so the whole result is never held
+            # unprocessed in memory and clients can read the chunks while the task runs
+            chunks = self.task_chunks[task_id]
+            for chunk in result['result']:
+                chunks.put(process_result_list(chunk))
+            result['result'] = chunks
+
         self._write_task_result(task_id, result)
+        self._finish_task_chunks(task_id)
 
     def _query_async(self, command: Callable, **kwargs: Any) -> Response:
         task_id = self._new_task_id()
@@ -507,11 +554,14 @@ class RestAPI:
                         # Task has completed and we just got the outcome
                         function_response = self.task_results.pop(int(task_id), None)
                         # The result of the original request
-                        result = function_response['result']
+                        task_result = function_response['result']
+                        if isinstance(task_result, TaskResultChunks):  # return unread chunks
+                            task_result = task_result.pop_all()
+                        self.task_chunks.pop(task_id, None)
                         # The message of the original request
                         message = function_response['message']
                         status_code = function_response.get('status_code')
-                        ret = {'result': result, 'message': message}
+                        ret = {'result': task_result, 'message': message}
                         returned_task_result = {
                             'status': 'completed',
                             'outcome': process_result(ret),
@@ -539,6 +589,48 @@ class RestAPI:
         }
         return api_response(result=result_dict, status_code=HTTPStatus.NOT_FOUND)
 
+    def query_task_chunks(self, task_id: int, stream: bool) -> Response:
+        """Read the chunks of the result of a task that produces it incrementally.
+        Other tasks have no chunks and only return their outcome once completed.
+
+        Without streaming the chunks produced since the last read are returned while
+        the task is pending. Once it's completed the task outcome is returned, same
+        as in query_tasks_outcome, with any chunks that were not read as its result.
+
+        When streaming, the response is newline delimited JSON with a line for each
+        chunk as soon as it's produced. The last line has the status of the task and
+        its outcome once it's completed.
+        """
+        with self.task_lock:
+            chunks = self.task_chunks.get(task_id)
+        if chunks is None:
+            return api_response(
+                result=wrap_in_fail_result(f'No task with id {task_id} found'),
+                status_code=HTTPStatus.NOT_FOUND,
+            )
+
+        if stream is False:
+            if chunks.finished:
+                return self.query_tasks_outcome(task_id=task_id)
+
+            result_dict = _wrap_in_ok_result({'status': 'pending', 'chunks': chunks.pop_all()})
+            return api_response(result=result_dict, status_code=HTTPStatus.OK)
+
+        def generate_lines() -> Iterator[str]:
+            while True:
+                chunks.changed.wait()
+                finished = chunks.finished
+                for chunk in chunks.pop_all():
+                    yield json.dumps({'chunk': chunk}) + '\n'
+
+                if finished:
+                    break
+
+            outcome = json.loads(self.query_tasks_outcome(task_id=task_id).get_data())
+            yield json.dumps(outcome['result']) + '\n'
+
+        return Response(generate_lines(), status=HTTPStatus.OK, mimetype='application/x-ndjson')
+
     def delete_async_task(self, task_id: int) -> Response:
         """Tries to find and cancel the async task with the given task id"""
         with self.task_lock:
@@ -554,6 +646,8 @@ class RestAPI:
                 return api_response(wrap_in_fail_result(f'Did not cancel task with id {task_id} because it could not be found'), status_code=HTTPStatus.NOT_FOUND)  # noqa: E501
 
         self.rotkehlchen.api_task_greenlets.pop(idx)  # also pop from greenlets
+        if (chunks := self.task_chunks.pop(task_id, None)) is not None:
+            chunks.finish()  # so that anyone streaming them stops waiting
         return api_response(OK_RESULT, status_code=HTTPStatus.OK)
 
     @async_api_call()
@@ -837,6 +931,7 @@ class RestAPI:
                     entries_table='trades',
                 ),
                 'entries_limit': FREE_TRADES_LIMIT if self.rotkehlchen.premium is None else -1,
+                'next_cursor': filter_query.next_page_cursor(trades),
             }
 
         return {'result': result, 'message': '', 'status_code': HTTPStatus.OK}
@@ -957,6 +1052,7 @@ class RestAPI:
                 'entries_total': self.rotkehlchen.data.db.get_entries_count(cursor, 'asset_movements'),  # noqa: E501
                 'entries_found': filter_total_found,
                 'entries_limit': limit,
+                'next_cursor': filter_query.next_page_cursor(movements),
             }
 
         return {'result': result, 'message': msg, 'status_code': status_code}
@@ -1241,6 +1337,9 @@ class RestAPI:
         gevent.killall(self.rotkehlchen.api_task_greenlets)
         with self.task_lock:
             self.task_results = {}
+            for chunks in self.task_chunks.values():
+                chunks.finish()  # so that anyone streaming them stops waiting
+            self.task_chunks = {}
         self.rotkehlchen.logout()
         result_dict['result'] = True
         return api_response(result_dict, status_code=HTTPStatus.OK)
@@ -2144,6 +2243,10 @@ class RestAPI:
     def ping() -> Response:
         return api_response(_wrap_in_ok_result(True), status_code=HTTPStatus.OK)
 
+    @staticmethod
+    def get_network_stats() -> Response:
+        return api_response(_wrap_in_ok_result(get_hosts_stats()), status_code=HTTPStatus.OK)
+
     @async_api_call()
     def _import_data(
             self,
@@ -2354,6 +2457,11 @@ class RestAPI:
         result_dict = _wrap_in_ok_result(process_result_list(list(nodes)))
         return api_response(result_dict, status_code=HTTPStatus.OK)
 
+    def get_rpc_nodes_stats(self, blockchain: SupportedBlockchain) -> Response:
+        manager = self.rotkehlchen.chains_aggregator.get_chain_manager(blockchain)  # type: ignore[arg-type]  # schema only allows evm chains
+        result_dict = _wrap_in_ok_result(manager.node_inquirer.get_nodes_stats())
+        return api_response(result_dict, status_code=HTTPStatus.OK)
+
     def add_rpc_node(self, node: WeightedNode) -> Response:
         try:
             self.rotkehlchen.data.db.add_rpc_node(node)
@@ -2955,6 +3063,7 @@ class RestAPI:
             if amount_of_tx_to_decode > 0:
                 chain_manager.transactions_decoder.get_and_decode_undecoded_transactions(
                     send_ws_notifications=True,
+                    batch_writes=True,
                 )
                 result[evm_chain.to_name()] = amount_of_tx_to_decode
 
@@ -3249,11 +3358,14 @@ class RestAPI:
             return wrap_in_fail_result(str(e), status_code=HTTPStatus.BAD_GATEWAY)
         except UnsupportedAsset as e:
             return wrap_in_fail_result(str(e), status_code=HTTPStatus.CONFLICT)
+        finally:
+            if purge_old:  # the old prices were deleted and may have been queried again
+                self._invalidate_historical_prices()
 
         return _wrap_in_ok_result(True)
 
-    @staticmethod
     def delete_oracle_cache(
+            self,
             oracle: HistoricalPriceOracle,
             from_asset: Asset,
             to_asset: Asset,
@@ -3263,6 +3375,7 @@ class RestAPI:
             to_asset=to_asset,
             source=oracle,
         )
+        self._invalidate_historical_prices()
         return api_response(_wrap_in_ok_result(True), status_code=HTTPStatus.OK)
 
     @staticmethod
@@ -3356,6 +3469,14 @@ class RestAPI:
             status_code=HTTPStatus.OK,
         )
 
+    def _invalidate_historical_prices(self) -> None:
+        """Clear everything computed from historical prices after stored prices change.
+        That is the price historian cache and the accounting checkpoints, whose cost basis
+        was computed with the old prices."""
+        PriceHistorian().clear_price_cache()
+        if self.rotkehlchen.user_is_logged_in:
+            DBAccountingCheckpoints(self.rotkehlchen.data.db).delete_checkpoints()
+
     def add_manual_price(
             self,
             from_asset: Asset,
@@ -3376,6 +3497,7 @@ class RestAPI:
         )
         added = GlobalDBHandler.add_single_historical_price(historical_price)
         if added:
+            self._invalidate_historical_prices()
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to store manual price'},
@@ -3398,6 +3520,7 @@ class RestAPI:
         )
         edited = GlobalDBHandler.edit_manual_price(historical_price)
         if edited:
+            self._invalidate_historical_prices()
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to edit manual price'},
@@ -3422,6 +3545,7 @@ class RestAPI:
     ) -> Response:
         deleted = GlobalDBHandler.delete_manual_price(from_asset, to_asset, timestamp)
         if deleted:
+            self._invalidate_historical_prices()
             return api_response(OK_RESULT, status_code=HTTPStatus.OK)
         return api_response(
             result={'result': False, 'message': 'Failed to delete manual price'},
@@ -3705,11 +3829,84 @@ class RestAPI:
 
         return OK_RESULT
 
+    def _make_dummy_accounting_pot(self) -> AccountingPot:
+        """Accounting pot used to check which events are missing accounting rules"""
+        return AccountingPot(
+            database=self.rotkehlchen.data.db,
+            evm_accounting_aggregators=EVMAccountingAggregators([self.rotkehlchen.chains_aggregator.get_evm_manager(x).accounting_aggregator for x in EVM_CHAIN_IDS_WITH_TRANSACTIONS]),  # noqa: E501
+            msg_aggregator=self.rotkehlchen.msg_aggregator,
+            is_dummy_pot=True,
+        )
+
+    def _serialize_history_events(
+            self,
+            events: list['HistoryBaseEntry'],
+            accountant_pot: AccountingPot,
+            customized_event_ids: list[int],
+            ignored_ids_mapping: dict[ActionType, set[str]],
+            hidden_event_ids: list[int],
+    ) -> list[dict[str, Any]]:
+        event_accounting_rule_statuses = query_missing_accounting_rules(
+            db=self.rotkehlchen.data.db,
+            accounting_pot=accountant_pot,
+            evm_accounting_aggregator=accountant_pot.events_accountant.evm_accounting_aggregators,
+            events=events,
+            accountant=self.rotkehlchen.accountant,
+        )
+        return [
+            x.serialize_for_api(
+                customized_event_ids=customized_event_ids,
+                ignored_ids_mapping=ignored_ids_mapping,
+                hidden_event_ids=hidden_event_ids,
+                event_accounting_rule_status=event_accounting_rule_status,
+            ) for x, event_accounting_rule_status in zip(events, event_accounting_rule_statuses, strict=True)  # noqa: E501
+        ]
+
+    def _query_history_events_in_chunks(
+            self,
+            filter_query: HistoryBaseEntryFilterQuery,
+    ) -> dict[str, Any]:
+        """Produces all the events of the filter query serialized for the api in chunks
+        of a page of events each, so that they are never all held in memory"""
+        dbevents = DBHistoryEvents(self.rotkehlchen.data.db)
+        with self.rotkehlchen.data.db.conn.read_ctx() as cursor:
+            customized_event_ids = dbevents.get_customized_event_identifiers(
+                cursor=cursor,
+                location=filter_query.location,
+            )
+            hidden_event_ids = dbevents.get_hidden_event_ids(cursor)
+            ignored_ids_mapping = self.rotkehlchen.data.db.get_ignored_action_ids(
+                cursor=cursor,
+                action_type=ActionType.HISTORY_EVENT,
+            )
+
+        accountant_pot = self._make_dummy_accounting_pot()
+        chunks = (
+            self._serialize_history_events(
+                events=events,
+                accountant_pot=accountant_pot,
+                customized_event_ids=customized_event_ids,
+                ignored_ids_mapping=ignored_ids_mapping,
+                hidden_event_ids=hidden_event_ids,
+            ) for events in dbevents.iterate_history_events_in_pages(
+                filter_query=filter_query,
+                has_premium=self.rotkehlchen.premium is not None,
+            )
+        )
+        return {'result': chunks, 'message': '', 'status_code': HTTPStatus.OK}
+
     def get_history_events(
             self,
             filter_query: HistoryBaseEntryFilterQuery,
             group_by_event_ids: bool,
+            chunked: bool,
     ) -> Response:
+        if chunked is True:  # all the events are produced in chunks by an async task
+            return self._query_async(
+                command=RestAPI._query_history_events_in_chunks,
+                filter_query=filter_query,
+            )
+
         dbevents = DBHistoryEvents(self.rotkehlchen.data.db)
         has_premium = False
         entries_limit = FREE_HISTORY_EVENTS_LIMIT
@@ -3740,12 +3937,7 @@ class RestAPI:
                 action_type=ActionType.HISTORY_EVENT,
             )
 
-        accountant_pot = AccountingPot(
-            database=self.rotkehlchen.data.db,
-            evm_accounting_aggregators=EVMAccountingAggregators([self.rotkehlchen.chains_aggregator.get_evm_manager(x).accounting_aggregator for x in EVM_CHAIN_IDS_WITH_TRANSACTIONS]),  # noqa: E501
-            msg_aggregator=self.rotkehlchen.msg_aggregator,
-            is_dummy_pot=True,
-        )
+        accountant_pot = self._make_dummy_accounting_pot()
         if group_by_event_ids is True:
             event_accounting_rule_statuses = query_missing_accounting_rules(
                 db=self.rotkehlchen.data.db,
@@ -3764,26 +3956,21 @@ class RestAPI:
                 ) for (grouped_events_num, x), event_accounting_rule_status in zip(events_result, event_accounting_rule_statuses, strict=True)  # noqa: E501
             ]
         else:
-            event_accounting_rule_statuses = query_missing_accounting_rules(
-                db=self.rotkehlchen.data.db,
-                accounting_pot=accountant_pot,
-                evm_accounting_aggregator=accountant_pot.events_accountant.evm_accounting_aggregators,
-                events=events_result,  # type: ignore
-                accountant=self.rotkehlchen.accountant,
+            entries = self._serialize_history_events(
+                events=events_result,  # type: ignore[arg-type]  # mypy does not follow the boolean
+                accountant_pot=accountant_pot,
+                customized_event_ids=customized_event_ids,
+                ignored_ids_mapping=ignored_ids_mapping,
+                hidden_event_ids=hidden_event_ids,
             )
-            entries = [
-                x.serialize_for_api(  # type: ignore
-                    customized_event_ids=customized_event_ids,
-                    ignored_ids_mapping=ignored_ids_mapping,
-                    hidden_event_ids=hidden_event_ids,
-                    event_accounting_rule_status=event_accounting_rule_status,
-                ) for x, event_accounting_rule_status in zip(events_result, event_accounting_rule_statuses, strict=True)  # noqa: E501
-            ]
         result = {
             'entries': entries,
             'entries_found': entries_with_limit,
             'entries_limit': entries_limit,
             'entries_total': entries_total,
+            'next_cursor': filter_query.next_page_cursor(
+                [x for _, x in events_result] if group_by_event_ids else events_result,  # type: ignore[misc]  # mypy does not follow the boolean
+            ),
         }
         if has_premium is False:
             result['entries_found_total'] = entries_found
@@ -4682,61 +4869,102 @@ class RestAPI:
             status_code=HTTPStatus.OK,
         )
 
+    def _serialize_history_event_for_csv(
+            self,
+            event: 'HistoryBaseEntry',
+            currency: AssetWithOracles,
+    ) -> dict[str, Any]:
+        """Serializes the event for the csv export with its value in the given currency.
+
+        May raise:
+        - NoPriceForGivenTimestamp if the price query got rate limited for all the oracles
+        """
+        if currency != A_USD or (currency == A_USD and event.balance.usd_value == ZERO):
+            try:  # ask oracles for the price in the given timestamp and currency
+                price = PriceHistorian.query_historical_price(
+                    from_asset=event.asset,
+                    to_asset=currency,
+                    timestamp=ts_ms_to_sec(event.timestamp),
+                )
+            except (PriceQueryUnsupportedAsset, RemoteError):
+                fiat_value = ZERO
+            except NoPriceForGivenTimestamp as e:
+                if e.rate_limited is True:
+                    raise
+
+                fiat_value = ZERO
+            else:
+                fiat_value = event.balance.amount * price
+        else:  # if the asset is USD we don't need to ask for the price, is already queried
+            fiat_value = event.balance.usd_value
+
+        return event.serialize_for_csv(fiat_value)
+
     @async_api_call()
     def export_history_events(
             self,
             filter_query: HistoryBaseEntryFilterQuery,
             directory_path: Path | None,
+            chunked: bool = False,
     ) -> dict[str, Any] | Response:
-        """Export or Download history events data to a CSV file."""
-        dbevents = DBHistoryEvents(self.rotkehlchen.data.db)
-        with self.rotkehlchen.data.db.conn.read_ctx() as cursor:
-            history_events, _, _ = dbevents.get_history_events_and_limit_info(
-                cursor=cursor,
-                filter_query=filter_query,
-                has_premium=True,
-                entries_limit=None,
-            )
-
-        if len(history_events) == 0:
-            return wrap_in_fail_result(
-                message='No history processed in order to perform an export',
-                status_code=HTTPStatus.CONFLICT,
-            )
+        """Export or Download history events data to a CSV file.
 
+        If chunked, the rows of the csv are produced in chunks instead of as a file
+        """
         with self.rotkehlchen.data.db.conn.read_ctx() as cursor:
             settings = self.rotkehlchen.get_settings(cursor)
             currency = settings.main_currency.resolve_to_asset_with_oracles()
 
+        no_history_result = wrap_in_fail_result(
+            message='No history processed in order to perform an export',
+            status_code=HTTPStatus.CONFLICT,
+        )
+        rate_limited_result = wrap_in_fail_result(
+            message='Price query got rate limited for all the oracles. Try again later',
+            status_code=HTTPStatus.BAD_GATEWAY,
+        )
+        pages = DBHistoryEvents(self.rotkehlchen.data.db).iterate_history_events_in_pages(
+            filter_query=filter_query,
+            has_premium=True,
+        )
+        if chunked is True:
+            result: dict[str, Any] = {'message': '', 'status_code': HTTPStatus.OK}
+
+            def produce_chunks() -> Iterator[list[dict[str, Any]]]:
+                """Sets the message and status code of the result if it fails, which are
+                read once all the chunks are produced"""
+                failed_result: dict[str, Any] | None = no_history_result
+                for events in pages:
+                    try:
+                        rows = [self._serialize_history_event_for_csv(x, currency) for x in events]
+                    except NoPriceForGivenTimestamp:
+                        failed_result = rate_limited_result
+                        break
+
+                    failed_result = None
+                    yield rows
+
+                if failed_result is not None:
+                    result['message'] = failed_result['message']
+                    result['status_code'] = failed_result['status_code']
+
+            result['result'] = produce_chunks()
+            return result
+
         serialized_history_events = []
         headers: dict[str, None] = {}
-        for event in history_events:
-            if currency != A_USD or (currency == A_USD and event.balance.usd_value == ZERO):
-                try:  # ask oracles for the price in the given timestamp and currency
-                    price = PriceHistorian.query_historical_price(
-                        from_asset=event.asset,
-                        to_asset=currency,
-                        timestamp=ts_ms_to_sec(event.timestamp),
-                    )
-                except (PriceQueryUnsupportedAsset, RemoteError):
-                    fiat_value = ZERO
-                except NoPriceForGivenTimestamp as e:
-                    # In the case of NoPriceForGivenTimestamp when we got rate limited
-                    if e.rate_limited is True:
-                        return wrap_in_fail_result(
-                            message='Price query got rate limited for all the oracles. Try again later',  # noqa: E501
-                            status_code=HTTPStatus.BAD_GATEWAY,
-                        )
-                    fiat_value = ZERO
-                else:
-                    fiat_value = event.balance.amount * price
-            else:  # if the asset is USD we don't need to ask for the price, is already queried
-                fiat_value = event.balance.usd_value
-
-            serialized_event = event.serialize_for_csv(fiat_value)
-            serialized_history_events.append(serialized_event)
-            # maintain insertion order without storing extra info
-            headers.update(dict.fromkeys(serialized_event))
+        try:
+            for events in pages:
+                for event in events:
+                    serialized_event = self._serialize_history_event_for_csv(event, currency)
+                    serialized_history_events.append(serialized_event)
+                    # maintain insertion order without storing extra info
+                    headers.update(dict.fromkeys(serialized_event))
+        except NoPriceForGivenTimestamp:
+            return rate_limited_result
+
+        if len(serialized_history_events) == 0:
+            return no_history_result
 
         if directory_path is None:  # on download
             with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:  # needed on windows, see https://tinyurl.com/tmp-win-err  # noqa: E501
@@ -44,6 +44,7 @@ from rotkehlchen.api.v1.resources import (
     AssetsTypesResource,
     AssetUpdatesResource,
     AssociatedLocations,
+    AsyncTaskChunksResource,
     AsyncTasksResource,
     BinanceAvailableMarkets,
     BinanceSavingsResource,
@@ -121,6 +122,7 @@ from rotkehlchen.api.v1.resources import (
     ModuleStatsResource,
     NamedEthereumModuleDataResource,
     NamedOracleCacheResource,
+    NetworkStatsResource,
     NFTSBalanceResource,
     NFTSPricesResource,
     NFTSResource,
@@ -133,6 +135,7 @@ from rotkehlchen.api.v1.resources import (
     RefreshGeneralCacheResource,
     ReverseEnsResource,
     RpcNodesResource,
+    RpcNodesStatsResource,
     SettingsResource,
     SpamEvmTokenResource,
     StakingResource,
@@ -176,6 +179,7 @@ URLS_V1: URLS = [
     ('/settings/configuration', ConfigurationsResource),
     ('/tasks', AsyncTasksResource),
     ('/tasks/<int:task_id>', AsyncTasksResource, 'specific_async_tasks_resource'),
+    ('/tasks/<int:task_id>/chunks', AsyncTaskChunksResource),
     ('/exchange_rates', ExchangeRatesResource),
     ('/external_services', ExternalServicesResource),
     ('/oracles', OraclesResource),
@@ -278,6 +282,7 @@ URLS_V1: URLS = [
     ('/blockchains/evm/accounts', EvmAccountsResource),
     ('/blockchains/<string:blockchain>/accounts', BlockchainsAccountsResource),
     ('/blockchains/<string:blockchain>/nodes', RpcNodesResource),
+    ('/blockchains/<string:blockchain>/nodes/stats', RpcNodesStatsResource),
     ('/blockchains/<string:blockchain>/tokens/detect', DetectTokensResource),
     ('/blockchains/<string:blockchain>/xpub', BTCXpubResource),
     ('/blockchains/evm/transactions/add-hash', EvmTransactionsHashResource),
@@ -301,6 +306,7 @@ URLS_V1: URLS = [
     ('/actions/ignored', IgnoredActionsResource),
     ('/info', InfoResource),
     ('/ping', PingResource),
+    ('/network/stats', NetworkStatsResource),
     ('/import', DataImportResource),
     ('/nfts', NFTSResource),
     ('/nfts/balances', NFTSBalanceResource),
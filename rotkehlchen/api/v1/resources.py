@@ -47,6 +47,7 @@ from rotkehlchen.api.v1.schemas import (
     AsyncFilePathSchema,
     AsyncIgnoreCacheQueryArgumentSchema,
     AsyncQueryArgumentSchema,
+    AsyncTaskChunksSchema,
     AsyncTaskSchema,
     BaseXpubSchema,
     BinanceMarketsSchema,
@@ -140,6 +141,7 @@ from rotkehlchen.api.v1.schemas import (
     RpcNodeEditSchema,
     RpcNodeListDeleteSchema,
     RpcNodeSchema,
+    RpcNodesStatsSchema,
     SingleAssetIdentifierSchema,
     SingleAssetWithOraclesIdentifierSchema,
     SingleFileSchema,
@@ -512,6 +514,15 @@ class AsyncTasksResource(BaseMethodView):
         return self.rest_api.delete_async_task(task_id=task_id)
 
 
+class AsyncTaskChunksResource(BaseMethodView):
+
+    get_schema = AsyncTaskChunksSchema()
+
+    @use_kwargs(get_schema, location='json_and_query_and_view_args')
+    def get(self, task_id: int, stream: bool) -> Response:
+        return self.rest_api.query_task_chunks(task_id=task_id, stream=stream)
+
+
 class ExchangeRatesResource(BaseMethodView):
 
     get_schema = ExchangeRatesSchema()
@@ -739,6 +750,16 @@ class EthereumAirdropsResource(BaseMethodView):
         return self.rest_api.get_ethereum_airdrops(async_query=async_query)
 
 
+class RpcNodesStatsResource(BaseMethodView):
+
+    get_schema = RpcNodesStatsSchema()
+
+    @require_loggedin_user()
+    @use_kwargs(get_schema, location='view_args')
+    def get(self, blockchain: SupportedBlockchain) -> Response:
+        return self.rest_api.get_rpc_nodes_stats(blockchain=blockchain)
+
+
 class RpcNodesResource(BaseMethodView):
 
     get_schema = RpcNodeSchema()
@@ -1318,8 +1339,8 @@ class HistoryEventResource(BaseMethodView):
 
     @require_loggedin_user()
     @use_kwargs(post_schema, location='json')
-    def post(self, filter_query: 'HistoryBaseEntryFilterQuery', group_by_event_ids: bool) -> Response:  # noqa: E501
-        return self.rest_api.get_history_events(filter_query=filter_query, group_by_event_ids=group_by_event_ids)  # noqa: E501
+    def post(self, filter_query: 'HistoryBaseEntryFilterQuery', group_by_event_ids: bool, chunked: bool) -> Response:  # noqa: E501
+        return self.rest_api.get_history_events(filter_query=filter_query, group_by_event_ids=group_by_event_ids, chunked=chunked)  # noqa: E501
 
     @require_loggedin_user()
     @use_kwargs(put_schema, location='json')
@@ -1904,6 +1925,12 @@ class PingResource(BaseMethodView):
         return self.rest_api.ping()
 
 
+class NetworkStatsResource(BaseMethodView):
+
+    def get(self) -> Response:
+        return self.rest_api.get_network_stats()
+
+
 class DataImportResource(BaseMethodView):
 
     upload_schema = DataImportSchema()
@@ -3103,7 +3130,7 @@ class DefiMetadataResource(BaseMethodView):
 
 class ExportHistoryEventResource(BaseMethodView):
 
-    post_schema = ExportHistoryEventSchema()
+    post_schema = ExportHistoryEventSchema(exclude=('chunked',))
     put_schema = ExportHistoryEventSchema(exclude=('directory_path',))
 
     @require_loggedin_user()
@@ -3113,8 +3140,8 @@ class ExportHistoryEventResource(BaseMethodView):
 
     @require_loggedin_user()
     @use_kwargs(put_schema, location='json_and_query')
-    def put(self, async_query: bool, filter_query: 'HistoryBaseEntryFilterQuery') -> Response | dict[str, Any]:  # noqa: E501
-        return self.rest_api.export_history_events(filter_query=filter_query, directory_path=None, async_query=async_query)  # noqa: E501
+    def put(self, async_query: bool, filter_query: 'HistoryBaseEntryFilterQuery', chunked: bool) -> Response | dict[str, Any]:  # noqa: E501
+        return self.rest_api.export_history_events(filter_query=filter_query, directory_path=None, async_query=async_query, chunked=chunked)  # noqa: E501
 
 
 class AccountingRulesResource(BaseMethodView):
@@ -61,11 +61,13 @@ from rotkehlchen.db.filtering import (
     AssetMovementsFilterQuery,
     AssetsFilterQuery,
     CustomAssetsFilterQuery,
+    DBFilterQuery,
     Eth2DailyStatsFilterQuery,
     EthStakingEventFilterQuery,
     EvmEventFilterQuery,
     EvmTransactionsFilterQuery,
     HistoryEventFilterQuery,
+    InvalidFilter,
     LevenshteinFilterQuery,
     LocationAssetMappingsFilterQuery,
     NFTFilterQuery,
@@ -227,6 +229,11 @@ class AsyncTaskSchema(Schema):
             )
 
 
+class AsyncTaskChunksSchema(Schema):
+    task_id = fields.Integer(strict=True, required=True)
+    stream = fields.Boolean(load_default=False)
+
+
 class OnlyCacheQuerySchema(Schema):
     only_cache = fields.Boolean(load_default=False)
 
@@ -236,6 +243,42 @@ class DBPaginationSchema(Schema):
     offset = fields.Integer(load_default=None)
 
 
+class DBKeysetPaginationSchema(DBPaginationSchema):
+    """Pagination that can also continue after the cursor returned with the previous page"""
+    cursor = fields.String(load_default=None)
+
+    @validates_schema
+    def validate_keyset_pagination_schema(
+            self,
+            data: dict[str, Any],
+            **_kwargs: Any,
+    ) -> None:
+        if data['cursor'] is not None and (data['limit'] is None or data['offset'] not in (None, 0)):  # noqa: E501
+            raise ValidationError(
+                message='cursor can only be given along with a limit and without an offset',
+                field_name='cursor',
+            )
+
+    def paginate_by_keyset(self, filter_query: DBFilterQuery, data: dict[str, Any]) -> None:
+        """Paginates the filter query by keyset if a cursor is given or if the first page
+        is requested with an order that supports it, so that the cursor of the next page
+        can be returned.
+
+        May raise:
+        - ValidationError if the cursor is invalid or the order does not support it
+        """
+        if data['cursor'] is None and (
+                data['limit'] is None or data['offset'] != 0 or
+                filter_query.keyset_rules() is None
+        ):
+            return
+
+        try:
+            filter_query.set_keyset_pagination(limit=data['limit'], cursor=data['cursor'])
+        except (InvalidFilter, DeserializationError) as e:
+            raise ValidationError(message=str(e), field_name='cursor') from e
+
+
 class DBOrderBySchema(Schema):
     order_by_attributes = DelimitedOrNormalList(fields.String(), load_default=None)
     ascending = DelimitedOrNormalList(fields.Boolean(), load_default=None)  # most recent first by default  # noqa: E501
@@ -436,7 +479,7 @@ class TradesQuerySchema(
         AsyncQueryArgumentSchema,
         TimestampRangeSchema,
         OnlyCacheQuerySchema,
-        DBPaginationSchema,
+        DBKeysetPaginationSchema,
         DBOrderBySchema,
 ):
     base_asset = AssetField(expected_type=Asset, load_default=None)
@@ -520,6 +563,7 @@ class TradesQuerySchema(
             trades_idx_to_ignore=trades_idx_to_ignore,
             exclude_ignored_assets=data['exclude_ignored_assets'],
         )
+        self.paginate_by_keyset(filter_query=filter_query, data=data)
 
         return {
             'async_query': data['async_query'],
@@ -661,12 +705,13 @@ class TypesAndCounterpatiesFiltersSchema(Schema):
 class HistoryEventSchema(
     TypesAndCounterpatiesFiltersSchema,
     TimestampRangeSchema,
-    DBPaginationSchema,
+    DBKeysetPaginationSchema,
     DBOrderBySchema,
 ):
     """Schema for quering history events"""
     exclude_ignored_assets = fields.Boolean(load_default=True)
     group_by_event_ids = fields.Boolean(load_default=False)
+    chunked = fields.Boolean(load_default=False)  # produce all events in chunks in an async task
     event_identifiers = DelimitedOrNormalList(fields.String(), load_default=None)
     location = SerializableEnumField(Location, load_default=None)
     location_labels = DelimitedOrNormalList(fields.String(), load_default=None)
@@ -705,6 +750,15 @@ class HistoryEventSchema(
                 field_name='order_by_attributes',
             )
 
+        if data.get('chunked') is True and (
+            data['group_by_event_ids'] is True or
+            any(data[x] is not None for x in ('limit', 'offset', 'cursor'))
+        ):
+            raise ValidationError(
+                message='chunked events can not be grouped or paginated',
+                field_name='chunked',
+            )
+
     @post_load
     def make_history_event_filter(
             self,
@@ -782,10 +836,25 @@ class HistoryEventSchema(
         else:
             filter_query = HistoryEventFilterQuery.make(**common_arguments)
 
+        self.paginate_by_keyset(filter_query=filter_query, data=data)
         return self.generate_fields_post_validation(data) | {
             'filter_query': filter_query,
         }
 
+    def paginate_by_keyset(self, filter_query: DBFilterQuery, data: dict[str, Any]) -> None:
+        """Grouped events are paginated by offset since the cursor condition could only be
+        applied after grouping all the events, which would not make deep pages faster"""
+        if data['chunked'] is True:
+            return  # all the events are read in pages when producing the chunks
+
+        if data['group_by_event_ids'] is False:
+            super().paginate_by_keyset(filter_query=filter_query, data=data)
+        elif data['cursor'] is not None:
+            raise ValidationError(
+                message='cursor can not be used when grouping by event identifiers',
+                field_name='cursor',
+            )
+
     def make_extra_filtering_arguments(self, data: dict[str, Any]) -> dict[str, Any]:
         """Generates the extra fields to be included in the filter_query dictionary"""
         return {
@@ -795,7 +864,7 @@ class HistoryEventSchema(
 
     def generate_fields_post_validation(self, data: dict[str, Any]) -> dict[str, Any]:
         """Generates extra fields that will be returned after validation"""
-        return {'group_by_event_ids': data['group_by_event_ids']}
+        return {'group_by_event_ids': data['group_by_event_ids'], 'chunked': data['chunked']}
 
 
 class CreateHistoryEventSchema(Schema):
@@ -949,7 +1018,7 @@ class AssetMovementsQuerySchema(
         AsyncQueryArgumentSchema,
         TimestampRangeSchema,
         OnlyCacheQuerySchema,
-        DBPaginationSchema,
+        DBKeysetPaginationSchema,
         DBOrderBySchema,
 ):
     asset = AssetField(expected_type=Asset, load_default=None)
@@ -1018,6 +1087,7 @@ class AssetMovementsQuerySchema(
             location=data['location'],
             exclude_ignored_assets=data['exclude_ignored_assets'],
         )
+        self.paginate_by_keyset(filter_query=filter_query, data=data)
         return {
             'async_query': data['async_query'],
             'only_cache': data['only_cache'],
@@ -3031,6 +3101,13 @@ class RpcNodeSchema(Schema):
     blockchain = BlockchainField(required=True, exclude_types=(SupportedBlockchain.ETHEREUM_BEACONCHAIN,))  # noqa: E501
 
 
+class RpcNodesStatsSchema(Schema):
+    blockchain = BlockchainField(
+        required=True,
+        exclude_types=tuple(chain for chain in SupportedBlockchain if not chain.is_evm()),
+    )
+
+
 class RpcAddNodeSchema(Schema):
     blockchain = BlockchainField(required=True, exclude_types=(SupportedBlockchain.ETHEREUM_BEACONCHAIN,))  # noqa: E501
     name = fields.String(
@@ -3383,12 +3460,29 @@ class ExportHistoryEventSchema(HistoryEventSchema, AsyncQueryArgumentSchema):
     def make_extra_filtering_arguments(self, data: dict[str, Any]) -> dict[str, Any]:
         return {}
 
+    def paginate_by_keyset(self, filter_query: DBFilterQuery, data: dict[str, Any]) -> None:
+        """Exports contain all the events so they are not paginated"""
+
+    @validates_schema
+    def validate_export_history_event_schema(
+            self,
+            data: dict[str, Any],
+            **_kwargs: Any,
+    ) -> None:
+        if data.get('chunked') is True and data['async_query'] is False:
+            raise ValidationError(
+                message='chunked exports can only be produced by an async query',
+                field_name='chunked',
+            )
+
     def generate_fields_post_validation(self, data: dict[str, Any]) -> dict[str, Any]:
         extra_fields = {}
         if (directory_path := data.get('directory_path')) is not None:
             extra_fields['directory_path'] = directory_path
         if (async_query := data.get('async_query')) is not None:
             extra_fields['async_query'] = async_query
+        if (chunked := data.get('chunked')) is not None:
+            extra_fields['chunked'] = chunked
         return extra_fields
 
 
@@ -1,23 +1,37 @@
 import json
 import logging
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any
+from itertools import count
+from typing import Any, Final, NamedTuple
 
+import gevent
+from gevent.event import Event
 from gevent.lock import Semaphore
 from geventwebsocket import WebSocketApplication
 from geventwebsocket.exceptions import WebSocketError
 from geventwebsocket.websocket import WebSocket
 
+from rotkehlchen.api.websockets.typedefs import (
+    HistoryEventsStep,
+    TransactionStatusStep,
+    WSMessageType,
+)
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.serialize import process_result
 
-if TYPE_CHECKING:
-    from rotkehlchen.api.websockets.typedefs import WSMessageType
-
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+WS_SEND_INTERVAL: Final = 0.1  # seconds to wait after sending all queued messages
+MAX_QUEUED_WS_MESSAGES: Final = 1000  # per subscriber
+PROGRESS_TRANSACTION_STEPS: Final = {
+    str(TransactionStatusStep.QUERYING_TRANSACTIONS),
+    str(TransactionStatusStep.QUERYING_INTERNAL_TRANSACTIONS),
+    str(TransactionStatusStep.QUERYING_EVM_TOKENS_TRANSACTIONS),
+}
+
 
 def _ws_send_impl(
         websocket: WebSocket,
@@ -44,19 +58,115 @@ def _ws_send_impl(
         success_callback(**success_callback_args)
 
 
+class QueuedWSMessage(NamedTuple):
+    message: str
+    success_callback: Callable | None
+    success_callback_args: dict[str, Any] | None
+    failure_callback: Callable | None
+    failure_callback_args: dict[str, Any] | None
+
+    def fail(self) -> None:
+        if self.failure_callback is not None:
+            self.failure_callback(**({} if self.failure_callback_args is None else self.failure_callback_args))  # noqa: E501
+
+
+def _coalescing_key(
+        message_type: 'WSMessageType',
+        data: dict[str, Any] | list[Any],
+) -> tuple | None:
+    """Returns the key of a progress message that is superseded by any later message with
+    the same key or None if the message should always be delivered. Start and end of
+    progress are always delivered so that the frontend sees the whole operation.
+    """
+    if not isinstance(data, dict):
+        return None
+
+    if message_type in (WSMessageType.EVM_UNDECODED_TRANSACTIONS, WSMessageType.PROTOCOL_CACHE_UPDATES):  # noqa: E501
+        if data.get('processed') in (0, data.get('total')):
+            return None
+        return message_type, data.get('chain'), data.get('protocol')
+
+    if message_type == WSMessageType.EVM_TRANSACTION_STATUS and data.get('status') in PROGRESS_TRANSACTION_STEPS:  # noqa: E501
+        return message_type, data.get('address'), data.get('evm_chain'), data['status']
+
+    if message_type == WSMessageType.HISTORY_EVENTS_STATUS and data.get('status') == str(HistoryEventsStep.QUERYING_EVENTS_STATUS_UPDATE):  # noqa: E501
+        return message_type, data.get('location'), data.get('name'), data.get('event_type')
+
+    return None
+
+
+class SubscriberQueue:
+    """The messages waiting to be sent to a websocket subscriber
+
+    Messages are sent by a dedicated greenlet so that broadcasting never waits on
+    the websocket. Each time the queue is drained, the sender waits WS_SEND_INTERVAL
+    before sending again. A progress message still waiting in the queue is dropped
+    when a newer message with the same coalescing key arrives. If the queue
+    reaches MAX_QUEUED_WS_MESSAGES then the oldest messages are dropped.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.lock = Semaphore()
+        self.queue: OrderedDict[Hashable, QueuedWSMessage] = OrderedDict()
+        self.message_idx = count()  # key of messages that are not coalesced
+        self.has_messages = Event()
+        self.dropping = False  # to only log once while messages are being dropped
+        self.sender = gevent.spawn(self._send_messages)
+
+    def put(self, key: tuple | None, message: QueuedWSMessage) -> None:
+        queue_key: Hashable = next(self.message_idx) if key is None else key
+        if key is not None and self.queue.pop(key, None) is not None:
+            log.debug(f'Coalescing websocket message {key} with a newer one')
+        elif len(self.queue) >= MAX_QUEUED_WS_MESSAGES:
+            if self.dropping is False:
+                log.warning(f'Too many websocket messages waiting for {hash(self.websocket)}. Dropping the oldest')  # noqa: E501
+                self.dropping = True
+            self.queue.popitem(last=False)[1].fail()
+
+        self.queue[queue_key] = message
+        self.has_messages.set()
+
+    def _send_messages(self) -> None:
+        while True:
+            self.has_messages.wait()
+            while len(self.queue) != 0:
+                entry = self.queue.popitem(last=False)[1]
+                _ws_send_impl(
+                    websocket=self.websocket,
+                    lock=self.lock,
+                    to_send_msg=entry.message,
+                    success_callback=entry.success_callback,
+                    success_callback_args=entry.success_callback_args,
+                    failure_callback=entry.failure_callback,
+                    failure_callback_args=entry.failure_callback_args,
+                )
+
+            self.has_messages.clear()
+            self.dropping = False
+            gevent.sleep(WS_SEND_INTERVAL)
+
+    def close(self) -> None:
+        """Stop sending and fail all the messages that were not sent"""
+        self.sender.kill()
+        while len(self.queue) != 0:
+            self.queue.popitem(last=False)[1].fail()
+
+
 class RotkiNotifier:
 
     def __init__(self) -> None:
         self.subscribers: list[WebSocket] = []
-        self.locks: dict[WebSocket, Semaphore] = {}
+        self.queues: dict[WebSocket, SubscriberQueue] = {}
 
     def subscribe(self, websocket: WebSocket) -> None:
         log.info(f'Websocket with hash id {hash(websocket)} subscribed to rotki notifier')
         self.subscribers.append(websocket)
-        self.locks[websocket] = Semaphore()
+        self.queues[websocket] = SubscriberQueue(websocket)
 
     def unsubscribe(self, websocket: WebSocket) -> None:
-        self.locks.pop(websocket, None)
+        if (queue := self.queues.pop(websocket, None)) is not None:
+            queue.close()
         with suppress(ValueError):
             self.subscribers.remove(websocket)
             log.info(f'Websocket with hash id {hash(websocket)} unsubscribed from rotki notifier')
@@ -72,6 +182,9 @@ class RotkiNotifier:
     ) -> None:
         """Broadcasts a websocket message
 
+        The message is queued for each subscriber and sent in the background, so
+        the callbacks run after the message is sent or dropped.
+
         A callback to run on message success and a callback to run on message
         failure can be optionally provided.
         """
@@ -86,31 +199,28 @@ class RotkiNotifier:
 
             return  # get out of the broadcast
 
-        to_remove_indices = set()
-        spawned_one_broadcast = False
-        for idx, websocket in enumerate(self.subscribers):
+        queued_message = QueuedWSMessage(
+            message=message,
+            success_callback=success_callback,
+            success_callback_args=success_callback_args,
+            failure_callback=failure_callback,
+            failure_callback_args=failure_callback_args,
+        )
+        key = _coalescing_key(message_type, message_data['data'])
+        closed_websockets = []
+        queued_one_broadcast = False
+        for websocket in self.subscribers:
             if websocket.closed is True:
-                to_remove_indices.add(idx)
+                closed_websockets.append(websocket)
                 continue
 
-            _ws_send_impl(
-                websocket=websocket,
-                lock=self.locks[websocket],
-                to_send_msg=message,
-                success_callback=success_callback,
-                success_callback_args=success_callback_args,
-                failure_callback=failure_callback,
-                failure_callback_args=failure_callback_args,
-            )
-            spawned_one_broadcast = True
+            self.queues[websocket].put(key=key, message=queued_message)
+            queued_one_broadcast = True
 
-        if len(to_remove_indices) != 0:  # removed closed websockets from the list
-            self.subscribers = [
-                i for j, i in enumerate(self.subscribers) if j not in to_remove_indices
-            ]
-        if spawned_one_broadcast is False and failure_callback is not None:
-            failure_callback_args = {} if failure_callback_args is None else failure_callback_args
-            failure_callback(**failure_callback_args)
+        for websocket in closed_websockets:  # removed closed websockets from the list
+            self.unsubscribe(websocket)
+        if queued_one_broadcast is False:
+            queued_message.fail()
 
 
 class RotkiWSApp(WebSocketApplication):
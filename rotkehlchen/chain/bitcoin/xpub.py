@@ -1,6 +1,8 @@
 import logging
-from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeVar
 
+import gevent
 from gevent.lock import Semaphore
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -24,6 +26,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+T = TypeVar('T')
+
 
 class XpubData(NamedTuple):
     xpub: HDKey
@@ -72,6 +76,47 @@ class XpubDerivedAddressData(NamedTuple):
     balance: FVal
 
 
+def _call_returning_remote_error(func: Callable[..., T], **kwargs: Any) -> T | RemoteError:
+    """To be spawned in a greenlet. Returns any RemoteError instead of raising it,
+    so that it's raised where the greenlet's result is needed"""
+    try:
+        return func(**kwargs)
+    except RemoteError as e:
+        return e
+
+
+def _get_result(greenlet: gevent.Greenlet) -> Any:
+    """May raise:
+    - RemoteError: the error the greenlet's function returned
+    """
+    if isinstance(result := greenlet.get(), RemoteError):
+        raise result
+    return result
+
+
+def _query_window_activity(
+        root: HDKey,
+        start_index: int,
+        gap_limit: int,
+        blockchain: Literal[SupportedBlockchain.BITCOIN, SupportedBlockchain.BITCOIN_CASH],
+) -> tuple[list[tuple[int, BTCAddress]], dict[BTCAddress, tuple[bool, FVal]]]:
+    """Derive the addresses of a gap limit window and check which had transactions
+
+    May raise:
+    - RemoteError: if blockstream/blockchain.info can't be reached
+    """
+    batch_addresses: list[tuple[int, BTCAddress]] = []
+    for idx in range(start_index, start_index + gap_limit):
+        child = root.derive_child(idx)
+        batch_addresses.append((idx, child.address()))
+
+    if blockchain == SupportedBlockchain.BITCOIN:
+        have_tx_mapping = have_bitcoin_transactions([x[1] for x in batch_addresses])
+    else:
+        have_tx_mapping = have_bch_transactions([x[1] for x in batch_addresses])
+    return batch_addresses, have_tx_mapping
+
+
 def _derive_addresses_loop(
         account_index: int,
         start_index: int,
@@ -79,49 +124,71 @@ def _derive_addresses_loop(
         gap_limit: int,
         blockchain: Literal[SupportedBlockchain.BITCOIN, SupportedBlockchain.BITCOIN_CASH],
 ) -> list[XpubDerivedAddressData]:
-    """May raise:
+    """Check gap limit windows of addresses until one with no transactions is found.
+    After a window that had transactions the next one is queried while the current
+    one is processed, since it's then likely to be needed.
+
+    May raise:
     - RemoteError: if blockstream/blockchain.info can't be reached
     """
     step_index = start_index
     addresses: list[XpubDerivedAddressData] = []
-    should_continue = True
-    while should_continue:
-        batch_addresses: list[tuple[int, BTCAddress]] = []
-        for idx in range(step_index, step_index + gap_limit):
-            child = root.derive_child(idx)
-            batch_addresses.append((idx, child.address()))
-
-        if blockchain == SupportedBlockchain.BITCOIN:
-            have_tx_mapping = have_bitcoin_transactions([x[1] for x in batch_addresses])
-        else:
-            have_tx_mapping = have_bch_transactions([x[1] for x in batch_addresses])
-        should_continue = False
-        for idx, address in batch_addresses:
-            have_tx, balance = have_tx_mapping[address]
-            if have_tx:
-                addresses.append(XpubDerivedAddressData(
-                    account_index=account_index,
-                    derived_index=idx,
-                    address=address,
-                    balance=balance,
-                ))
-                should_continue = True
-
-        # do one more pass and add any addresses with no transactions before the max index
-        # this is so we can start new address generation from the max index later
-        if len(addresses) != 0:
-            max_index = max(x[0] for x in addresses)
-            for idx, address in batch_addresses[:max_index]:
+    should_continue = False  # if the last processed window had transactions
+    window: gevent.Greenlet | None = None
+    try:
+        while True:
+            if window is None:
+                window = gevent.spawn(
+                    _call_returning_remote_error,
+                    func=_query_window_activity,
+                    root=root,
+                    start_index=step_index,
+                    gap_limit=gap_limit,
+                    blockchain=blockchain,
+                )
+            next_window = gevent.spawn(
+                _call_returning_remote_error,
+                func=_query_window_activity,
+                root=root,
+                start_index=step_index + gap_limit,
+                gap_limit=gap_limit,
+                blockchain=blockchain,
+            ) if should_continue else None
+            batch_addresses, have_tx_mapping = _get_result(window)
+            window = next_window
+
+            should_continue = False
+            for idx, address in batch_addresses:
                 have_tx, balance = have_tx_mapping[address]
-                if not have_tx:
+                if have_tx:
                     addresses.append(XpubDerivedAddressData(
                         account_index=account_index,
                         derived_index=idx,
                         address=address,
                         balance=balance,
                     ))
-
-        step_index += gap_limit
+                    should_continue = True
+
+            # do one more pass and add any addresses with no transactions before the max index
+            # this is so we can start new address generation from the max index later
+            if len(addresses) != 0:
+                max_index = max(x[0] for x in addresses)
+                for idx, address in batch_addresses[:max_index]:
+                    have_tx, balance = have_tx_mapping[address]
+                    if not have_tx:
+                        addresses.append(XpubDerivedAddressData(
+                            account_index=account_index,
+                            derived_index=idx,
+                            address=address,
+                            balance=balance,
+                        ))
+
+            step_index += gap_limit
+            if should_continue is False:
+                break
+    finally:
+        if window is not None:  # the window after the last needed one, if queried
+            window.kill()
 
     return addresses
 
@@ -136,6 +203,8 @@ def _derive_addresses_from_xpub_data(
     any addresses until the biggest index derived addresses that have had no transactions.
     This is to make it easier to later derive and check more addresses
 
+    The receiving and the change addresses are checked concurrently.
+
     May raise:
     - RemoteError: if blockstream/blockchain.info/haskoin and others can't be reached
     """
@@ -144,27 +213,22 @@ def _derive_addresses_from_xpub_data(
     else:
         account_xpub = xpub_data.xpub
 
+    greenlets = [gevent.spawn(
+        _call_returning_remote_error,
+        func=_derive_addresses_loop,
+        account_index=account_index,
+        start_index=start_index,
+        root=account_xpub.derive_child(account_index),
+        gap_limit=gap_limit,
+        blockchain=xpub_data.blockchain,
+    ) for account_index, start_index in ((0, start_receiving_index), (1, start_change_index))]
     addresses = []
-    receiving_xpub = account_xpub.derive_child(0)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=0,
-            start_index=start_receiving_index,
-            root=receiving_xpub,
-            gap_limit=gap_limit,
-            blockchain=xpub_data.blockchain,
-        ),
-    )
-    change_xpub = account_xpub.derive_child(1)
-    addresses.extend(
-        _derive_addresses_loop(
-            account_index=1,
-            start_index=start_change_index,
-            root=change_xpub,
-            gap_limit=gap_limit,
-            blockchain=xpub_data.blockchain,
-        ),
-    )
+    try:
+        for greenlet in greenlets:  # receiving addresses first and then change addresses
+            addresses.extend(_get_result(greenlet))
+    finally:
+        gevent.killall(greenlets)  # stop the other query if one failed
+
     return addresses
 
 
@@ -13,6 +13,7 @@ from rotkehlchen.chain.evm.decoding.structures import (
     DecodingOutput,
 )
 from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
+from rotkehlchen.chain.evm.decoding.utils import decodes_topics
 from rotkehlchen.chain.evm.structures import EvmTxReceiptLog
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_1INCH, A_ETH, A_GTC
@@ -71,6 +72,7 @@ class EthereumTransactionDecoder(EVMTransactionDecoderWithDSProxy):
             ),
         )
 
+    @decodes_topics(GTC_CLAIM, MERKLE_CLAIM, GNOSIS_CHAIN_BRIDGE_RECEIVE)
     def _maybe_enrich_transfers(
             self,
             token: EvmToken | None,  # pylint: disable=unused-argument
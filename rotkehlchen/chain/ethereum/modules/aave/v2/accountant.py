@@ -25,6 +25,9 @@ class Aavev2Accountant(ModuleAccountantInterface):
         self.assets_borrowed: dict[tuple[ChecksumEvmAddress, Asset], FVal] = defaultdict(FVal)
         self.assets_supplied: dict[tuple[ChecksumEvmAddress, Asset], FVal] = defaultdict(FVal)
 
+    def has_state(self) -> bool:
+        return any(x != ZERO for x in self.assets_borrowed.values()) or any(x != ZERO for x in self.assets_supplied.values())  # noqa: E501
+
     def _process_borrow(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
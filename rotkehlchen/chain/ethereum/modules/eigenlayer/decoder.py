@@ -304,6 +304,7 @@ class EigenlayerDecoder(CliqueAirdropDecoderInterface):
             event_subtypes=[HistoryEventSubType.REMOVE_ASSET],
         )
         dbevents = DBHistoryEvents(self.base.database)
+        self.base.flush_pending_events()  # the queued withdrawal may not be written yet
         with self.base.database.conn.read_ctx() as cursor:
             events = dbevents.get_history_events(
                 cursor=cursor,
@@ -25,6 +25,9 @@ class MakerdaoAccountant(ModuleAccountantInterface):
         self.vault_balances: dict[str, FVal] = defaultdict(FVal)
         self.dsr_balances: dict[ChecksumEvmAddress, FVal] = defaultdict(FVal)
 
+    def has_state(self) -> bool:
+        return any(x != ZERO for x in self.vault_balances.values()) or any(x != ZERO for x in self.dsr_balances.values())  # noqa: E501
+
     def _process_vault_dai_generation(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
@@ -21,6 +21,9 @@ class ThegraphAccountant(ModuleAccountantInterface):
     def reset(self) -> None:
         self.assets_supplied: dict[ChecksumEvmAddress, FVal] = defaultdict(FVal)
 
+    def has_state(self) -> bool:
+        return any(x != ZERO for x in self.assets_supplied.values())
+
     def _process_deposit(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
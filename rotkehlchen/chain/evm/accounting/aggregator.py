@@ -94,6 +94,10 @@ class EVMAccountingAggregator:
         for accountant in self.accountants.values():
             accountant.reset()
 
+    def has_state(self) -> bool:
+        """Check if any of the initialized submodule accountants holds state"""
+        return any(accountant.has_state() for accountant in self.accountants.values())
+
 
 class EVMAccountingAggregators:
     """
@@ -120,3 +124,7 @@ class EVMAccountingAggregators:
         """Reset the state of all initialized submodule accountants"""
         for aggregator in self.aggregators:
             aggregator.reset()
+
+    def has_state(self) -> bool:
+        """Check if any of the initialized submodule accountants holds state"""
+        return any(aggregator.has_state() for aggregator in self.aggregators)
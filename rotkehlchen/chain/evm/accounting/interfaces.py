@@ -52,6 +52,12 @@ class ModuleAccountantInterface(ABC):
         """Subclasses may implement this to reset state between accounting runs"""
         return None
 
+    def has_state(self) -> bool:
+        """Subclasses that keep state between events should implement this to tell if
+        the state differs from the one after reset(). Used to know if it is safe to
+        checkpoint the accounting state without the module's state."""
+        return False
+
 
 class DepositableAccountantInterface(ModuleAccountantInterface):
     """
@@ -49,6 +49,14 @@ class BaseDecoderTools:
         with self.database.conn.read_ctx() as cursor:
             self.tracked_accounts = self.database.get_blockchain_accounts(cursor)
         self.sequence_counter = 0
+        # set by the decoder while decoded events are written to the DB in batches
+        self.pending_events_flusher: Callable[[], None] | None = None
+
+    def flush_pending_events(self) -> None:
+        """Write to the DB the events of already decoded transactions that are still pending
+        in a batch. Decoders need to call it before reading decoded events from the DB."""
+        if self.pending_events_flusher is not None:
+            self.pending_events_flusher()
 
     def reset_sequence_counter(self) -> None:
         self.sequence_counter = 0
@@ -6,9 +6,11 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Optional, Protocol
 
+import gevent
 from gevent.lock import Semaphore
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -58,12 +60,13 @@ from .structures import (
     DEFAULT_DECODING_OUTPUT,
     FAILED_ENRICHMENT_OUTPUT,
     ActionItem,
+    DecodedTransactionsBatch,
     DecoderContext,
     DecodingOutput,
     EnricherContext,
     TransferEnrichmentOutput,
 )
-from .utils import maybe_reshuffle_events
+from .utils import DECODED_TOPICS_ATTRIBUTE, decodes_topics, maybe_reshuffle_events
 
 if TYPE_CHECKING:
     from rotkehlchen.chain.evm.node_inquirer import EvmNodeInquirer, EvmNodeInquirerWithDSProxy
@@ -77,6 +80,14 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Limits for the batched decoding mode. Decoded events are written to the DB when
+# either this many transactions have been decoded or this much time has passed
+DECODING_WRITE_BATCH_SIZE = 100
+DECODING_WRITE_BATCH_MAX_AGE_MS = 1000
+# Number of transactions decoded as one shard. After each shard pending writes are
+# flushed and the decoding greenlet yields so that other greenlets are not starved
+DECODING_SHARD_SIZE = 500
+
 
 class EventDecoderFunction(Protocol):
 
@@ -160,7 +171,7 @@ class EVMTransactionDecoder(ABC):
         self.dbevmtx = dbevmtx_class(self.database)
         self.dbevents = DBHistoryEvents(self.database)
         self.base = base_tools
-        self.rules = DecodingRules(
+        self.rules: DecodingRules = DecodingRules(
             address_mappings={},
             event_rules=[
                 self._maybe_decode_erc20_approve,
@@ -180,8 +191,35 @@ class EVMTransactionDecoder(ABC):
         self._add_builtin_decoders(self.rules)
         # Recursively check all submodules to get all decoder address mappings and rules
         self.rules += self._recursively_initialize_decoders(self.chain_modules_root)
+        self._index_event_rules()
         self.undecoded_tx_query_lock = Semaphore()
 
+    def _index_event_rules(self) -> None:
+        """Build the topic -> event rules index used by `try_all_rules`.
+
+        Rules decorated with `decodes_topics` are only added under the topics they declare
+        while rules without any declared topics are added under every topic and also kept
+        in `catch_all_event_rules` for logs with a topic no rule declares. The relative
+        order of the rules in `self.rules.event_rules` is preserved for each topic.
+        """
+        rule_topics = [
+            (rule, getattr(rule, DECODED_TOPICS_ATTRIBUTE, None))
+            for rule in self.rules.event_rules
+        ]
+        self.catch_all_event_rules: list[EventDecoderFunction] = [
+            rule for rule, topics in rule_topics if topics is None
+        ]
+        self.event_rules_by_topic: dict[bytes, list[EventDecoderFunction]] = {}
+        for _, topics in rule_topics:
+            for topic in topics or ():
+                if topic in self.event_rules_by_topic:
+                    continue
+
+                self.event_rules_by_topic[topic] = [
+                    rule for rule, other_topics in rule_topics
+                    if other_topics is None or topic in other_topics
+                ]
+
     def _add_builtin_decoders(self, rules: DecodingRules) -> None:
         """Adds decoders that should be built-in for every EVM decoding run
 
@@ -328,11 +366,13 @@ class EVMTransactionDecoder(ABC):
         """
         Execute event rules for the current tx log. Returns None when no
         new event or actions need to be propagated.
+
+        Only the rules that may match the log's first topic are tried. See `_index_event_rules`
         """
-        for rule in self.rules.event_rules:
-            if len(tx_log.topics) == 0:
-                continue  # ignore anonymous events
+        if len(tx_log.topics) == 0:
+            return None  # ignore anonymous events
 
+        for rule in self.event_rules_by_topic.get(tx_log.topics[0], self.catch_all_event_rules):
             try:
                 decoding_output = rule(token=token, tx_log=tx_log, transaction=transaction, decoded_events=decoded_events, action_items=action_items, all_logs=all_logs)  # noqa: E501
             except (DeserializationError, IndexError) as e:
@@ -412,10 +452,14 @@ class EVMTransactionDecoder(ABC):
             self,
             transaction: EvmTransaction,
             tx_receipt: EvmTxReceipt,
+            decoded_batch: DecodedTransactionsBatch | None = None,
     ) -> tuple[list['EvmEvent'], bool]:
         """
         Decodes an evm transaction and its receipt and saves result in the DB.
         Returns the list of decoded events and a flag which is True if balances refresh is needed.
+
+        If `decoded_batch` is given the events are not written to the DB here but are
+        added to the batch and the caller is responsible for flushing it.
         """
         self.base.reset_sequence_counter()
         # check if any eth transfer happened in the transaction, including in internal transactions
@@ -489,39 +533,80 @@ class EVMTransactionDecoder(ABC):
         if len(events) == 0 and (eth_event := self._get_eth_transfer_event(transaction)) is not None:  # noqa: E501
             events = [eth_event]
 
-        with self.database.user_write() as write_cursor:
+        if decoded_batch is not None:
+            decoded_batch.add(transaction=transaction, events=events)
+        else:
+            with self.database.user_write() as write_cursor:
+                self._write_decoded_transactions(
+                    write_cursor=write_cursor,
+                    decoded_transactions=[(transaction, events)],
+                )
+
+        events = sorted(events, key=lambda x: x.sequence_index, reverse=False)
+        return events, refresh_balances  # Propagate for post processing in the caller
+
+    def _write_decoded_transactions(
+            self,
+            write_cursor: 'DBCursor',
+            decoded_transactions: Sequence[tuple[EvmTransaction, list['EvmEvent']]],
+    ) -> None:
+        """Write the decoded events of the given transactions and mark them as decoded.
+
+        Transactions without any events are probably phishing zero value token transfers
+        so they are added to the ignored actions instead.
+        Details here: https://github.com/rotki/rotki/issues/5749
+
+        The transactions are only marked as decoded in the same DB transaction in which
+        their events are written so that a crash can't leave a transaction marked as decoded
+        without its events.
+        """
+        tx_ids = []
+        for transaction, events in decoded_transactions:
             if len(events) > 0:
                 self.dbevents.add_history_events(
                     write_cursor=write_cursor,
                     history=events,
                 )
             else:
-                # This is probably a phishing zero value token transfer tx.
-                # Details here: https://github.com/rotki/rotki/issues/5749
                 with suppress(InputError):  # We don't care if it's already in the DB
                     self.database.add_to_ignored_action_ids(
                         write_cursor=write_cursor,
                         action_type=ActionType.HISTORY_EVENT,
                         identifiers=[transaction.identifier],
                     )
-            tx_id = transaction.get_or_query_db_id(write_cursor)
-            write_cursor.execute(
-                'INSERT OR IGNORE INTO evm_tx_mappings(tx_id, value) VALUES(?, ?)',
-                (tx_id, HISTORY_MAPPING_STATE_DECODED),
-            )
+            tx_ids.append(transaction.get_or_query_db_id(write_cursor))
 
-        events = sorted(events, key=lambda x: x.sequence_index, reverse=False)
-        return events, refresh_balances  # Propagate for post processing in the caller
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO evm_tx_mappings(tx_id, value) VALUES(?, ?)',
+            [(tx_id, HISTORY_MAPPING_STATE_DECODED) for tx_id in tx_ids],
+        )
+
+    def _flush_decoded_batch(self, decoded_batch: DecodedTransactionsBatch) -> None:
+        """Write all the pending transactions of the batch to the DB in a single transaction"""
+        if len(decoded_batch.transactions) == 0:
+            return
+
+        with self.database.user_write() as write_cursor:
+            self._write_decoded_transactions(
+                write_cursor=write_cursor,
+                decoded_transactions=decoded_batch.transactions,
+            )
+        log.debug(f'Wrote decoded events of {len(decoded_batch.transactions)} {self.evm_inquirer.chain_name} transactions')  # noqa: E501
+        decoded_batch.clear()
 
     def get_and_decode_undecoded_transactions(
             self,
             limit: int | None = None,
             send_ws_notifications: bool = False,
+            batch_writes: bool = False,
     ) -> None:
         """Checks the DB for up to `limit` undecoded transactions and decodes them.
         If a list of addresses is provided then only the transactions involving those
         addresses are decoded.
 
+        `batch_writes` is passed to `decode_transaction_hashes`. The decoded events are
+        not kept in memory since the caller does not need them.
+
         This is protected by concurrent access from a lock"""
         with self.undecoded_tx_query_lock:
             log.debug(f'Starting task to process undecoded transactions for {self.evm_inquirer.chain_name} with {limit=}')  # noqa: E501
@@ -535,6 +620,8 @@ class EVMTransactionDecoder(ABC):
                     ignore_cache=False,
                     tx_hashes=hashes,
                     send_ws_notifications=send_ws_notifications,
+                    batch_writes=batch_writes,
+                    return_events=False,
                 )
             log.debug(f'Finished task to process undecoded transactions for {self.evm_inquirer.chain_name} with {limit=}')  # noqa: E501
 
@@ -544,10 +631,26 @@ class EVMTransactionDecoder(ABC):
             tx_hashes: list[EVMTxHash] | None,
             send_ws_notifications: bool = False,
             delete_customized: bool = False,
+            batch_writes: bool = False,
+            return_events: bool = True,
     ) -> list['EvmEvent']:
         """Make sure that receipts are pulled + events decoded for the given transaction hashes.
         If delete_customized is True then also customized events are deleted before redecoding.
 
+        If batch_writes is True the decoded events are written to the DB in batches of up to
+        DECODING_WRITE_BATCH_SIZE transactions or every DECODING_WRITE_BATCH_MAX_AGE_MS instead
+        of one DB transaction per decoded transaction. Decoders that look up events of
+        previous transactions in the DB flush the pending batch first through
+        BaseDecoderTools.flush_pending_events.
+
+        The hashes are processed in shards of DECODING_SHARD_SIZE. The receipts of each shard
+        are read from the DB at once when the shard starts. At the end of each shard
+        the pending batch is flushed and the greenlet yields. Shards are not decoded
+        concurrently since the decoders keep per transaction state such as the sequence
+        counter of the base tools. If return_events is False the decoded events are not
+        accumulated and an empty list is returned, which keeps memory flat when decoding
+        a big backlog of transactions.
+
         The transaction hashes must exist in the DB at the time of the call
 
         May raise:
@@ -555,8 +658,6 @@ class EVMTransactionDecoder(ABC):
         - RemoteError if there is a problem with contacting a remote to get receipts
         - InputError if the transaction hash is not found in the DB
         """
-        events: list[EvmEvent] = []
-        refresh_balances = False
         with self.database.conn.read_ctx() as cursor:
             self.reload_data(cursor)
             # If no transaction hashes are passed, decode all transactions.
@@ -567,8 +668,55 @@ class EVMTransactionDecoder(ABC):
                 )
                 tx_hashes = [EVMTxHash(x[0]) for x in cursor]
 
+        decoded_batch = None
+        if batch_writes:
+            decoded_batch = DecodedTransactionsBatch(
+                max_transactions=DECODING_WRITE_BATCH_SIZE,
+                max_age_ms=DECODING_WRITE_BATCH_MAX_AGE_MS,
+            )
+            self.base.pending_events_flusher = partial(self._flush_decoded_batch, decoded_batch)
+
+        try:
+            events, refresh_balances = self._decode_transaction_hashes(
+                tx_hashes=tx_hashes,
+                ignore_cache=ignore_cache,
+                send_ws_notifications=send_ws_notifications,
+                delete_customized=delete_customized,
+                decoded_batch=decoded_batch,
+                return_events=return_events,
+            )
+        finally:
+            self.base.pending_events_flusher = None
+
+        self._post_process(refresh_balances=refresh_balances)
+        return events
+
+    def _decode_transaction_hashes(
+            self,
+            tx_hashes: list[EVMTxHash],
+            ignore_cache: bool,
+            send_ws_notifications: bool,
+            delete_customized: bool,
+            decoded_batch: DecodedTransactionsBatch | None,
+            return_events: bool,
+    ) -> tuple[list['EvmEvent'], bool]:
+        """Decodes the given hashes in shards. Check decode_transaction_hashes
+
+        Returns the decoded events and a flag which is True if balances refresh is needed.
+        """
+        events: list[EvmEvent] = []
+        refresh_balances = False
         total_transactions = len(tx_hashes)
+        shard_receipts: dict[EVMTxHash, EvmTxReceipt] = {}
         for tx_index, tx_hash in enumerate(tx_hashes):
+            if tx_index % DECODING_SHARD_SIZE == 0:  # read the receipts of the shard at once
+                with self.database.conn.read_ctx() as cursor:
+                    shard_receipts = self.dbevmtx.get_receipts(
+                        cursor=cursor,
+                        tx_hashes=tx_hashes[tx_index:tx_index + DECODING_SHARD_SIZE],
+                        chain_id=self.evm_inquirer.chain_id,
+                    )
+
             if send_ws_notifications and tx_index % 10 == 0:
                 self.msg_aggregator.add_message(
                     message_type=WSMessageType.EVM_UNDECODED_TRANSACTIONS,
@@ -586,8 +734,11 @@ class EVMTransactionDecoder(ABC):
                         cursor=cursor,
                         tx_hash=tx_hash,
                         relevant_address=None,
+                        tx_receipt=shard_receipts.pop(tx_hash, None),
                     )
                 except RemoteError as e:
+                    if decoded_batch is not None:  # don't lose what was already decoded
+                        self._flush_decoded_batch(decoded_batch)
                     raise InputError(f'{self.evm_inquirer.chain_name} hash {tx_hash.hex()} does not correspond to a transaction. {e}') from e  # noqa: E501
 
             new_events, new_refresh_balances = self._get_or_decode_transaction_events(
@@ -595,10 +746,21 @@ class EVMTransactionDecoder(ABC):
                 tx_receipt=receipt,
                 ignore_cache=ignore_cache,
                 delete_customized=delete_customized,
+                decoded_batch=decoded_batch,
             )
-            events.extend(new_events)
+            if return_events:
+                events.extend(new_events)
             if new_refresh_balances is True:
                 refresh_balances = True
+            if decoded_batch is not None and decoded_batch.should_flush():
+                self._flush_decoded_batch(decoded_batch)
+            if (tx_index + 1) % DECODING_SHARD_SIZE == 0:
+                if decoded_batch is not None:
+                    self._flush_decoded_batch(decoded_batch)
+                gevent.sleep(0)  # let other greenlets run between shards
+
+        if decoded_batch is not None:
+            self._flush_decoded_batch(decoded_batch)
 
         if send_ws_notifications:
             self.msg_aggregator.add_message(
@@ -610,8 +772,7 @@ class EVMTransactionDecoder(ABC):
                 },
             )
 
-        self._post_process(refresh_balances=refresh_balances)
-        return events
+        return events, refresh_balances
 
     def _get_or_decode_transaction_events(
             self,
@@ -619,10 +780,12 @@ class EVMTransactionDecoder(ABC):
             tx_receipt: EvmTxReceipt,
             ignore_cache: bool,
             delete_customized: bool = False,
+            decoded_batch: DecodedTransactionsBatch | None = None,
     ) -> tuple[list['EvmEvent'], bool]:
         """
         Get a transaction's events if existing in the DB or decode them.
         Returns the list of decoded events and a flag which is True if balances refresh is needed.
+        If `decoded_batch` is given newly decoded events are added to it. Check _decode_transaction
         """
         with self.database.conn.read_ctx() as cursor:
             tx_id = transaction.get_or_query_db_id(cursor)
@@ -656,7 +819,11 @@ class EVMTransactionDecoder(ABC):
                     return events, False
 
         # else we should decode now
-        return self._decode_transaction(transaction=transaction, tx_receipt=tx_receipt)
+        return self._decode_transaction(
+            transaction=transaction,
+            tx_receipt=tx_receipt,
+            decoded_batch=decoded_batch,
+        )
 
     def _maybe_decode_internal_transactions(
             self,
@@ -729,6 +896,7 @@ class EVMTransactionDecoder(ABC):
             counterparty=counterparty,
         )
 
+    @decodes_topics(ERC20_APPROVE)
     def _maybe_decode_erc20_approve(
             self,
             token: EvmToken | None,
@@ -857,6 +1025,7 @@ class EVMTransactionDecoder(ABC):
             events.append(eth_event)
         return events
 
+    @decodes_topics(ERC20_OR_ERC721_TRANSFER)
     def _maybe_decode_erc20_721_transfer(
             self,
             token: EvmToken | None,
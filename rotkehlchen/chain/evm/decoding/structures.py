@@ -2,7 +2,8 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Final, Literal, NamedTuple, Optional
 
-from rotkehlchen.types import ChecksumEvmAddress
+from rotkehlchen.types import ChecksumEvmAddress, TimestampMS
+from rotkehlchen.utils.misc import ts_now_in_ms
 
 if TYPE_CHECKING:
     from rotkehlchen.assets.asset import Asset, EvmToken
@@ -96,5 +97,38 @@ class TransferEnrichmentOutput(NamedTuple):
     refresh_balances: bool = False
 
 
+@dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=False)
+class DecodedTransactionsBatch:
+    """Decoded transactions whose events have not yet been written to the DB.
+
+    Used by the batched decoding mode so that the events of many transactions are written
+    in a single DB transaction. The batch should be flushed when `should_flush()` is True,
+    which happens after `max_transactions` have been added or after `max_age_ms` have
+    passed since the first transaction was added.
+    """
+    max_transactions: int
+    max_age_ms: int
+    transactions: list[tuple['EvmTransaction', list['EvmEvent']]] = field(default_factory=list)
+    first_added_ts: TimestampMS | None = None
+
+    def add(self, transaction: 'EvmTransaction', events: list['EvmEvent']) -> None:
+        if self.first_added_ts is None:
+            self.first_added_ts = ts_now_in_ms()
+        self.transactions.append((transaction, events))
+
+    def should_flush(self) -> bool:
+        if len(self.transactions) == 0:
+            return False
+
+        return (
+            len(self.transactions) >= self.max_transactions or
+            ts_now_in_ms() - self.first_added_ts >= self.max_age_ms  # type: ignore[operator]  # is set if transactions exist
+        )
+
+    def clear(self) -> None:
+        self.transactions = []
+        self.first_added_ts = None
+
+
 DEFAULT_DECODING_OUTPUT: Final = DecodingOutput()
 FAILED_ENRICHMENT_OUTPUT: Final = TransferEnrichmentOutput()
@@ -1,5 +1,5 @@
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Optional, TypeVar
 
 from rotkehlchen.assets.asset import AssetWithSymbol
 from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
@@ -11,6 +11,24 @@ if TYPE_CHECKING:
     from rotkehlchen.chain.evm.structures import EvmTxReceiptLog
     from rotkehlchen.history.events.structures.evm_event import EvmEvent
 
+T = TypeVar('T', bound=Callable)
+
+# Attribute set on event decoding rules that declare which log topics they can decode
+DECODED_TOPICS_ATTRIBUTE = 'decoded_topics'
+
+
+def decodes_topics(*topics: bytes) -> Callable[[T], T]:
+    """Decorator for event decoding rules that only act on logs whose first topic
+    is one of the given topics. The transaction decoder uses this information to index
+    the rules by topic so that each log is only passed to the rules that can match it.
+
+    Rules without this decorator are tried for every log."""
+    def wrapper(func: T) -> T:
+        setattr(func, DECODED_TOPICS_ATTRIBUTE, frozenset(topics))
+        return func
+
+    return wrapper
+
 
 def maybe_reshuffle_events(
         ordered_events: Sequence[Optional['EvmEvent']],
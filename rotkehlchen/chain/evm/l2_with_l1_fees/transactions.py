@@ -37,6 +37,7 @@ class L2WithL1FeesTransactions(EvmTransactions, ABC):
             cursor: 'DBCursor',
             tx_hash: 'EVMTxHash',
             relevant_address: Optional['ChecksumEvmAddress'],
+            tx_receipt: Optional['EvmTxReceipt'] = None,
     ) -> tuple[tuple[Any, ...], 'EvmTxReceipt']:
         """In addition to the base class check, also checks that the transaction has
         a corresponding l1_fee value in the database. If not, pulls it.
@@ -49,6 +50,7 @@ class L2WithL1FeesTransactions(EvmTransactions, ABC):
             cursor=cursor,
             tx_hash=tx_hash,
             relevant_address=relevant_address,
+            tx_receipt=tx_receipt,
         )
         l1_fee = cursor.execute(
             'SELECT op_txs.l1_fee FROM evm_transactions AS txs '
@@ -1,17 +1,25 @@
 import json
 import logging
+import operator
 import random
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import suppress
+from dataclasses import dataclass, field
 from itertools import zip_longest
-from typing import TYPE_CHECKING, Any, Literal
+from json.decoder import JSONDecodeError
+from typing import TYPE_CHECKING, Any, Final, Literal
 from urllib.parse import urlparse
 
+import gevent
 import requests
 from ens import ENS
 from eth_abi.exceptions import DecodingError
 from eth_typing import BlockNumber
+from gevent.lock import Semaphore
+from gevent.pool import Pool
 from requests import RequestException
 from web3 import HTTPProvider, Web3
 from web3._utils.abi import get_abi_output_types
@@ -69,6 +77,7 @@ from rotkehlchen.types import (
 from rotkehlchen.utils.data_structures import LRUCacheWithRemove
 from rotkehlchen.utils.misc import from_wei, get_chunks, hex_or_bytes_to_str
 from rotkehlchen.utils.mixins.lockable import LockableQueryMixIn, protect_with_lock
+from rotkehlchen.utils.network import create_session
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
@@ -76,6 +85,66 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+RECEIPTS_BATCH_SIZE: Final = 50  # receipts per JSON-RPC batch request. Nodes limit batch sizes
+NODE_STATS_WINDOW: Final = 100  # number of recent calls to a node the stats are calculated on
+NODE_STATS_MIN_SAMPLES: Final = 10  # recent calls needed before the stats are used
+NODE_FAST_LATENCY: Final = 0.5  # seconds. Nodes with a higher median latency lose weight
+NODE_MIN_WEIGHT_FACTOR: Final = 0.05  # so that bad nodes are still tried once in a while
+HEDGE_LATENCY_PERCENTILE: Final = 90  # latency of a node after which a query is also sent to another  # noqa: E501
+HEDGE_MIN_DELAY: Final = 0.5  # seconds
+MULTICALL_CHUNKS_PER_NODE: Final = 2  # multicall chunks queried at the same time from each node
+
+
+@dataclass
+class NodeStats:
+    """Statistics of the calls made to a node. Error rate and latencies are of the
+    last NODE_STATS_WINDOW calls so that they follow changes in the node's health"""
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=NODE_STATS_WINDOW))
+    failures: deque[bool] = field(default_factory=lambda: deque(maxlen=NODE_STATS_WINDOW))
+    requests: int = 0
+    errors: int = 0
+    hedged: int = 0  # calls also sent to another node since this one was slow
+
+    def record(self, latency: float, failed: bool) -> None:
+        self.requests += 1
+        self.errors += failed
+        self.latencies.append(latency)
+        self.failures.append(failed)
+
+    def has_enough_samples(self) -> bool:
+        return len(self.failures) >= NODE_STATS_MIN_SAMPLES
+
+    def error_rate(self) -> float:
+        return sum(self.failures) / len(self.failures) if len(self.failures) != 0 else 0
+
+    def latency_percentile(self, percentile: int) -> float:
+        if len(self.latencies) == 0:
+            return 0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, len(ordered) * percentile // 100)]
+
+    def weight_factor(self) -> float:
+        """The factor the node's weight is multiplied with when picking the call order.
+        Goes down with the error rate and with the median latency above NODE_FAST_LATENCY"""
+        if not self.has_enough_samples():
+            return 1
+
+        factor = 1 - self.error_rate()
+        if (median_latency := self.latency_percentile(50)) > NODE_FAST_LATENCY:
+            factor *= NODE_FAST_LATENCY / median_latency
+        return max(factor, NODE_MIN_WEIGHT_FACTOR)
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'hedged': self.hedged,
+            'recent_error_rate': self.error_rate(),
+            'median_latency': self.latency_percentile(50),
+            'p90_latency': self.latency_percentile(90),
+            'weight_factor': self.weight_factor(),
+        }
+
 
 def _connect_task_prefix(chain_name: str) -> str:
     """Helper function to create the connection task greenlet name"""
@@ -102,6 +171,20 @@ def _is_synchronized(current_block: int, latest_block: int) -> tuple[bool, str]:
     return True, message
 
 
+def _spread_nodes(nodes: Sequence[WeightedNode]) -> list[WeightedNode]:
+    """The nodes that concurrent queries are spread over. Owned nodes always have
+    preference, so if any exist the queries are only spread over them"""
+    return [node for node in nodes if node.node_info.owned] or list(nodes)
+
+
+def _spread_call_order(nodes: Sequence[WeightedNode], query_idx: int) -> list[WeightedNode]:
+    """Call order for the query_idx-th of many concurrent queries, so that each one starts
+    from a different one of the spread nodes. The rest of the nodes are kept as a fallback"""
+    spread_nodes = _spread_nodes(nodes)
+    offset = query_idx % len(spread_nodes)
+    return spread_nodes[offset:] + spread_nodes[:offset] + [node for node in nodes if node not in spread_nodes]  # noqa: E501
+
+
 WEB3_LOGQUERY_BLOCK_RANGE = 250000
 
 
@@ -190,6 +273,14 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         '_get_transaction_by_hash',
         '_get_logs',
     )
+    # Reads that are also sent to a second node if the first one is slower than usual
+    methods_that_can_be_hedged = (
+        '_get_transaction_receipt',
+        '_get_transaction_by_hash',
+        '_get_block_by_number',
+        '_get_code',
+        '_call_contract',
+    )
 
     def __init__(
             self,
@@ -214,6 +305,12 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         self.contracts = contracts
         self.web3_mapping: dict[NodeName, Web3Node] = {}
         self.rpc_timeout = rpc_timeout
+        self.session = create_session()  # for the requests that web3 can't do, like batches
+        self.nodes_stats: defaultdict[NodeName, NodeStats] = defaultdict(NodeStats)
+        # limit the multicall chunks that are being queried at the same time from each node
+        self.multicall_semaphores: defaultdict[NodeName, Semaphore] = defaultdict(
+            lambda: Semaphore(MULTICALL_CHUNKS_PER_NODE),
+        )
         self.chain_id: SUPPORTED_CHAIN_IDS = blockchain.to_chain_id()  # type: ignore[assignment]
         self.chain_name = self.chain_id.to_name()
         self.native_token = native_token
@@ -267,7 +364,8 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
         """Default call order for evm nodes
 
         Own node always has preference. Then all other node types are randomly queried
-        in sequence depending on a weighted probability.
+        in sequence depending on a weighted probability. The weight of each node is scaled
+        down by its recent error rate and latency (see NodeStats.weight_factor).
 
 
         Some benchmarks on weighted probability based random selection when compared
@@ -289,7 +387,10 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
 
         ordered_list = []
         while len(selection) != 0:
-            weights = [float(entry.weight) for entry in selection]
+            weights = [
+                float(entry.weight) * (stats.weight_factor() if (stats := self.nodes_stats.get(entry.node_info)) is not None else 1)  # noqa: E501
+                for entry in selection
+            ]
             node = random.choices(selection, weights, k=1)
             ordered_list.append(node[0])
             selection.remove(node[0])
@@ -507,12 +608,100 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
                 connectivity_check=True,
             )
 
+    def _query_node(
+            self,
+            method: Callable,
+            node_info: NodeName,
+            web3node: Web3Node | None,
+            **kwargs: Any,
+    ) -> tuple[bool, Any]:
+        """Queries the method on a single node and records the call in the node's stats
+
+        Returns whether the result is final and the result. If it's not final the
+        query failed and the next node should be tried.
+        """
+        stats = self.nodes_stats[node_info]
+        start = time.monotonic()
+        try:
+            web3 = web3node.web3_instance if web3node is not None else None
+            result = method(web3, **kwargs)
+        except TransactionNotFound:
+            stats.record(latency=time.monotonic() - start, failed=False)
+            if kwargs.get('must_exist', False) is True:
+                return False, None  # try other nodes, as transaction has to exist
+            return True, None
+        except (
+                RemoteError,
+                requests.exceptions.RequestException,
+                BlockchainQueryError,
+                Web3Exception,
+                ValueError,  # not removing yet due to possibility of raising from missing trie error  # noqa: E501
+        ) as e:
+            stats.record(latency=time.monotonic() - start, failed=True)
+            log.warning(f'Failed to query {node_info} for {method!s} due to {e!s}')
+            # Catch all possible errors here and just try next node call
+            return False, None
+
+        stats.record(latency=time.monotonic() - start, failed=False)
+        return True, result
+
+    def _hedge_delay(self, node_info: NodeName) -> float | None:
+        """Seconds after which a query to the node is also sent to another node.
+        None if there are not enough stats for the node yet"""
+        if (stats := self.nodes_stats.get(node_info)) is None or not stats.has_enough_samples():
+            return None
+        return max(stats.latency_percentile(HEDGE_LATENCY_PERCENTILE), HEDGE_MIN_DELAY)
+
+    def _query_hedged(
+            self,
+            method: Callable,
+            nodes: Sequence[tuple[NodeName, Web3Node | None]],
+            hedge_delay: float,
+            **kwargs: Any,
+    ) -> tuple[bool, Any, bool]:
+        """Queries the first of the two given nodes and if it has not replied after
+        hedge_delay seconds also the second one. The first final result is used.
+
+        Returns whether the result is final, the result and whether the second node
+        was queried.
+        """
+        starts, greenlets = [time.monotonic()], [gevent.spawn(self._query_node, method, *nodes[0], **kwargs)]  # noqa: E501
+        greenlets[0].join(timeout=hedge_delay)
+        if greenlets[0].ready():
+            return (*greenlets[0].get(), False)
+
+        self.nodes_stats[nodes[0][0]].hedged += 1
+        log.debug(
+            f'{nodes[0][0].name} did not reply to {method.__name__} after {hedge_delay:.2f} '
+            f'seconds. Also querying {nodes[1][0].name}',
+        )
+        starts.append(time.monotonic())
+        greenlets.append(gevent.spawn(self._query_node, method, *nodes[1], **kwargs))
+        try:
+            for greenlet in gevent.iwait(greenlets):
+                is_final, result = greenlet.get()
+                if is_final:
+                    return True, result, True
+        finally:
+            for (node_info, _), start, greenlet in zip(nodes, starts, greenlets, strict=True):
+                if not greenlet.ready():
+                    greenlet.kill()
+                    # the node lost the race. The time it took so far is a lower bound of its latency  # noqa: E501
+                    self.nodes_stats[node_info].record(latency=time.monotonic() - start, failed=False)  # noqa: E501
+
+        return False, None, True
+
     def _query(self, method: Callable, call_order: Sequence[WeightedNode], **kwargs: Any) -> Any:
         """Queries evm related data by performing a query of the provided method to all given nodes
 
         The first node in the call order that gets a successful response returns.
         If none get a result then RemoteError is raised
+
+        For the methods in methods_that_can_be_hedged, if a node has not replied after its
+        usual latency the query is also sent to the next web3 node in the call order and
+        the first of the two to reply is used.
         """
+        nodes: list[tuple[NodeName, Web3Node | None]] = []
         for weighted_node in call_order:
             node_info = weighted_node.node_info
             web3node = self.web3_mapping.get(node_info, None)
@@ -526,25 +715,30 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             ):
                 continue
 
-            try:
-                web3 = web3node.web3_instance if web3node is not None else None
-                result = method(web3, **kwargs)
-            except TransactionNotFound:
-                if kwargs.get('must_exist', False) is True:
-                    continue  # try other nodes, as transaction has to exist
-                return None
-            except (
-                    RemoteError,
-                    requests.exceptions.RequestException,
-                    BlockchainQueryError,
-                    Web3Exception,
-                    ValueError,  # not removing yet due to possibility of raising from missing trie error  # noqa: E501
-            ) as e:
-                log.warning(f'Failed to query {node_info} for {method!s} due to {e!s}')
-                # Catch all possible errors here and just try next node call
-                continue
+            nodes.append((node_info, web3node))
+
+        can_hedge = method.__name__ in self.methods_that_can_be_hedged
+        idx = 0
+        while idx < len(nodes):
+            if (
+                can_hedge is False or
+                idx + 1 == len(nodes) or
+                nodes[idx + 1][1] is None or  # don't hedge to etherscan as it's rate limited
+                (hedge_delay := self._hedge_delay(nodes[idx][0])) is None
+            ):
+                is_final, result = self._query_node(method, *nodes[idx], **kwargs)
+                idx += 1
+            else:
+                is_final, result, hedged = self._query_hedged(
+                    method,
+                    nodes[idx:idx + 2],
+                    hedge_delay,
+                    **kwargs,
+                )
+                idx += 2 if hedged else 1
 
-            return result
+            if is_final:
+                return result
 
         # no node in the call order list was successfully queried
         log.error(
@@ -555,6 +749,22 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
             f'Please check your network and confirm sufficient nodes are connected for {self.blockchain!s}.',  # noqa: E501
         )
 
+    def get_nodes_stats(self) -> list[dict[str, Any]]:
+        """Stats of the nodes that were queried or are connected, with their capabilities"""
+        nodes_stats = []
+        for node_info in self.nodes_stats.keys() | self.web3_mapping.keys():
+            web3node = self.web3_mapping.get(node_info)
+            nodes_stats.append({
+                'name': node_info.name,
+                'endpoint': node_info.endpoint,
+                'owned': node_info.owned,
+                'connected': web3node is not None,
+                'is_pruned': web3node.is_pruned if web3node is not None else None,
+                'is_archive': web3node.is_archive if web3node is not None else None,
+            } | self.nodes_stats.get(node_info, NodeStats()).serialize())
+
+        return sorted(nodes_stats, key=operator.itemgetter('name'))
+
     def _get_latest_block_number(self, web3: Web3 | None) -> int:
         if web3 is not None:
             return web3.eth.block_number
@@ -726,36 +936,7 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
 
                 return None  # else it does not exist
 
-            try:
-                # Turn hex numbers to int
-                block_number = int(tx_receipt['blockNumber'], 16)
-                tx_receipt['blockNumber'] = block_number
-                tx_receipt['cumulativeGasUsed'] = int(tx_receipt['cumulativeGasUsed'], 16)
-                tx_receipt['gasUsed'] = int(tx_receipt['gasUsed'], 16)
-                tx_receipt['status'] = int(tx_receipt.get('status', '0x1'), 16)
-                tx_index = int(tx_receipt['transactionIndex'], 16)
-                tx_receipt['transactionIndex'] = tx_index
-                for receipt_log in tx_receipt['logs']:
-                    receipt_log['blockNumber'] = block_number
-                    receipt_log['logIndex'] = deserialize_int_from_hex(
-                        symbol=receipt_log['logIndex'],
-                        location='etherscan tx receipt',
-                    )
-                    receipt_log['transactionIndex'] = tx_index
-                # This is only implemented for some evm chains
-                self._additional_receipt_processing(tx_receipt)
-            except (DeserializationError, Web3Exception, ValueError, KeyError) as e:
-                msg = str(e)
-                if isinstance(e, KeyError):
-                    msg = f'missing key {msg}'
-                log.error(
-                    f'Couldnt deserialize transaction receipt {tx_receipt} data from '
-                    f'etherscan due to {msg}',
-                )
-                raise RemoteError(
-                    f'Couldnt deserialize transaction receipt data from etherscan '
-                    f'due to {msg}. Check logs for details',
-                ) from e
+            tx_receipt = self._process_raw_receipt(tx_receipt=tx_receipt, source='etherscan')
 
             if must_exist and tx_receipt is None:  # fail, so other nodes can be tried
                 raise RemoteError(f'Querying for {self.chain_name} receipt {tx_hash.hex()} returned None')  # noqa: E501
@@ -773,6 +954,148 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
 
         return process_result(tx_receipt)
 
+    def _process_raw_receipt(self, tx_receipt: dict[str, Any], source: str) -> dict[str, Any]:
+        """Turn the hex numbers of a receipt, as returned by the JSON-RPC api, to int
+
+        May raise:
+        - RemoteError if the receipt can't be deserialized
+        """
+        try:
+            # Turn hex numbers to int
+            block_number = int(tx_receipt['blockNumber'], 16)
+            tx_receipt['blockNumber'] = block_number
+            tx_receipt['cumulativeGasUsed'] = int(tx_receipt['cumulativeGasUsed'], 16)
+            tx_receipt['gasUsed'] = int(tx_receipt['gasUsed'], 16)
+            tx_receipt['status'] = int(tx_receipt.get('status', '0x1'), 16)
+            tx_index = int(tx_receipt['transactionIndex'], 16)
+            tx_receipt['transactionIndex'] = tx_index
+            for receipt_log in tx_receipt['logs']:
+                receipt_log['blockNumber'] = block_number
+                receipt_log['logIndex'] = deserialize_int_from_hex(
+                    symbol=receipt_log['logIndex'],
+                    location=f'{source} tx receipt',
+                )
+                receipt_log['transactionIndex'] = tx_index
+            # This is only implemented for some evm chains
+            self._additional_receipt_processing(tx_receipt)
+        except (DeserializationError, Web3Exception, ValueError, KeyError) as e:
+            msg = str(e)
+            if isinstance(e, KeyError):
+                msg = f'missing key {msg}'
+            log.error(
+                f'Couldnt deserialize transaction receipt {tx_receipt} data from '
+                f'{source} due to {msg}',
+            )
+            raise RemoteError(
+                f'Couldnt deserialize transaction receipt data from {source} '
+                f'due to {msg}. Check logs for details',
+            ) from e
+
+        return tx_receipt
+
+    def _query_transaction_receipts_batch(
+            self,
+            node: NodeName,
+            tx_hashes: Sequence[EVMTxHash],
+    ) -> dict[EVMTxHash, dict[str, Any]]:
+        """Query the receipts of the given hashes from the node with a single JSON-RPC
+        batch request. Receipts the node could not give, for example because it's
+        pruned, are not in the result.
+
+        May raise:
+        - RemoteError if the request fails or the node does not support batch requests
+        """
+        try:
+            response = self.session.post(
+                url=node.endpoint,
+                json=[{
+                    'jsonrpc': '2.0',
+                    'id': idx,
+                    'method': 'eth_getTransactionReceipt',
+                    'params': [tx_hash.hex()],
+                } for idx, tx_hash in enumerate(tx_hashes)],
+                timeout=self.rpc_timeout,
+            )
+        except requests.exceptions.RequestException as e:
+            raise RemoteError(f'Batch request failed due to {e!s}') from e
+
+        if response.status_code != 200:
+            raise RemoteError(
+                f'Batch request failed with status {response.status_code} '
+                f'and response {response.text}',
+            )
+
+        try:
+            results = response.json()
+        except JSONDecodeError as e:
+            raise RemoteError(f'Batch request returned invalid JSON {response.text}') from e
+
+        if not isinstance(results, list):  # nodes that don't support batches return an error
+            raise RemoteError(f'Batch request returned unexpected response {response.text}')
+
+        receipts = {}
+        for entry in results:
+            if (
+                    not isinstance(entry, dict) or
+                    not isinstance(idx := entry.get('id'), int) or
+                    not 0 <= idx < len(tx_hashes) or
+                    not isinstance(tx_receipt := entry.get('result'), dict)
+            ):
+                continue  # missing receipts are queried one by one
+
+            with suppress(RemoteError):
+                receipts[tx_hashes[idx]] = self._process_raw_receipt(
+                    tx_receipt=tx_receipt,
+                    source=str(node),
+                )
+
+        return receipts
+
+    def query_transaction_receipts_batches(
+            self,
+            tx_hashes: Sequence[EVMTxHash],
+    ) -> Iterator[tuple[Sequence[EVMTxHash], dict[EVMTxHash, dict[str, Any]]]]:
+        """Query the receipts of the given hashes in JSON-RPC batches of RECEIPTS_BATCH_SIZE
+        spread over the connected non pruned nodes, one batch in flight per node. If owned
+        nodes are connected the batches are only spread over them.
+
+        Yields each batch of hashes with the receipts found for it. Receipts that no node
+        returned are not in the batch result and should be queried one by one with
+        get_transaction_receipt, which can also use etherscan.
+        """
+        nodes = [
+            weighted_node for weighted_node in self.default_call_order(skip_etherscan=True)
+            if (web3node := self.web3_mapping.get(weighted_node.node_info)) is not None and web3node.is_pruned is False  # noqa: E501
+        ]
+        batches = list(get_chunks(tx_hashes, n=RECEIPTS_BATCH_SIZE))
+        if len(nodes) == 0:
+            for batch in batches:
+                yield batch, {}
+            return
+
+        def query_batch(batch_idx: int) -> dict[EVMTxHash, dict[str, Any]]:
+            # start from a different node for each batch and try the others if it fails
+            for weighted_node in _spread_call_order(nodes, batch_idx):
+                node = weighted_node.node_info
+                try:
+                    return self._query_transaction_receipts_batch(node=node, tx_hashes=batches[batch_idx])  # noqa: E501
+                except RemoteError as e:
+                    log.warning(f'Failed to query {self.chain_name} receipts from {node.name} due to {e!s}')  # noqa: E501
+
+            return {}
+
+        concurrency = len(_spread_nodes(nodes))
+        pool = Pool(concurrency)
+        try:
+            for batch, receipts in zip(
+                    batches,
+                    pool.imap(query_batch, range(len(batches)), maxsize=concurrency),
+                    strict=True,
+            ):
+                yield batch, receipts
+        finally:
+            pool.kill()
+
     def maybe_get_transaction_receipt(
             self,
             tx_hash: EVMTxHash,
@@ -1071,21 +1394,61 @@ class EvmNodeInquirer(ABC, LockableQueryMixIn):
     ) -> Any:
         """Uses MULTICALL contract. Failure of one call is a failure of the entire multicall.
         source: https://etherscan.io/address/0xeefBa1e63905eF1D7ACbA5a8513c70307C1cE441#code
+
+        The chunks are queried concurrently from the connected nodes, each chunk starting
+        from a different node. If owned nodes are connected the chunks are only spread over
+        them and the other nodes are only used if they fail. A node is never queried for more
+        than MULTICALL_CHUNKS_PER_NODE chunks at a time. The output keeps the order of the calls.
+
         Can raise:
         - RemoteError
         """
         calls_chunked = list(get_chunks(calls, n=calls_chunk_size))
+        if call_order is None:
+            call_order = self.default_call_order()
+        web3_nodes = [x for x in call_order if x.node_info in self.web3_mapping]
+        other_nodes = [x for x in call_order if x.node_info not in self.web3_mapping]
+
+        def query_chunk(chunk_idx: int) -> list[Any] | RemoteError:
+            error = RemoteError(f'No {self.chain_name} nodes to query the multicall from')
+            chunk_call_order = _spread_call_order(web3_nodes, chunk_idx) if len(web3_nodes) != 0 else []  # noqa: E501
+            # query the nodes one by one so that the limit per node holds for the fallbacks too
+            for node in chunk_call_order + other_nodes:
+                with self.multicall_semaphores[node.node_info]:
+                    try:
+                        _, chunk_output = self.contract_multicall.call(
+                            node_inquirer=self,
+                            method_name='aggregate',
+                            arguments=[calls_chunked[chunk_idx]],
+                            call_order=[node],
+                            block_identifier=block_identifier,
+                        )
+                    except RemoteError as e:
+                        error = e
+                        continue
+
+                return chunk_output
+
+            return error  # raised by the caller since the pool would only log it
+
+        if len(calls_chunked) <= 1 or len(web3_nodes) == 0:  # nothing to spread
+            results: Iterator[list[Any] | RemoteError] = map(query_chunk, range(len(calls_chunked)))  # noqa: E501
+            pool = None
+        else:
+            concurrency = len(_spread_nodes(web3_nodes)) * MULTICALL_CHUNKS_PER_NODE
+            pool = Pool(concurrency)
+            results = pool.imap(query_chunk, range(len(calls_chunked)), maxsize=concurrency)
+
         output = []
-        for call_chunk in calls_chunked:
-            multicall_result = self.contract_multicall.call(
-                node_inquirer=self,
-                method_name='aggregate',
-                arguments=[call_chunk],
-                call_order=call_order,
-                block_identifier=block_identifier,
-            )
-            _, chunk_output = multicall_result
-            output += chunk_output
+        try:
+            for chunk_output in results:
+                if isinstance(chunk_output, RemoteError):
+                    raise chunk_output
+                output += chunk_output
+        finally:
+            if pool is not None:
+                pool.kill()
+
         return output
 
     def multicall_2(
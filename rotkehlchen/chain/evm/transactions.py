@@ -523,11 +523,15 @@ class EvmTransactions(ABC):  # noqa: B024
             cursor: 'DBCursor',
             tx_hash: 'EVMTxHash',
             relevant_address: Optional['ChecksumEvmAddress'],
+            tx_receipt: Optional['EvmTxReceipt'] = None,
     ) -> tuple[tuple[Any, ...], 'EvmTxReceipt']:
         """Makes sure that the required data for the transaction are in the database.
         If not, pulls them and stores them. For most chains this is the transaction and the
         receipt. Can be extended by subclasses for chain-specific information.
 
+        `tx_receipt` can be given if the receipt was already read from the DB, for example
+        in bulk with DBEvmTx.get_receipts, so that it's not read again.
+
         May raise:
         - RemoteError if there is a problem querying the data sources or transaction hash does
         not exist.
@@ -535,7 +539,8 @@ class EvmTransactions(ABC):  # noqa: B024
         query, bindings = EvmTransactionsFilterQuery.make(tx_hash=tx_hash, chain_id=self.evm_inquirer.chain_id).prepare()  # noqa: E501
         query, bindings = self.dbevmtx._form_evm_transaction_dbquery(query=query, bindings=bindings, has_premium=True)  # noqa: E501
         tx_data = cursor.execute(query, bindings).fetchone()
-        tx_receipt = self.dbevmtx.get_receipt(cursor=cursor, tx_hash=tx_hash, chain_id=self.evm_inquirer.chain_id)  # noqa: E501
+        if tx_receipt is None:
+            tx_receipt = self.dbevmtx.get_receipt(cursor=cursor, tx_hash=tx_hash, chain_id=self.evm_inquirer.chain_id)  # noqa: E501
         if tx_receipt is not None:
             return tx_data, tx_receipt  # all good, tx receipt is in the database
 
@@ -614,6 +619,7 @@ class EvmTransactions(ABC):  # noqa: B024
             cursor: 'DBCursor',
             tx_hash: EVMTxHash,
             relevant_address: Optional['ChecksumEvmAddress'],
+            tx_receipt: Optional['EvmTxReceipt'] = None,
     ) -> tuple['EvmTransaction', 'EvmTxReceipt']:
         """Gets an evm transaction and its receipt from the database or
         if it doesn't exist, it pulls it from the data source and stores it in the database.
@@ -621,6 +627,8 @@ class EvmTransactions(ABC):  # noqa: B024
         the corresponding chain transaction are met before returning it. For example an
         evm transaction must have a corresponding receipt entry in the database.
 
+        `tx_receipt` is the receipt of the transaction if it was already read from the DB.
+
         This function can raise:
         - pysqlcipher3.dbapi2.OperationalError if the SQL query fails due to invalid
         filtering arguments.
@@ -634,6 +642,7 @@ class EvmTransactions(ABC):  # noqa: B024
                 cursor=cursor,
                 tx_hash=tx_hash,
                 relevant_address=relevant_address,
+                tx_receipt=tx_receipt,
             )
             evm_tx = self.dbevmtx._build_evm_transaction(tx_data)
 
@@ -725,6 +734,10 @@ class EvmTransactions(ABC):  # noqa: B024
         Searches the database for up to `limit` transactions that have no corresponding receipt
         and for each one of them queries the receipt and saves it in the DB.
 
+        The receipts are queried in JSON-RPC batches spread over the connected nodes and each
+        batch is saved in one DB transaction. Receipts missing from a batch are queried one
+        by one, which can also use etherscan.
+
         It's protected by a lock to not enter the same code twice
         (i.e. from periodic tasks and from pnl report history events gathering)
 
@@ -750,19 +763,23 @@ class EvmTransactions(ABC):  # noqa: B024
             if len(hash_results) == 0:
                 return  # nothing to do
 
-            for entry in hash_results:
-                try:
-                    tx_receipt_data = self.evm_inquirer.get_transaction_receipt(tx_hash=entry)
-                except RemoteError as e:
-                    log.warning(f'Failed to query information for {self.evm_inquirer.chain_name} transaction {entry.hex()} due to {e!s}. Skipping...')  # noqa: E501
-                    continue
+            for batch, receipts in self.evm_inquirer.query_transaction_receipts_batches(hash_results):  # noqa: E501
+                for entry in batch:
+                    if entry in receipts:
+                        continue
+
+                    try:  # not returned by the batch query so query it on its own
+                        receipts[entry] = self.evm_inquirer.get_transaction_receipt(tx_hash=entry)
+                    except RemoteError as e:
+                        log.warning(f'Failed to query information for {self.evm_inquirer.chain_name} transaction {entry.hex()} due to {e!s}. Skipping...')  # noqa: E501
 
                 with self.database.user_write() as write_cursor:
-                    self.dbevmtx.add_or_ignore_receipt_data(
-                        write_cursor=write_cursor,
-                        chain_id=self.evm_inquirer.chain_id,
-                        data=tx_receipt_data,
-                    )
+                    for tx_receipt_data in receipts.values():
+                        self.dbevmtx.add_or_ignore_receipt_data(
+                            write_cursor=write_cursor,
+                            chain_id=self.evm_inquirer.chain_id,
+                            data=tx_receipt_data,
+                        )
 
     def add_transaction_by_hash(
             self,
@@ -1,6 +1,7 @@
 import os
+from collections.abc import Iterable, Iterator
 
-from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import hashes, padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from rotkehlchen.errors.misc import UnableToDecryptRemoteData
@@ -8,26 +9,74 @@ from rotkehlchen.errors.misc import UnableToDecryptRemoteData
 AES_BLOCK_SIZE = 16
 
 
+def _aes_key(key: bytes) -> bytes:
+    """Use SHA-256 over our key to get a proper-sized AES key"""
+    digest = hashes.Hash(hashes.SHA256())
+    digest.update(key)
+    return digest.finalize()
+
+
 # AES encrypt/decrypt taken from here: https://stackoverflow.com/a/44212550/110395
 # and updated to use cryptography library as pyCrypto is deprecated
 # TODO: Perhaps use Fernet instead of this algorithm in the future? The docs of the
 # cryptography library seem to suggest it's the safest options. Problem is the
 # already encrypted and saved database files and how to handle the previous encryption
 # We need to keep a versioning of encryption used for each file.
-def encrypt(key: bytes, source: bytes) -> bytes:
+def encrypt_chunks(key: bytes, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Encrypts the data given in chunks and yields the encrypted data piece by piece
+
+    The random iv is stored at the beginning and the data is padded with PKCS7
+    so that the concatenated output can be decrypted by decrypt().
+    """
     assert isinstance(key, bytes), 'key should be given in bytes'
-    assert isinstance(source, bytes), 'source should be given in bytes'
-    digest = hashes.Hash(hashes.SHA256())
-    digest.update(key)
-    key = digest.finalize()  # use SHA-256 over our key to get a proper-sized AES key
     iv = os.urandom(AES_BLOCK_SIZE)
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
-    encryptor = cipher.encryptor()
-    padding = AES_BLOCK_SIZE - len(source) % AES_BLOCK_SIZE  # calculate needed padding
-    source += bytes([padding]) * padding  # Python 2.x: source += chr(padding) * padding
-    # store the iv at the beginning and encrypt
-    data = iv + (encryptor.update(source) + encryptor.finalize())
-    return data
+    encryptor = Cipher(algorithms.AES(_aes_key(key)), modes.CBC(iv)).encryptor()
+    padder = padding.PKCS7(algorithms.AES.block_size).padder()
+    yield iv
+    for chunk in chunks:
+        yield encryptor.update(padder.update(chunk))
+
+    yield encryptor.update(padder.finalize()) + encryptor.finalize()
+
+
+def decrypt_chunks(key: bytes, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Decrypts data encrypted by encrypt_chunks() or encrypt() given in chunks of any size
+    and yields the decrypted data piece by piece
+
+    The padding is only checked at the end, so the yielded data should not be trusted
+    before the iterator is exhausted. If data can't be decrypted then at that point it
+    raises UnableToDecryptRemoteData
+    """
+    assert isinstance(key, bytes), 'key should be given in bytes'
+    iv, decryptor = b'', None
+    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+    for chunk in chunks:
+        data = chunk
+        if decryptor is None:  # extract the iv from the beginning
+            iv += data
+            if len(iv) < AES_BLOCK_SIZE:
+                continue
+            iv, data = iv[:AES_BLOCK_SIZE], iv[AES_BLOCK_SIZE:]
+            decryptor = Cipher(algorithms.AES(_aes_key(key)), modes.CBC(iv)).decryptor()
+
+        yield unpadder.update(decryptor.update(data))
+
+    try:
+        if decryptor is None:
+            raise ValueError('No iv found')
+        decryptor.finalize()  # raises ValueError if the data is not a multiple of the block size  # noqa: E501
+        yield unpadder.finalize()
+    except ValueError as e:
+        raise UnableToDecryptRemoteData(
+            'Invalid padding when decrypting the DB data we received from the server. '
+            'Are you using a new user and if yes have you used the same password as before? '
+            'If you have then please open a bug report.',
+        ) from e
+
+
+def encrypt(key: bytes, source: bytes) -> bytes:
+    assert isinstance(source, bytes), 'source should be given in bytes'
+    return b''.join(encrypt_chunks(key, [source]))
 
 
 def decrypt(key: bytes, source: bytes) -> bytes:
@@ -37,25 +86,8 @@ def decrypt(key: bytes, source: bytes) -> bytes:
     Returns the decrypted data.
     If data can't be decrypted then raises UnableToDecryptRemoteData
     """
-    assert isinstance(key, bytes), 'key should be given in bytes'
     assert isinstance(source, bytes), 'source should be given in bytes'
-    digest = hashes.Hash(hashes.SHA256())
-    digest.update(key)
-    key = digest.finalize()  # use SHA-256 over our key to get a proper-sized AES key
-    iv = source[:AES_BLOCK_SIZE]  # extract the iv from the beginning
-    cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
-    decryptor = cipher.decryptor()
-
-    data = source[AES_BLOCK_SIZE:]  # decrypt
-    data = decryptor.update(data)
-    padding = data[-1]  # pick the padding value from the end; Python 2.x: ord(data[-1])
-    if data[-padding:] != bytes([padding]) * padding:  # Python 2.x: chr(padding) * padding
-        raise UnableToDecryptRemoteData(
-            'Invalid padding when decrypting the DB data we received from the server. '
-            'Are you using a new user and if yes have you used the same password as before? '
-            'If you have then please open a bug report.',
-        )
-    return data[:-padding]  # remove the padding
+    return b''.join(decrypt_chunks(key, [source]))
 
 
 def sha3(data: bytes) -> bytes:
@@ -4,12 +4,13 @@ import logging
 import shutil
 import tempfile
 import zlib
+from collections.abc import Iterator
 from pathlib import Path
 
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants.misc import USERDB_NAME, USERSDIR_NAME
-from rotkehlchen.crypto import decrypt, encrypt
+from rotkehlchen.crypto import decrypt_chunks, encrypt_chunks
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.errors.api import AuthenticationError
@@ -185,32 +186,47 @@ class DataHandler:
 
         return users
 
-    def compress_and_encrypt_db(self) -> tuple[bytes, str]:
+    def compress_and_encrypt_db(self, skip_if_hash: str | None = None) -> tuple[bytes, str]:
         """Decrypt the DB, dump in temporary plaintextdb, compress it,
         and then re-encrypt it
 
+        The plaintext DB is hashed, compressed and encrypted one chunk at a time
+        so only the encrypted result is ever fully kept in memory.
+
+        If skip_if_hash is given the plaintext DB is hashed first and if the hash is
+        the same then compression and encryption are skipped and the returned data
+        is empty.
+
         Returns a b64 encoded binary blob"""
-        compressor = zlib.compressobj(level=9)
+        hasher, compressor = hashlib.sha256(), zlib.compressobj(level=9)
+        encrypted_data = bytearray()
         with tempfile.NamedTemporaryFile(delete=False, suffix='.db') as tempdbfile:
             tempdbpath = Path(tempdbfile.name)
             log.info(f'Compress and encrypt DB at temporary path: {tempdbpath}')
             tempdbfile.close()  # close the file to allow re-opening by export_unencrypted in windows https://github.com/rotki/rotki/issues/5051  # noqa: E501
             self.db.export_unencrypted(tempdbpath)
-            source_data = bytearray()
-            compressed_data = bytearray()
-            with open(tempdbpath, 'rb') as src_f:
-                block = src_f.read(BUFFERSIZE)
-                while block:
-                    source_data += block
-                    compressed_data += compressor.compress(block)
-                    block = src_f.read(BUFFERSIZE)
-
-                compressed_data += compressor.flush()
-
-        original_data_hash = base64.b64encode(
-            hashlib.sha256(source_data).digest(),
-        ).decode()
-        encrypted_data = encrypt(self.db.password.encode(), bytes(compressed_data))
+            if skip_if_hash is not None:
+                with open(tempdbpath, 'rb') as src_f:
+                    original_data_hash = base64.b64encode(
+                        hashlib.file_digest(src_f, 'sha256').digest(),
+                    ).decode()
+
+                if original_data_hash == skip_if_hash:
+                    tempdbpath.unlink()
+                    return b'', original_data_hash
+
+            def compressed_chunks() -> Iterator[bytes]:
+                with open(tempdbpath, 'rb') as src_f:
+                    while block := src_f.read(BUFFERSIZE):
+                        hasher.update(block)
+                        yield compressor.compress(block)
+
+                yield compressor.flush()
+
+            for chunk in encrypt_chunks(self.db.password.encode(), compressed_chunks()):
+                encrypted_data += chunk
+
+        original_data_hash = base64.b64encode(hasher.digest()).decode()
         # cleanup temp file to avoid windows problem (https://github.com/rotki/rotki/issues/5051)
         tempdbpath.unlink()
         return encrypted_data, original_data_hash
@@ -220,8 +236,12 @@ class DataHandler:
 
         If successful then replace our local Database
 
+        The data is decrypted and decompressed one chunk at a time into a temporary
+        plaintext DB which is then imported.
+
         May Raise:
-        - UnableToDecryptRemoteData due to decrypt()
+        - UnableToDecryptRemoteData due to decrypt_chunks()
+        - zlib.error if the decrypted data can't be decompressed
         - DBUpgradeError if the rotki DB version is newer than the software or
         there is a DB upgrade and there is an error or if the version is older
         than the one supported.
@@ -236,6 +256,31 @@ class DataHandler:
             users_dir / self.username / f'rotkehlchen_db_{date}.backup',
         )
 
-        decrypted_data = decrypt(self.db.password.encode(), encrypted_data)
-        decompressed_data = zlib.decompress(decrypted_data)
-        self.db.import_unencrypted(decompressed_data)
+        encrypted_view = memoryview(encrypted_data)
+        decrypted_chunks = decrypt_chunks(
+            self.db.password.encode(),
+            (encrypted_view[idx:idx + BUFFERSIZE] for idx in range(0, len(encrypted_view), BUFFERSIZE)),  # noqa: E501
+        )
+        decompressor = zlib.decompressobj()
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdirname:  # needed on windows, see https://tinyurl.com/tmp-win-err  # noqa: E501
+            tempdbpath = Path(tmpdirname) / 'temp.db'
+            try:
+                with open(tempdbpath, 'wb') as dst_f:
+                    for chunk in decrypted_chunks:
+                        # limit the output of each step since the data may be compressed a lot
+                        data = chunk
+                        while data:
+                            dst_f.write(decompressor.decompress(data, BUFFERSIZE))
+                            data = decompressor.unconsumed_tail
+
+                    dst_f.write(decompressor.flush())
+                if not decompressor.eof:
+                    raise zlib.error('Error -5 while decompressing data: incomplete or truncated stream')  # noqa: E501
+            except zlib.error:
+                # garbage due to a wrong password is only detected by the final padding
+                # check, so give UnableToDecryptRemoteData priority over the zlib error
+                for _ in decrypted_chunks:
+                    pass
+                raise
+
+            self.db.import_unencrypted(tempdbpath)
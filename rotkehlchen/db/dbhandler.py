@@ -3,7 +3,6 @@ import logging
 import os
 import re
 import shutil
-import tempfile
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager, suppress
@@ -43,6 +42,7 @@ from rotkehlchen.constants.misc import NFT_DIRECTIVE, USERDB_NAME
 from rotkehlchen.constants.timing import HOUR_IN_SECONDS
 from rotkehlchen.db.cache import (
     AddressArgType,
+    BinancePairLastTradeArgsType,
     DBCacheDynamic,
     DBCacheStatic,
     ExtraTxArgType,
@@ -568,8 +568,8 @@ class DBHandler:
                 'DETACH DATABASE plaintext;',
             )
 
-    def import_unencrypted(self, unencrypted_db_data: bytes) -> None:
-        """Imports an unencrypted DB from raw data
+    def import_unencrypted(self, unencrypted_db_path: Path) -> None:
+        """Imports an unencrypted DB from the plaintext DB at the given path
 
         May raise:
         - DBUpgradeError if the rotki DB version is newer than the software or
@@ -587,24 +587,19 @@ class DBHandler:
         )
         rdbpath.unlink()
 
-        # dump the unencrypted data into a temporary file
-        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdirname:  # needed on windows, see https://tinyurl.com/tmp-win-err  # noqa: E501
-            tempdbpath = Path(tmpdirname) / 'temp.db'
-            tempdbpath.write_bytes(unencrypted_db_data)
-
-            # Now attach to the unencrypted DB and copy it to our DB and encrypt it
-            self.conn = DBConnection(
-                path=tempdbpath,
-                connection_type=DBConnectionType.USER,
-                sql_vm_instructions_cb=self.sql_vm_instructions_cb,
-            )
-            password_for_sqlcipher = protect_password_sqlcipher(self.password)
-            script = f'ATTACH DATABASE "{rdbpath}" AS encrypted KEY "{password_for_sqlcipher}";'
-            if self.sqlcipher_version == 3:
-                script += f'PRAGMA encrypted.kdf_iter={KDF_ITER};'
-            script += 'SELECT sqlcipher_export("encrypted");DETACH DATABASE encrypted;'
-            self.conn.executescript(script)
-            self.disconnect()
+        # Now attach to the unencrypted DB and copy it to our DB and encrypt it
+        self.conn = DBConnection(
+            path=unencrypted_db_path,
+            connection_type=DBConnectionType.USER,
+            sql_vm_instructions_cb=self.sql_vm_instructions_cb,
+        )
+        password_for_sqlcipher = protect_password_sqlcipher(self.password)
+        script = f'ATTACH DATABASE "{rdbpath}" AS encrypted KEY "{password_for_sqlcipher}";'
+        if self.sqlcipher_version == 3:
+            script += f'PRAGMA encrypted.kdf_iter={KDF_ITER};'
+        script += 'SELECT sqlcipher_export("encrypted");DETACH DATABASE encrypted;'
+        self.conn.executescript(script)
+        self.disconnect()
 
         try:
             self._connect()
@@ -726,6 +721,24 @@ class DBHandler:
     ) -> int | None:
         ...
 
+    @overload
+    def get_dynamic_cache(
+            self,
+            cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.BINANCE_PAIR_LAST_ID],
+            **kwargs: Unpack[BinancePairLastTradeArgsType],
+    ) -> int | None:
+        ...
+
+    @overload
+    def get_dynamic_cache(
+            self,
+            cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.BINANCE_PAIR_LAST_TS],
+            **kwargs: Unpack[BinancePairLastTradeArgsType],
+    ) -> Timestamp | None:
+        ...
+
     @overload
     def get_dynamic_cache(
             self,
@@ -806,6 +819,26 @@ class DBHandler:
     ) -> None:
         ...
 
+    @overload
+    def set_dynamic_cache(
+            self,
+            write_cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.BINANCE_PAIR_LAST_ID],
+            value: int,
+            **kwargs: Unpack[BinancePairLastTradeArgsType],
+    ) -> None:
+        ...
+
+    @overload
+    def set_dynamic_cache(
+            self,
+            write_cursor: 'DBCursor',
+            name: Literal[DBCacheDynamic.BINANCE_PAIR_LAST_TS],
+            value: Timestamp,
+            **kwargs: Unpack[BinancePairLastTradeArgsType],
+    ) -> None:
+        ...
+
     @overload
     def set_dynamic_cache(
             self,
@@ -2037,10 +2070,16 @@ class DBHandler:
         """
         with self.conn.read_ctx() as cursor:
             movements = self.get_asset_movements(cursor, filter_query=filter_query, has_premium=has_premium)  # noqa: E501
-            query, bindings = filter_query.prepare(with_pagination=False)
-            query = 'SELECT COUNT(*) from asset_movements ' + query
-            total_found_result = cursor.execute(query, bindings)
-            return movements, total_found_result.fetchone()[0]
+            return movements, self.get_asset_movements_count(cursor, filter_query=filter_query)
+
+    def get_asset_movements_count(
+            self,
+            cursor: 'DBCursor',
+            filter_query: AssetMovementsFilterQuery,
+    ) -> int:
+        """Returns how many asset movements match the filter ignoring pagination"""
+        query, bindings = filter_query.prepare(with_pagination=False, with_order=False)
+        return cursor.execute('SELECT COUNT(*) from asset_movements ' + query, bindings).fetchone()[0]  # noqa: E501
 
     def get_asset_movements(
             self,
@@ -2052,6 +2091,21 @@ class DBHandler:
 
         Returned list is ordered according to the passed filter query
         """
+        return list(self.iterate_asset_movements(
+            cursor,
+            filter_query=filter_query,
+            has_premium=has_premium,
+        ))
+
+    def iterate_asset_movements(
+            self,
+            cursor: 'DBCursor',
+            filter_query: AssetMovementsFilterQuery,
+            has_premium: bool,
+    ) -> Iterator[AssetMovement]:
+        """Same as get_asset_movements but deserializes the movements lazily while the
+        cursor is read. The cursor should not be used for anything else until iteration finishes.
+        """
         query, bindings = filter_query.prepare()
         if has_premium:
             query = 'SELECT * from asset_movements ' + query
@@ -2060,7 +2114,6 @@ class DBHandler:
             query = 'SELECT * FROM (SELECT * from asset_movements ORDER BY timestamp DESC LIMIT ?) ' + query  # noqa: E501
             results = cursor.execute(query, [FREE_ASSET_MOVEMENTS_LIMIT] + bindings)
 
-        asset_movements = []
         for result in results:
             try:
                 movement = AssetMovement.deserialize_from_db(result)
@@ -2076,9 +2129,7 @@ class DBHandler:
                     f'Unknown asset {e.identifier} found',
                 )
                 continue
-            asset_movements.append(movement)
-
-        return asset_movements
+            yield movement
 
     def get_entries_count(
             self,
@@ -2273,15 +2324,27 @@ class DBHandler:
         Also returns how many are the total found for the filter
         """
         trades = self.get_trades(cursor, filter_query=filter_query, has_premium=has_premium)
-        query, bindings = filter_query.prepare(with_pagination=False)
-        query = 'SELECT COUNT(*) from trades ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return trades, total_found_result.fetchone()[0]
+        return trades, self.get_trades_count(cursor, filter_query=filter_query)
+
+    def get_trades_count(self, cursor: 'DBCursor', filter_query: TradesFilterQuery) -> int:
+        """Returns how many trades match the filter ignoring pagination"""
+        query, bindings = filter_query.prepare(with_pagination=False, with_order=False)
+        return cursor.execute('SELECT COUNT(*) from trades ' + query, bindings).fetchone()[0]
 
     def get_trades(self, cursor: 'DBCursor', filter_query: TradesFilterQuery, has_premium: bool) -> list[Trade]:  # noqa: E501
         """Returns a list of trades optionally filtered by various filters.
 
         The returned list is ordered according to the passed filter query"""
+        return list(self.iterate_trades(cursor, filter_query=filter_query, has_premium=has_premium))  # noqa: E501
+
+    def iterate_trades(
+            self,
+            cursor: 'DBCursor',
+            filter_query: TradesFilterQuery,
+            has_premium: bool,
+    ) -> Iterator[Trade]:
+        """Same as get_trades but deserializes the trades lazily while the cursor is read.
+        The cursor should not be used for anything else until iteration finishes."""
         query, bindings = filter_query.prepare()
         if has_premium:
             query = 'SELECT * from trades ' + query
@@ -2290,7 +2353,6 @@ class DBHandler:
             query = 'SELECT * FROM (SELECT * from trades ORDER BY timestamp DESC LIMIT ?) ' + query
             results = cursor.execute(query, [FREE_TRADES_LIMIT] + bindings)
 
-        trades = []
         for result in results:
             try:
                 trade = Trade.deserialize_from_db(result)
@@ -2305,9 +2367,7 @@ class DBHandler:
                     f'Unknown asset {e.identifier} found',
                 )
                 continue
-            trades.append(trade)
-
-        return trades
+            yield trade
 
     def delete_trades(self, write_cursor: 'DBCursor', trades_ids: list[str]) -> None:
         """Removes trades from the database using their `trade_id`.
@@ -3162,7 +3222,8 @@ class DBHandler:
         for acc_idx in (0, 1):
             query = cursor.execute(
                 'SELECT derived_index from xpub_mappings WHERE xpub=? AND '
-                'derivation_path IS ? AND account_index=? AND blockchain = ?;',
+                'derivation_path IS ? AND account_index=? AND blockchain = ? '
+                'ORDER BY derived_index;',
                 (
                     xpub_data.xpub.xpub,
                     xpub_data.serialize_derivation_path_for_db(),
@@ -163,6 +163,36 @@ class DBCursor:
         self._cursor.close()
 
 
+class DBRowsTrackingCursor(DBCursor):
+    """Wraps a cursor to keep the number of rows read since the last executed statement
+    and the last of them, even if the caller skips some of the rows it reads.
+    Closing is left to the wrapped cursor."""
+
+    def __init__(self, cursor: DBCursor) -> None:
+        super().__init__(connection=cursor.connection, cursor=cursor._cursor)
+        self.rows_num = 0
+        self.last_row: Any = None
+
+    def execute(self, statement: str, *bindings: Sequence) -> 'DBRowsTrackingCursor':
+        self.rows_num, self.last_row = 0, None
+        super().execute(statement, *bindings)
+        return self
+
+    def __next__(self) -> Any:
+        result = super().__next__()
+        self.rows_num += 1
+        self.last_row = result
+        return result
+
+    def last_row_columns(self) -> dict[str, Any]:
+        """Returns the last row read as a mapping of its column names to values.
+        Should only be called after a row was read"""
+        return dict(zip([x[0] for x in self._cursor.description], self.last_row, strict=True))
+
+    def close(self) -> None:
+        pass
+
+
 class DBConnectionType(Enum):
     USER = auto()
     TRANSIENT = auto()
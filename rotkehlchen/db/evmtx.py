@@ -1,5 +1,6 @@
 import logging
-from typing import TYPE_CHECKING, Any, get_args
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Final, get_args
 
 from pysqlcipher3 import dbapi2 as sqlcipher
 
@@ -37,6 +38,7 @@ from rotkehlchen.types import (
     deserialize_evm_tx_hash,
 )
 from rotkehlchen.utils.hexbytes import hexstring_to_bytes
+from rotkehlchen.utils.misc import get_chunks
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -51,6 +53,23 @@ TRANSACTIONS_MISSING_DECODING_QUERY = (
     'evmtx_receipts AS A LEFT OUTER JOIN evm_tx_mappings AS B ON A.tx_id=B.tx_id '
     'LEFT JOIN evm_transactions AS C on A.tx_id=C.identifier '
 )
+TOPIC_SIZE: Final = 32
+RECEIPTS_QUERY_CHUNK_SIZE: Final = 500  # limit num of hashes in a query
+
+
+def _pack_topics(topics: list[bytes]) -> bytes:
+    """Concatenate the topics of a log to store them in a single column.
+
+    May raise:
+    - DeserializationError if a topic does not have the expected size
+    """
+    if any(len(topic) != TOPIC_SIZE for topic in topics):
+        raise DeserializationError(f'Got log topics {topics} that are not all {TOPIC_SIZE} bytes')
+    return b''.join(topics)
+
+
+def _unpack_topics(packed_topics: bytes) -> list[bytes]:
+    return [packed_topics[i:i + TOPIC_SIZE] for i in range(0, len(packed_topics), TOPIC_SIZE)]
 
 
 class DBEvmTx:
@@ -371,32 +390,18 @@ class DBEvmTx:
                 raise
             return  # otherwise something else added the receipt so we continue
 
-        for log_entry in data['logs']:
-            write_cursor.execute(
-                'INSERT INTO evmtx_receipt_logs (tx_id, log_index, data, address, removed) '
-                'VALUES(? ,? ,? ,? ,?)',
-                (
-                    tx_id,
-                    log_entry['logIndex'],
-                    hexstring_to_bytes(log_entry['data']),
-                    deserialize_evm_address(log_entry['address']),
-                    int(log_entry['removed']),
-                ),
-            )
-            log_id = write_cursor.lastrowid
-            topic_tuples = []
-            for idx, topic in enumerate(log_entry['topics']):
-                topic_tuples.append((
-                    log_id,
-                    hexstring_to_bytes(topic),
-                    idx,
-                ))
-            if len(topic_tuples) != 0:
-                write_cursor.executemany(
-                    'INSERT INTO evmtx_receipt_log_topics (log, topic, topic_index) '
-                    'VALUES(? ,? ,?)',
-                    topic_tuples,
-                )
+        write_cursor.executemany(
+            'INSERT INTO evmtx_receipt_logs (tx_id, log_index, data, address, removed, topics) '
+            'VALUES(? ,? ,? ,? ,? ,?)',
+            [(
+                tx_id,
+                log_entry['logIndex'],
+                hexstring_to_bytes(log_entry['data']),
+                deserialize_evm_address(log_entry['address']),
+                int(log_entry['removed']),
+                _pack_topics([hexstring_to_bytes(topic) for topic in log_entry['topics']]),
+            ) for log_entry in data['logs']],
+        )
 
     def get_receipt(
             self,
@@ -405,49 +410,61 @@ class DBEvmTx:
             chain_id: ChainID,
     ) -> EvmTxReceipt | None:
         """Get the evm receipt for the given tx_hash and chain id"""
+        return self.get_receipts(cursor=cursor, tx_hashes=[tx_hash], chain_id=chain_id).get(tx_hash)  # noqa: E501
+
+    def get_receipts(
+            self,
+            cursor: 'DBCursor',
+            tx_hashes: Sequence[EVMTxHash],
+            chain_id: ChainID,
+    ) -> dict[EVMTxHash, EvmTxReceipt]:
+        """Get the evm receipts for the given tx_hashes and chain id. Hashes whose receipt
+        is not in the DB are not in the returned mapping.
+
+        Receipts and their logs are loaded with a constant number of queries per chunk
+        of hashes, no matter how many logs the transactions have.
+        """
+        receipts: dict[EVMTxHash, EvmTxReceipt] = {}
         chain_id_serialized = chain_id.serialize_for_db()
-        result = cursor.execute(
-            'SELECT identifier from evm_transactions WHERE tx_hash=? AND chain_id=?',
-            (tx_hash, chain_id_serialized),
-        ).fetchone()
-        if result is None:
-            return None
-        tx_id = result[0]
-        result = cursor.execute(
-            'SELECT contract_address, status, type from evmtx_receipts WHERE tx_id=?',
-            (tx_id,),
-        ).fetchone()
-        if result is None:
-            return None
+        for hashes_chunk in get_chunks(tx_hashes, n=RECEIPTS_QUERY_CHUNK_SIZE):
+            tx_filter = f'TX.chain_id=? AND TX.tx_hash IN ({",".join(["?"] * len(hashes_chunk))})'
+            bindings = (chain_id_serialized, *hashes_chunk)
+            chunk_receipts: dict[int, EvmTxReceipt] = {}
+            cursor.execute(
+                'SELECT TX.identifier, TX.tx_hash, R.contract_address, R.status, R.type '
+                'FROM evm_transactions TX INNER JOIN evmtx_receipts R ON TX.identifier=R.tx_id '
+                f'WHERE {tx_filter}',
+                bindings,
+            )
+            for result in cursor:
+                tx_receipt = EvmTxReceipt(
+                    tx_hash=deserialize_evm_tx_hash(result[1]),
+                    chain_id=chain_id,
+                    contract_address=result[2],
+                    status=bool(result[3]),  # works since value is either 0 or 1
+                    tx_type=result[4],
+                )
+                chunk_receipts[result[0]] = receipts[tx_receipt.tx_hash] = tx_receipt
 
-        tx_receipt = EvmTxReceipt(
-            tx_hash=tx_hash,
-            chain_id=chain_id,
-            contract_address=result[0],
-            status=bool(result[1]),  # works since value is either 0 or 1
-            tx_type=result[2],
-        )
+            if len(chunk_receipts) == 0:
+                continue
 
-        cursor.execute(
-            'SELECT identifier, log_index, data, address, removed from evmtx_receipt_logs WHERE tx_id=?',  # noqa: E501
-            (tx_id,))
-        with self.db.conn.read_ctx() as other_cursor:
+            cursor.execute(
+                'SELECT L.tx_id, L.log_index, L.data, L.address, L.removed, L.topics '
+                'FROM evmtx_receipt_logs L INNER JOIN evm_transactions TX ON TX.identifier=L.tx_id '  # noqa: E501
+                f'WHERE {tx_filter} ORDER BY L.tx_id, L.log_index',
+                bindings,
+            )
             for result in cursor:
-                tx_receipt_log = EvmTxReceiptLog(
+                chunk_receipts[result[0]].logs.append(EvmTxReceiptLog(
                     log_index=result[1],
                     data=result[2],
                     address=result[3],
                     removed=bool(result[4]),  # works since value is either 0 or 1
-                )
-                other_cursor.execute(
-                    'SELECT topic from evmtx_receipt_log_topics '
-                    'WHERE log=? ORDER BY topic_index ASC',
-                    (result[0],),
-                )
-                tx_receipt_log.topics = [x[0] for x in other_cursor]
-                tx_receipt.logs.append(tx_receipt_log)
+                    topics=_unpack_topics(result[5]),
+                ))
 
-        return tx_receipt
+        return receipts
 
     def delete_transactions(
             self,
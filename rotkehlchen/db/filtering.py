@@ -1,9 +1,11 @@
+import base64
+import json
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Generic, Literal, NamedTuple, TypeVar
+from typing import Any, ClassVar, Generic, Literal, NamedTuple, TypeVar
 
 from rotkehlchen.accounting.types import SchemaEventType
 from rotkehlchen.api.v1.types import IncludeExcludeFilterData
@@ -96,6 +98,77 @@ class DBFilterPagination(NamedTuple):
         return f'LIMIT {self.limit} OFFSET {self.offset}'
 
 
+class DBFilterKeysetPagination(NamedTuple):
+    """Pagination that continues right after the last entry of the previous page instead
+    of skipping a number of entries, so that getting a deep page costs the same as the first.
+
+    `rules` are the columns the entries are ordered by along with their direction. The last
+    one has to be unique so that the order is total. `after` are the values of those columns
+    for the last entry of the previous page or None for the first page.
+    """
+    limit: int
+    rules: list[tuple[str, bool]]
+    after: list[Any] | None
+
+    def prepare_condition(self) -> tuple[str, list[Any]]:
+        """Returns the condition selecting the entries after `after` in the order of `rules`"""
+        if self.after is None:
+            return '', []
+
+        # the first column's bound is repeated on its own so that it can be used by an index
+        first_column, first_ascending = self.rules[0]
+        conditions, bindings = [], [self.after[0]]
+        for idx, (column, ascending) in enumerate(self.rules):
+            conditions.append('(' + ' AND '.join(
+                [f'{x} = ?' for x, _ in self.rules[:idx]] + [f'{column} {">" if ascending else "<"} ?'],  # noqa: E501
+            ) + ')')
+            bindings.extend(self.after[:idx + 1])
+
+        return f'({first_column} {">=" if first_ascending else "<="} ? AND ({" OR ".join(conditions)}))', bindings  # noqa: E501
+
+    def prepare_order(self) -> str:
+        return DBFilterOrder(rules=self.rules, case_sensitive=True).prepare()
+
+    def serialize_cursor(self, values: list[Any]) -> str:
+        """Returns the opaque cursor pointing after the entry with the given values of
+        the ordering columns, that can be used to get the next page"""
+        data = json.dumps({'rules': self.rules, 'after': values}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @classmethod
+    def deserialize_cursor(
+            cls: type['DBFilterKeysetPagination'],
+            limit: int,
+            rules: list[tuple[str, bool]],
+            cursor: str | None,
+    ) -> 'DBFilterKeysetPagination':
+        """Creates the pagination for the page after the entry the cursor points to or for
+        the first page if no cursor is given.
+
+        May raise:
+        - DeserializationError if the cursor is invalid or was created for another order
+        """
+        if cursor is None:
+            return cls(limit=limit, rules=rules, after=None)
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            cursor_rules, after = data['rules'], data['after']
+        except (ValueError, TypeError, KeyError) as e:  # binascii.Error is a ValueError
+            raise DeserializationError(f'Invalid pagination cursor {cursor}') from e
+
+        if cursor_rules != [list(x) for x in rules]:
+            raise DeserializationError('The pagination cursor was created for a different order')
+
+        if (
+                not isinstance(after, list) or len(after) != len(rules) or
+                not all(isinstance(x, int | str) for x in after)
+        ):
+            raise DeserializationError(f'Invalid pagination cursor {cursor}')
+
+        return cls(limit=limit, rules=rules, after=after)
+
+
 class DBFilterGroupBy(NamedTuple):
     field_name: str
 
@@ -305,7 +378,12 @@ class DBFilterQuery(ABC):
     join_clause: DBFilter | None = None
     group_by: DBFilterGroupBy | None = None
     order_by: DBFilterOrder | None = None
-    pagination: DBFilterPagination | None = None
+    pagination: DBFilterPagination | DBFilterKeysetPagination | None = None
+    # Rules appended to the order of the query to make it total for keyset pagination.
+    # The last one has to be a unique column. Empty if keyset pagination is not supported.
+    keyset_tiebreak_rules: ClassVar[tuple[tuple[str, bool], ...]] = ()
+    # The attribute of the returned entries that holds the value of each keyset column
+    keyset_attributes: ClassVar[dict[str, str]] = {}
 
     def prepare(
             self,
@@ -347,22 +425,33 @@ class DBFilterQuery(ABC):
             filterstrings.append(f'({operator.join(filters)})')
             bindings.extend(single_bindings)
 
-        if len(filterstrings) != 0:
+        keyset_condition = ''
+        if with_pagination and isinstance(self.pagination, DBFilterKeysetPagination):
+            keyset_condition, keyset_bindings = self.pagination.prepare_condition()
+            bindings.extend(keyset_bindings)
+
+        if len(filterstrings) != 0 or keyset_condition != '':
             operator = ' AND ' if self.and_op else ' OR '
-            filter_query = f'{"WHERE " if self.join_clause is None else "AND ("}{operator.join(filterstrings)}{"" if self.join_clause is None else ")"}'  # noqa: E501
+            conditions = operator.join(filterstrings)
+            if keyset_condition != '':
+                conditions = keyset_condition if conditions == '' else f'({conditions}) AND {keyset_condition}'  # noqa: E501
+            filter_query = f'{"WHERE " if self.join_clause is None else "AND ("}{conditions}{"" if self.join_clause is None else ")"}'  # noqa: E501
             query_parts.append(filter_query)
 
         if with_group_by and self.group_by is not None:
             groupby_query = self.group_by.prepare()
             query_parts.append(groupby_query)
 
-        if with_order and self.order_by is not None:
-            orderby_query = self.order_by.prepare()
-            query_parts.append(orderby_query)
+        if with_pagination and isinstance(self.pagination, DBFilterKeysetPagination):
+            query_parts.extend((self.pagination.prepare_order(), f'LIMIT {self.pagination.limit}'))
+        else:
+            if with_order and self.order_by is not None:
+                orderby_query = self.order_by.prepare()
+                query_parts.append(orderby_query)
 
-        if with_pagination and self.pagination is not None:
-            pagination_query = self.pagination.prepare()
-            query_parts.append(pagination_query)
+            if with_pagination and isinstance(self.pagination, DBFilterPagination):
+                pagination_query = self.pagination.prepare()
+                query_parts.append(pagination_query)
 
         return ' '.join(query_parts), bindings
 
@@ -397,6 +486,53 @@ class DBFilterQuery(ABC):
             pagination=pagination,
         )
 
+    def keyset_rules(self) -> list[tuple[str, bool]] | None:
+        """Returns the order rules to use for keyset pagination or None if the query
+        does not support it with its current order"""
+        if len(self.keyset_tiebreak_rules) == 0 or self.order_by is None:
+            return None
+
+        columns = [column for column, _ in self.order_by.rules]
+        if not all(column in self.keyset_attributes for column in columns):
+            return None  # can only continue after an entry by the values of these columns
+
+        return self.order_by.rules + [x for x in self.keyset_tiebreak_rules if x[0] not in columns]
+
+    def set_keyset_pagination(self, limit: int, cursor: str | None) -> None:
+        """Paginates the query by keyset, starting after the entry the cursor points to
+        or from the first entry if no cursor is given.
+
+        May raise:
+        - InvalidFilter if the query does not support keyset pagination with its order
+        - DeserializationError if the cursor is invalid
+        """
+        if (rules := self.keyset_rules()) is None:
+            raise InvalidFilter('Pagination by cursor is not supported for the requested order')
+
+        self.pagination = DBFilterKeysetPagination.deserialize_cursor(
+            limit=limit,
+            rules=rules,
+            cursor=cursor,
+        )
+
+    def next_page_cursor(self, entries: Sequence[Any]) -> str | None:
+        """Returns the cursor for the page after the given entries of a keyset paginated
+        query or None if there are no more pages"""
+        if not isinstance(self.pagination, DBFilterKeysetPagination) or len(entries) < self.pagination.limit:  # noqa: E501
+            return None
+
+        return self.pagination.serialize_cursor(self._keyset_values(entries[-1]))
+
+    def paginate_after_row(self, row: dict[str, Any]) -> None:
+        """Moves the keyset pagination of the query to the page right after the given row
+        of its results, given as a mapping of column names to values"""
+        assert isinstance(self.pagination, DBFilterKeysetPagination), 'query is not keyset paginated'  # noqa: E501
+        self.pagination = self.pagination._replace(after=[row[column] for column, _ in self.pagination.rules])  # noqa: E501
+
+    def _keyset_values(self, entry: Any) -> list[Any]:
+        assert isinstance(self.pagination, DBFilterKeysetPagination)
+        return [getattr(entry, self.keyset_attributes[column]) for column, _ in self.pagination.rules]  # noqa: E501
+
 
 class FilterWithTimestamp:
 
@@ -626,6 +762,8 @@ class DBOptionalChainAddressesFilter(DBFilter):
 
 
 class TradesFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
+    keyset_tiebreak_rules = (('id', True),)
+    keyset_attributes: ClassVar[dict[str, str]] = {'timestamp': 'timestamp', 'id': 'identifier'}
 
     @classmethod
     def make(
@@ -714,6 +852,8 @@ class TradesFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
 
 
 class AssetMovementsFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
+    keyset_tiebreak_rules = (('id', True),)
+    keyset_attributes: ClassVar[dict[str, str]] = {'timestamp': 'timestamp', 'id': 'identifier'}
 
     @classmethod
     def make(
@@ -898,6 +1038,12 @@ class HistoryEventCustomizedOnlyJoinsFilter(DBFilter):
 
 
 class HistoryBaseEntryFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation, ABC):
+    keyset_tiebreak_rules = (('sequence_index', True), ('history_events_identifier', True))
+    keyset_attributes: ClassVar[dict[str, str]] = {
+        'timestamp': 'timestamp',
+        'sequence_index': 'sequence_index',
+        'history_events_identifier': 'identifier',
+    }
 
     @classmethod
     def make(
@@ -1038,6 +1184,19 @@ class HistoryBaseEntryFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWith
         filter_query.filters = filters
         return filter_query
 
+    def get_entry_types(self) -> set[HistoryBaseEntryType]:
+        """Returns the entry types of the events that the query's filters can match"""
+        entry_types = set(HistoryBaseEntryType)
+        if self.and_op is False:
+            return entry_types
+
+        for fil in self.filters:
+            if isinstance(fil, DBMultiIntegerFilter) and fil.column == 'entry_type':
+                values = {HistoryBaseEntryType(x) for x in fil.values}
+                entry_types = entry_types & values if fil.operator == 'IN' else entry_types - values  # noqa: E501
+
+        return entry_types
+
     @staticmethod
     @abstractmethod
     def get_join_query() -> str:
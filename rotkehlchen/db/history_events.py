@@ -1,7 +1,7 @@
 import copy
 import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Any, Literal, Optional, overload
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -24,6 +24,8 @@ from rotkehlchen.db.filtering import (
     ALL_EVENTS_DATA_JOIN,
     EVM_EVENT_JOIN,
     DBEqualsFilter,
+    DBFilterKeysetPagination,
+    DBFilterPagination,
     DBIgnoredAssetsFilter,
     DBIgnoreValuesFilter,
     EthDepositEventFilterQuery,
@@ -32,6 +34,7 @@ from rotkehlchen.db.filtering import (
     HistoryBaseEntryFilterQuery,
     HistoryEventFilterQuery,
 )
+from rotkehlchen.db.utils import iterate_in_keyset_pages
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
@@ -64,6 +67,76 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+HISTORY_EVENTS_PAGE_SIZE = 1000
+
+
+# entry types of the events that have a row in the evm_events_info table
+EVM_INFO_ENTRY_TYPES = {HistoryBaseEntryType.EVM_EVENT, HistoryBaseEntryType.ETH_DEPOSIT_EVENT}
+# entry types of the events that have a row in the eth_staking_events_info table
+ETH_STAKING_INFO_ENTRY_TYPES = {
+    HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT,
+    HistoryBaseEntryType.ETH_BLOCK_EVENT,
+    HistoryBaseEntryType.ETH_DEPOSIT_EVENT,
+}
+
+
+def history_events_columns_and_joins(entry_types: set[HistoryBaseEntryType]) -> str:
+    """Returns the columns and joins to select history events of the given entry types.
+
+    The info tables that no event of the given types has a row in are not joined and their
+    columns are selected as NULL, same as the LEFT JOIN would give. So the rows always have
+    the same layout and filters on those columns still work.
+    """
+    columns, joins = [HISTORY_BASE_ENTRY_FIELDS], ['FROM history_events']
+    for info_entry_types, fields, table in (
+            (EVM_INFO_ENTRY_TYPES, EVM_EVENT_FIELDS, 'evm_events_info'),
+            (ETH_STAKING_INFO_ENTRY_TYPES, ETH_STAKING_EVENT_FIELDS, 'eth_staking_events_info'),
+    ):
+        if entry_types.isdisjoint(info_entry_types):
+            columns.append(', '.join(f'NULL AS {x.strip()}' for x in fields.split(',')))
+        else:
+            columns.append(fields)
+            joins.append(f'LEFT JOIN {table} ON history_events.identifier={table}.identifier')
+
+    return f'{", ".join(columns)} {" ".join(joins)} '
+
+
+def _deserialize_evm_event_row(row: tuple) -> EvmEvent:
+    return EvmEvent.deserialize_from_db(row[:HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + 1])
+
+
+def _eth_staking_event_row_data(row: tuple) -> tuple:
+    return (
+        row[:4] + row[5:6] + row[7:9] + row[11:12] +
+        row[HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH:HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + ETH_STAKING_FIELD_LENGTH + 1]  # noqa: E501
+    )
+
+
+def _deserialize_eth_withdrawal_event_row(row: tuple) -> EthWithdrawalEvent:
+    return EthWithdrawalEvent.deserialize_from_db(_eth_staking_event_row_data(row))
+
+
+def _deserialize_eth_block_event_row(row: tuple) -> EthBlockEvent:
+    return EthBlockEvent.deserialize_from_db(_eth_staking_event_row_data(row))
+
+
+def _deserialize_eth_deposit_event_row(row: tuple) -> EthDepositEvent:
+    return EthDepositEvent.deserialize_from_db(
+        row[:4] + row[5:6] + row[7:9] +
+        row[HISTORY_BASE_ENTRY_LENGTH:HISTORY_BASE_ENTRY_LENGTH + 1] +
+        row[HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH:HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + 1],  # noqa: E501
+    )
+
+
+# Constructors of each type of event from a row of the history events query without its
+# leading entry type. Types not in here are plain history events.
+ROW_DESERIALIZERS: dict[HistoryBaseEntryType, Callable[[tuple], HistoryBaseEntry]] = {
+    HistoryBaseEntryType.EVM_EVENT: _deserialize_evm_event_row,
+    HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT: _deserialize_eth_withdrawal_event_row,
+    HistoryBaseEntryType.ETH_BLOCK_EVENT: _deserialize_eth_block_event_row,
+    HistoryBaseEntryType.ETH_DEPOSIT_EVENT: _deserialize_eth_deposit_event_row,
+}
+
 
 def filter_ignore_asset_query(include_ignored_assets: bool = False) -> str:
     """Create and return the subquery to filter ignored assets. If `include_ignored_assets`
@@ -328,8 +401,9 @@ class DBHistoryEvents:
             has_premium: bool,
             group_by_event_ids: bool = False,
     ) -> tuple[str, list]:
-        """Returns the sql queries and bindings for the history events without pagination."""
-        base_suffix = f'{HISTORY_BASE_ENTRY_FIELDS}, {EVM_EVENT_FIELDS}, {ETH_STAKING_EVENT_FIELDS} {ALL_EVENTS_DATA_JOIN}'  # noqa: E501
+        """Returns the sql queries and bindings for the history events. Offset pagination
+        is not included and should be applied by wrapping the query."""
+        base_suffix = history_events_columns_and_joins(filter_query.get_entry_types())
         if (ignore_asset_filter := maybe_filter_ignore_asset(filter_query, include_ignored_assets=True)) != '':  # noqa: E501
             ignore_asset_filter = (
                 f' WHERE event_identifier NOT IN '
@@ -348,7 +422,10 @@ class DBHistoryEvents:
         else:
             suffix, limit = free_base_suffix, [entries_limit]
 
+        keyset_pagination = isinstance(filter_query.pagination, DBFilterKeysetPagination)
         if group_by_event_ids:
+            # the cursor condition could only be applied after grouping all the events
+            assert keyset_pagination is False, 'Grouped events can not be paginated by keyset'
             filters, query_bindings = filter_query.prepare(
                 with_group_by=True,
                 with_pagination=False,
@@ -356,7 +433,9 @@ class DBHistoryEvents:
             )
             prefix = 'SELECT COUNT(*), *'
         else:
-            filters, query_bindings = filter_query.prepare(with_pagination=False)
+            # keyset pagination goes in the filters so that the cursor condition can use the
+            # timestamp index instead of being applied after reading all the events
+            filters, query_bindings = filter_query.prepare(with_pagination=keyset_pagination)
             prefix = 'SELECT *'
 
         return f'{prefix} FROM (SELECT {suffix}) {filters}', limit + query_bindings
@@ -445,8 +524,7 @@ class DBHistoryEvents:
     ):
         """Get all events from the DB, deserialized depending on the event type
 
-        TODO: To not query all columns with all joins for all cases, we perhaps can
-        peek on the entry type of the filter and adjust the SELECT fields accordingly?
+        Only the info tables of the entry types the filter can match are joined.
         """
         base_query, filters_bindings = self._create_history_events_query(
             has_premium=has_premium,
@@ -455,63 +533,85 @@ class DBHistoryEvents:
             entries_limit=FREE_HISTORY_EVENTS_LIMIT,
         )
 
-        if filter_query.pagination is not None:
+        if isinstance(filter_query.pagination, DBFilterPagination):
             base_query = f'SELECT * FROM ({base_query}) {filter_query.pagination.prepare()}'
 
         cursor.execute(base_query, filters_bindings)
-        output: list[HistoryBaseEntry] | list[tuple[int, HistoryBaseEntry]] = []
+        return list(self._deserialize_history_events(  # type: ignore[return-value]  # the type depends on the filter query
+            entries=cursor,
+            group_by_event_ids=group_by_event_ids,
+        ))
+
+    def iterate_history_events(
+            self,
+            cursor: 'DBCursor',
+            filter_query: HistoryBaseEntryFilterQuery,
+            has_premium: bool,
+    ) -> Iterator[HistoryBaseEntry]:
+        """Same as get_history_events without grouping but deserializes the events lazily
+        while the cursor is read. The cursor should not be used for anything else
+        until iteration finishes."""
+        base_query, filters_bindings = self._create_history_events_query(
+            has_premium=has_premium,
+            filter_query=filter_query,
+            entries_limit=FREE_HISTORY_EVENTS_LIMIT,
+        )
+        if isinstance(filter_query.pagination, DBFilterPagination):
+            base_query = f'SELECT * FROM ({base_query}) {filter_query.pagination.prepare()}'
+
+        cursor.execute(base_query, filters_bindings)
+        yield from self._deserialize_history_events(entries=cursor, group_by_event_ids=False)  # type: ignore[misc]  # not grouped so only events are yielded
+
+    def iterate_history_events_in_pages(
+            self,
+            filter_query: HistoryBaseEntryFilterQuery,
+            has_premium: bool,
+            page_size: int = HISTORY_EVENTS_PAGE_SIZE,
+    ) -> Iterator[list[HistoryBaseEntry]]:
+        """Reads the events of the filter query in pages of up to page_size events,
+        continuing after the last row of each page. Each page is read in its own short read
+        so that no cursor stays open on the shared connection between pages.
+
+        May raise:
+        - InvalidFilter if the order of the filter query does not support keyset pagination
+        """
+        yield from iterate_in_keyset_pages(
+            connection=self.db.conn,
+            filter_query=filter_query,
+            page_size=page_size,
+            read_page=lambda cursor, filter_query: self.iterate_history_events(
+                cursor=cursor,
+                filter_query=filter_query,
+                has_premium=has_premium,
+            ),
+        )
+
+    def _deserialize_history_events(
+            self,
+            entries: Iterable[tuple],
+            group_by_event_ids: bool,
+    ) -> Iterator[HistoryBaseEntry | tuple[int, HistoryBaseEntry]]:
+        """Deserialize the rows of the history events query depending on the event type.
+        Rows that fail to deserialize are skipped and reported once at the end."""
         type_idx = 1 if group_by_event_ids else 0
         data_start_idx = type_idx + 1
         failed_to_deserialize = False
-        for entry in cursor:
+        for entry in entries:
             entry_type = HistoryBaseEntryType(entry[type_idx])
             try:
-                deserialized_event: HistoryEvent | (EvmEvent | (EthWithdrawalEvent | EthBlockEvent))  # noqa: E501
-                # Deserialize event depending on its type
-                if entry_type == HistoryBaseEntryType.EVM_EVENT:
-                    data = (
-                        entry[data_start_idx:data_start_idx + HISTORY_BASE_ENTRY_LENGTH + 1] +
-                        entry[data_start_idx + HISTORY_BASE_ENTRY_LENGTH + 1:data_start_idx + HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + 1]    # noqa: E501
-                    )
-                    deserialized_event = EvmEvent.deserialize_from_db(data)
-                elif entry_type in (
-                        HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT,
-                        HistoryBaseEntryType.ETH_BLOCK_EVENT,
-                ):
-                    data = (
-                        entry[data_start_idx:data_start_idx + 4] +
-                        entry[data_start_idx + 5:data_start_idx + 6] +
-                        entry[data_start_idx + 7:data_start_idx + 9] +
-                        entry[data_start_idx + 11:data_start_idx + 12] +
-                        entry[data_start_idx + HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH:data_start_idx + HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + ETH_STAKING_FIELD_LENGTH + 1]  # noqa: E501
-                    )
-                    if entry_type == HistoryBaseEntryType.ETH_WITHDRAWAL_EVENT:
-                        deserialized_event = EthWithdrawalEvent.deserialize_from_db(data)
-                    else:
-                        deserialized_event = EthBlockEvent.deserialize_from_db(data)
-
-                elif entry_type == HistoryBaseEntryType.ETH_DEPOSIT_EVENT:
-                    data = (
-                        entry[data_start_idx:data_start_idx + 4] +
-                        entry[data_start_idx + 5:data_start_idx + 6] +
-                        entry[data_start_idx + 7:data_start_idx + 9] +
-                        entry[data_start_idx + HISTORY_BASE_ENTRY_LENGTH:data_start_idx + HISTORY_BASE_ENTRY_LENGTH + 1] +  # noqa: E501
-                        entry[data_start_idx + HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH:data_start_idx + HISTORY_BASE_ENTRY_LENGTH + EVM_FIELD_LENGTH + 1]  # noqa: E501
-                    )
-                    deserialized_event = EthDepositEvent.deserialize_from_db(data)
-
+                if (deserializer := ROW_DESERIALIZERS.get(entry_type)) is not None:
+                    deserialized_event = deserializer(entry[data_start_idx:])
                 else:
-                    data = entry[data_start_idx:]
-                    deserialized_event = HistoryEvent.deserialize_from_db(data)
+                    deserialized_event = HistoryEvent.deserialize_from_db(entry[data_start_idx:])
             except (DeserializationError, UnknownAsset) as e:
                 log.error(f'Failed to deserialize history event {entry} due to {e!s}')
                 failed_to_deserialize = True
                 continue
 
             if group_by_event_ids is True:
-                output.append((entry[0], deserialized_event))  # type: ignore
+                yield entry[0], deserialized_event
             else:
-                output.append(deserialized_event)  # type: ignore
+                yield deserialized_event
 
         if failed_to_deserialize:
             self.db.msg_aggregator.add_error(
@@ -519,8 +619,6 @@ class DBHistoryEvents:
                 'Try redecoding the event(s) or check the logs for more details.',
             )
 
-        return output
-
     @overload
     def get_history_events_and_limit_info(
             self,
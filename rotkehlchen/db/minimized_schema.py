@@ -20,8 +20,7 @@ MINIMIZED_USER_DB_SCHEMA = {
     "optimism_transactions": "tx_idintegernotnullprimarykey,l1_feetext,foreignkey(tx_id)referencesevm_transactions(identifier)ondeletecascadeonupdatecascade",
     "evm_internal_transactions": "parent_txintegernotnull,trace_idintegernotnull,from_addresstextnotnull,to_addresstext,valuetextnotnull,foreignkey(parent_tx)referencesevm_transactions(identifier)ondeletecascadeonupdatecascade,primarykey(parent_tx,trace_id,from_address,to_address,value)",
     "evmtx_receipts": "tx_idintegernotnullprimarykey,contract_addresstext,statusintegernotnullcheck(statusin(0,1)),typeintegernotnull,foreignkey(tx_id)referencesevm_transactions(identifier)ondeletecascadeonupdatecascade",
-    "evmtx_receipt_logs": "identifierintegernotnullprimarykey,tx_idintegernotnull,log_indexintegernotnull,datablobnotnull,addresstextnotnull,removedintegernotnullcheck(removedin(0,1)),foreignkey(tx_id)referencesevmtx_receipts(tx_id)ondeletecascadeonupdatecascade,unique(tx_id,log_index)",
-    "evmtx_receipt_log_topics": "logintegernotnull,topicblobnotnull,topic_indexintegernotnull,foreignkey(log)referencesevmtx_receipt_logs(identifier)ondeletecascadeonupdatecascade,primarykey(log,topic_index)",
+    "evmtx_receipt_logs": "identifierintegernotnullprimarykey,tx_idintegernotnull,log_indexintegernotnull,datablobnotnull,addresstextnotnull,removedintegernotnullcheck(removedin(0,1)),topicsblobnotnulldefaultx'',foreignkey(tx_id)referencesevmtx_receipts(tx_id)ondeletecascadeonupdatecascade,unique(tx_id,log_index)",
     "evmtx_address_mappings": "tx_idintegernotnull,addresstextnotnull,foreignkey(tx_id)referencesevm_transactions(identifier)onupdatecascadeondeletecascade,primarykey(tx_id,address)",
     "zksynclite_tx_type": "typechar(1)primarykeynotnull,seqintegerunique",
     "zksynclite_transactions": "identifierintegernotnullprimarykey,tx_hashblobnotnullunique,typechar(1)notnulldefault('a')referenceszksynclite_tx_type(type),is_decodedintegernotnulldefault0check(is_decodedin(0,1)),timestampintegernotnull,block_numberintegernotnull,from_addresstextnotnull,to_addresstext,assettextnotnull,amounttextnotnull,feetext,foreignkey(asset)referencesassets(identifier)onupdatecascade",
@@ -295,3 +295,61 @@ class DBAccountingReports:
             entries=records,
             with_limit=with_limit,
         )
+
+
+class DBAccountingCheckpoints:
+    """Access to the accounting checkpoints kept in the transient DB"""
+
+    def __init__(self, database: 'DBHandler'):
+        self.db = database
+
+    def add_checkpoint(
+            self,
+            settings_hash: str,
+            timestamp: Timestamp,
+            events_num: int,
+            events_hash: str,
+            state: str,
+    ) -> None:
+        """Save a checkpoint. Checkpoints taken with different settings are deleted since
+        they can't be used by reports made with the current ones."""
+        with self.db.transient_write() as cursor:
+            cursor.execute(
+                'DELETE FROM accounting_checkpoints WHERE settings_hash != ?',
+                (settings_hash,),
+            )
+            cursor.execute(
+                'INSERT OR REPLACE INTO accounting_checkpoints(settings_hash, timestamp, '
+                'events_num, events_hash, state) VALUES(?, ?, ?, ?, ?)',
+                (settings_hash, timestamp, events_num, events_hash, state),
+            )
+
+    def get_checkpoints(
+            self,
+            settings_hash: str,
+            to_timestamp: Timestamp,
+    ) -> list[tuple[Timestamp, int, str]]:
+        """Get timestamp, number of events and events hash of the checkpoints
+        taken with the given settings up to the given timestamp in ascending order"""
+        with self.db.conn_transient.read_ctx() as cursor:
+            return cursor.execute(
+                'SELECT timestamp, events_num, events_hash FROM accounting_checkpoints '
+                'WHERE settings_hash=? AND timestamp <= ? ORDER BY timestamp ASC',
+                (settings_hash, to_timestamp),
+            ).fetchall()
+
+    def get_checkpoint_state(self, settings_hash: str, timestamp: Timestamp) -> str | None:
+        with self.db.conn_transient.read_ctx() as cursor:
+            result = cursor.execute(
+                'SELECT state FROM accounting_checkpoints WHERE settings_hash=? AND timestamp=?',
+                (settings_hash, timestamp),
+            ).fetchone()
+        return None if result is None else result[0]
+
+    def delete_checkpoints(self, from_timestamp: Timestamp | None = None) -> None:
+        """Delete all checkpoints taken at or after the given timestamp or all of them"""
+        with self.db.transient_write() as cursor:
+            cursor.execute(
+                'DELETE FROM accounting_checkpoints WHERE timestamp >= ?',
+                (from_timestamp or 0,),
+            )
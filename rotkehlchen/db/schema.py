@@ -430,21 +430,12 @@ CREATE TABLE IF NOT EXISTS evmtx_receipt_logs (
     data BLOB NOT NULL,
     address TEXT NOT NULL,
     removed INTEGER NOT NULL CHECK (removed IN (0, 1)),
+    topics BLOB NOT NULL DEFAULT X'',  /* all topics of the log concatenated. Each one is 32 bytes */
     FOREIGN KEY(tx_id) REFERENCES evmtx_receipts(tx_id) ON DELETE CASCADE ON UPDATE CASCADE,
     UNIQUE(tx_id, log_index)
 );
 """  # noqa: E501
 
-DB_CREATE_EVMTX_RECEIPT_LOG_TOPICS = """
-CREATE TABLE IF NOT EXISTS evmtx_receipt_log_topics (
-    log INTEGER NOT NULL,
-    topic BLOB NOT NULL,
-    topic_index INTEGER NOT NULL,
-    FOREIGN KEY(log) REFERENCES evmtx_receipt_logs(identifier) ON DELETE CASCADE ON UPDATE CASCADE,
-    PRIMARY KEY(log, topic_index)
-);
-"""
-
 DB_CREATE_EVMTX_ADDRESS_MAPPINGS = """
 CREATE TABLE IF NOT EXISTS evmtx_address_mappings (
     tx_id INTEGER NOT NULL,
@@ -780,7 +771,6 @@ BEGIN TRANSACTION;
 {DB_CREATE_EVM_INTERNAL_TRANSACTIONS}
 {DB_CREATE_EVMTX_RECEIPTS}
 {DB_CREATE_EVMTX_RECEIPT_LOGS}
-{DB_CREATE_EVMTX_RECEIPT_LOG_TOPICS}
 {DB_CREATE_EVMTX_ADDRESS_MAPPINGS}
 {DB_CREATE_ZKSYNCLITE_TX_TYPE}
 {DB_CREATE_ZKSYNCLITE_TRANSACTIONS}
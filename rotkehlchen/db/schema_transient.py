@@ -47,6 +47,18 @@ CREATE TABLE IF NOT EXISTS pnl_events (
 );
 """
 
+# Snapshots of the accounting state from which PnL reports can resume processing
+DB_CREATE_ACCOUNTING_CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS accounting_checkpoints (
+    settings_hash TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    events_num INTEGER NOT NULL,
+    events_hash TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY(settings_hash, timestamp)
+);
+"""
+
 DB_CREATE_SETTINGS = """
 CREATE TABLE IF NOT EXISTS settings (
     name VARCHAR[24] NOT NULL PRIMARY KEY,
@@ -61,6 +73,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_REPORT_SETTINGS}
 {DB_CREATE_REPORT_TOTALS}
 {DB_CREATE_PNL_EVENTS}
+{DB_CREATE_ACCOUNTING_CHECKPOINTS}
 {DB_CREATE_SETTINGS}
 COMMIT;
 PRAGMA foreign_keys=on;
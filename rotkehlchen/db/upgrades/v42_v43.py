@@ -1,6 +1,8 @@
 import logging
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from rotkehlchen.constants.misc import AIRDROPSDIR_NAME, APPDIR_NAME
 from rotkehlchen.db.constants import (
@@ -19,6 +21,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+TOPICS_UPDATE_BATCH_SIZE: Final = 10000
+
 
 @enter_exit_debug_log()
 def _add_usd_price_nft_table(write_cursor: 'DBCursor') -> None:
@@ -90,6 +94,30 @@ def _reset_decoded_events(write_cursor: 'DBCursor') -> None:
         )
 
 
+@enter_exit_debug_log()
+def _pack_receipt_log_topics(write_cursor: 'DBCursor', read_cursor: 'DBCursor') -> None:
+    """Store all the topics of a log concatenated in a column of the logs table and
+    drop the topics table. All topics stored so far are 32 bytes long.
+
+    The topics table can have millions of rows so it is read and written in batches."""
+    write_cursor.execute(
+        "ALTER TABLE evmtx_receipt_logs ADD COLUMN topics BLOB NOT NULL DEFAULT X'';",
+    )
+    read_cursor.execute(
+        'SELECT log, topic FROM evmtx_receipt_log_topics ORDER BY log, topic_index',
+    )
+    updates: list[tuple[bytes, int]] = []
+    for log_id, entries in groupby(read_cursor, key=itemgetter(0)):
+        updates.append((b''.join(entry[1] for entry in entries), log_id))
+        if len(updates) == TOPICS_UPDATE_BATCH_SIZE:
+            write_cursor.executemany('UPDATE evmtx_receipt_logs SET topics=? WHERE identifier=?', updates)  # noqa: E501
+            updates = []
+
+    if len(updates) != 0:
+        write_cursor.executemany('UPDATE evmtx_receipt_logs SET topics=? WHERE identifier=?', updates)  # noqa: E501
+    write_cursor.execute('DROP TABLE evmtx_receipt_log_topics')
+
+
 @enter_exit_debug_log(name='UserDB v42->v43 upgrade')
 def upgrade_v42_to_v43(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHandler') -> None:
     """Upgrades the DB from v42 to v43. This was in v1.34 release.
@@ -100,9 +128,10 @@ def upgrade_v42_to_v43(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
     - remove coinbasepro credentials
     - remove CSVs files since they will be replaced by parquet files
     - reset decoded evm events except for zksync lite and custom ones
+    - store the topics of the evm receipt logs in the logs table and drop the topics table
     """
-    progress_handler.set_total_steps(6)
-    with db.user_write() as write_cursor:
+    progress_handler.set_total_steps(7)
+    with db.user_write() as write_cursor, db.conn.read_ctx() as read_cursor:
         _add_usd_price_nft_table(write_cursor)
         progress_handler.new_step()
         _change_hop_counterparty_value(write_cursor)
@@ -115,3 +144,5 @@ def upgrade_v42_to_v43(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
         progress_handler.new_step()
         _reset_decoded_events(write_cursor)
         progress_handler.new_step()
+        _pack_receipt_log_topics(write_cursor=write_cursor, read_cursor=read_cursor)
+        progress_handler.new_step()
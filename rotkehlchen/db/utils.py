@@ -1,5 +1,5 @@
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from functools import wraps
 from operator import attrgetter
@@ -23,7 +23,7 @@ from rotkehlchen.assets.asset import Asset, AssetWithOracles
 from rotkehlchen.chain.accounts import BlockchainAccountData
 from rotkehlchen.chain.substrate.utils import is_valid_substrate_address
 from rotkehlchen.db.checks import db_script_normalizer
-from rotkehlchen.db.drivers.gevent import DBCursor
+from rotkehlchen.db.drivers.gevent import DBCursor, DBRowsTrackingCursor
 from rotkehlchen.fval import FVal
 from rotkehlchen.types import (
     AssetMovementCategory,
@@ -40,9 +40,13 @@ if TYPE_CHECKING:
     from rotkehlchen.balances.manual import ManuallyTrackedBalance
     from rotkehlchen.chain.bitcoin.xpub import XpubData
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.drivers.gevent import DBConnection
+    from rotkehlchen.db.filtering import DBFilterQuery
 
 P = ParamSpec('P')
+T = TypeVar('T')
 T_co = TypeVar('T_co', covariant=True)
+T_FilterQ = TypeVar('T_FilterQ', bound='DBFilterQuery')
 
 
 class MaybeInjectWriteCursor(Protocol[P, T_co]):
@@ -411,6 +415,38 @@ def table_exists(cursor: 'DBCursor', name: str, schema: str | None = None) -> bo
     return exists
 
 
+def iterate_in_keyset_pages(
+        connection: 'DBConnection',
+        filter_query: T_FilterQ,
+        page_size: int,
+        read_page: Callable[['DBCursor', T_FilterQ], Iterable[T]],
+) -> Iterator[list[T]]:
+    """Reads the entries of the filter query with read_page in pages of page_size rows,
+    continuing after the last row of each page. Each page is read in its own short read
+    so that no cursor stays open on the shared connection between pages.
+
+    Pages go by the rows read and not by the entries returned, since read_page skips the
+    rows that fail to deserialize. That way no row is read twice and reading only stops
+    at a page with less rows than page_size. Pages without any entry are not returned.
+
+    May raise:
+    - InvalidFilter if the order of the filter query does not support keyset pagination
+    """
+    filter_query.set_keyset_pagination(limit=page_size, cursor=None)
+    while True:
+        with connection.read_ctx() as cursor:
+            page_cursor = DBRowsTrackingCursor(cursor)
+            entries = list(read_page(page_cursor, filter_query))
+
+        if len(entries) != 0:
+            yield entries
+
+        if page_cursor.rows_num < page_size:
+            break
+
+        filter_query.paginate_after_row(page_cursor.last_row_columns())
+
+
 DBTupleType = Literal[
     'trade',
     'asset_movement',
@@ -10,11 +10,14 @@ class NoPriceForGivenTimestamp(Exception):
             to_asset: Asset,
             time: Timestamp,
             rate_limited: bool = False,
+            oracles_unavailable: bool = False,
     ) -> None:
         self.from_asset = from_asset
         self.to_asset = to_asset
         self.time = time
         self.rate_limited = rate_limited
+        # True if an oracle was skipped or failed so the price may be found later
+        self.oracles_unavailable = oracles_unavailable
         super().__init__(
             'Unable to query a historical price for "{}" to "{}" at {}'.format(
                 from_asset.identifier,
@@ -3,6 +3,7 @@ import hmac
 import json
 import logging
 import operator
+import time
 from collections import defaultdict
 from contextlib import suppress
 from json.decoder import JSONDecodeError
@@ -12,12 +13,14 @@ from urllib.parse import urlencode
 
 import gevent
 import requests
+from gevent.pool import Pool
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.assets.asset import AssetWithOracles
 from rotkehlchen.assets.converters import asset_from_binance
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_USD
+from rotkehlchen.db.cache import DBCacheDynamic
 from rotkehlchen.db.constants import BINANCE_MARKETS_KEY
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.ranges import DBQueryRanges
@@ -97,6 +100,10 @@ V3_METHODS: Final = (
 PUBLIC_METHODS: Final = ('exchangeInfo', 'time')
 
 RETRY_AFTER_LIMIT: Final = 60
+# Request weight used per minute after which we wait for the next minute. 80% of the limits
+# https://developers.binance.com/docs/binance-spot-api-docs/rest-api/limits
+REQUEST_WEIGHT_LIMITS: Final = {Location.BINANCE: 4800, Location.BINANCEUS: 960}
+TRADES_QUERY_CONCURRENCY: Final = 4  # markets whose trades are queried at the same time
 # Binance api error codes we check for (all below apis seem to have the same)
 # https://binance-docs.github.io/apidocs/spot/en/#error-codes-2
 # https://binance-docs.github.io/apidocs/futures/en/#error-codes-2
@@ -229,6 +236,9 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
         self.msg_aggregator = msg_aggregator
         self.offset_ms = 0
         self.selected_pairs = binance_selected_trade_pairs
+        # request weight used in the current minute as reported by the api
+        self.used_weight = 0
+        self.used_weight_minute = 0
 
     def first_connection(self) -> None:
         if self.first_connection_made:
@@ -339,6 +349,8 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                 ).hexdigest()
                 call_options['signature'] = signature
 
+            if api_type == 'api':
+                self._wait_for_request_weight()
             api_subdomain = api_type if is_new_futures_api else 'api'
             request_url = (
                 f'https://{api_subdomain}.{self.uri}{api_type}/v{api_version!s}/{method}'
@@ -356,6 +368,11 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                     f'{self.name} API request failed due to {e!s}',
                 ) from e
 
+            if (used_weight := response.headers.get('x-mbx-used-weight-1m')) is not None:
+                with suppress(ValueError):
+                    self.used_weight = int(used_weight)
+                    self.used_weight_minute = int(time.time()) // 60
+
             if response.status_code not in {200, 418, 429}:
                 code = 'no code found'
                 msg = 'no message found'
@@ -421,6 +438,17 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
             ) from e
         return json_ret
 
+    def _wait_for_request_weight(self) -> None:
+        """If the request weight used in the current minute is close to the limit wait
+        for the next minute, when it resets, so that concurrent queries don't get banned"""
+        now = time.time()
+        if (
+                int(now) // 60 == self.used_weight_minute and
+                self.used_weight >= REQUEST_WEIGHT_LIMITS[self.location]
+        ):
+            log.debug(f'{self.name} used {self.used_weight} request weight. Waiting for next minute')  # noqa: E501
+            gevent.sleep(60 - now % 60)
+
     def api_query_dict(
             self,
             api_type: BINANCE_API_TYPE,
@@ -1136,29 +1164,25 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
         )
         return dict(returned_balances), ''
 
-    def query_online_trade_history(
+    def _query_market_trades(
             self,
-            start_ts: Timestamp,
+            symbol: str,
+            from_id: int,
             end_ts: Timestamp,
-    ) -> tuple[list[Trade], tuple[Timestamp, Timestamp]]:
-        """
+    ) -> tuple[list[dict[str, Any]], tuple[int, Timestamp] | None] | RemoteError:
+        """Query all trades of a market starting from the trade with id `from_id`
 
-        May raise due to api query and unexpected id:
-        - RemoteError
-        - BinancePermissionError
+        Returns the raw trades and the cursor to resume from in the next query. That is
+        the id after the last trade up to `end_ts` and that trade's timestamp, or None if
+        no such trade was found. Runs in a pool so any RemoteError (including
+        BinancePermissionError) is returned and not raised.
         """
-        self.first_connection()
-        if self.selected_pairs is not None:
-            iter_markets = list(set(self.selected_pairs).intersection(set(self._symbols_to_pair.keys())))  # noqa: E501
-        else:
-            iter_markets = list(self._symbols_to_pair.keys())
-
-        raw_data = []
+        raw_data: list[dict[str, Any]] = []
+        new_cursor, cursor_stopped = None, False
         # Limit of results to return. 1000 is max limit according to docs
         limit = 1000
-        for symbol in iter_markets:
-            last_trade_id = 0
-            len_result = limit
+        last_trade_id, len_result = from_id, limit
+        try:
             while len_result == limit:
                 # We know that myTrades returns a list from the api docs
                 result = self.api_query_list(
@@ -1171,22 +1195,115 @@ class Binance(ExchangeInterface, ExchangeWithExtras):
                         # Not specifying them since binance does not seem to
                         # respect them and always return all trades
                     })
-                if result:
+                len_result = len(result)
+                log.debug(f'{self.name} myTrades query result', results_num=len_result)
+                for r in result:
+                    r['symbol'] = symbol
                     try:
-                        last_trade_id = int(result[-1]['id']) + 1
-                    except (ValueError, KeyError, IndexError) as e:
+                        last_trade_id = int(r['id']) + 1
+                    except (ValueError, KeyError, TypeError) as e:
                         raise RemoteError(
                             f'Could not parse id from Binance myTrades api query result: {result}',
                         ) from e
 
-                len_result = len(result)
-                log.debug(f'{self.name} myTrades query result', results_num=len_result)
-                for r in result:
-                    r['symbol'] = symbol
+                    if cursor_stopped:
+                        continue
+                    try:
+                        trade_ts = ts_ms_to_sec(r['time'])
+                    except (KeyError, TypeError):
+                        # don't move the cursor past a trade we can't place in time
+                        cursor_stopped = True
+                        continue
+                    if trade_ts <= end_ts:
+                        new_cursor = (last_trade_id, trade_ts)
+                    else:
+                        cursor_stopped = True
                 raw_data.extend(result)
+        except RemoteError as e:
+            return e
 
-            raw_data.sort(key=operator.itemgetter('time'))
+        return raw_data, new_cursor
+
+    def query_online_trade_history(
+            self,
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+    ) -> tuple[list[Trade], tuple[Timestamp, Timestamp]]:
+        """
+
+        May raise due to api query and unexpected id:
+        - RemoteError
+        - BinancePermissionError
+        """
+        self.first_connection()
+        if self.selected_pairs is not None:
+            iter_markets = list(set(self.selected_pairs).intersection(set(self._symbols_to_pair.keys())))  # noqa: E501
+        else:
+            iter_markets = list(self._symbols_to_pair.keys())
+
+        cursors: dict[str, tuple[int, Timestamp]] = {}
+        with self.db.conn.read_ctx() as cursor:
+            for symbol in iter_markets:
+                last_trade_id = self.db.get_dynamic_cache(
+                    cursor=cursor,
+                    name=DBCacheDynamic.BINANCE_PAIR_LAST_ID,
+                    location=self.location.serialize(),
+                    location_name=self.name,
+                    queried_pair=symbol,
+                )
+                last_trade_ts = self.db.get_dynamic_cache(
+                    cursor=cursor,
+                    name=DBCacheDynamic.BINANCE_PAIR_LAST_TS,
+                    location=self.location.serialize(),
+                    location_name=self.name,
+                    queried_pair=symbol,
+                )
+                # only resume from the cursor if all trades before it are outside the range
+                if last_trade_id is not None and last_trade_ts is not None and last_trade_ts < start_ts:  # noqa: E501
+                    cursors[symbol] = (last_trade_id, last_trade_ts)
+
+        pool = Pool(TRADES_QUERY_CONCURRENCY)
+        raw_data: list[dict[str, Any]] = []
+        new_cursors: dict[str, tuple[int, Timestamp]] = {}
+        for symbol, result in zip(iter_markets, pool.imap(
+                lambda symbol: self._query_market_trades(
+                    symbol=symbol,
+                    from_id=cursors.get(symbol, (0, Timestamp(0)))[0],
+                    end_ts=end_ts,
+                ),
+                iter_markets,
+                maxsize=TRADES_QUERY_CONCURRENCY,
+        ), strict=True):
+            if isinstance(result, RemoteError):
+                pool.kill()
+                raise result
+
+            symbol_trades, symbol_cursor = result
+            raw_data.extend(symbol_trades)
+            if symbol_cursor is not None and symbol_cursor != cursors.get(symbol):
+                new_cursors[symbol] = symbol_cursor
+
+        if len(new_cursors) != 0:
+            with self.db.user_write() as write_cursor:
+                for symbol, (last_trade_id, last_trade_ts) in new_cursors.items():
+                    self.db.set_dynamic_cache(
+                        write_cursor=write_cursor,
+                        name=DBCacheDynamic.BINANCE_PAIR_LAST_ID,
+                        value=last_trade_id,
+                        location=self.location.serialize(),
+                        location_name=self.name,
+                        queried_pair=symbol,
+                    )
+                    self.db.set_dynamic_cache(
+                        write_cursor=write_cursor,
+                        name=DBCacheDynamic.BINANCE_PAIR_LAST_TS,
+                        value=last_trade_ts,
+                        location=self.location.serialize(),
+                        location_name=self.name,
+                        queried_pair=symbol,
+                    )
 
+        raw_data.sort(key=operator.itemgetter('time'))
         trades = []
         for raw_trade in raw_data:
             try:
@@ -1,10 +1,12 @@
 import logging
 from collections import deque
+from collections.abc import Iterator, Sequence
 from json.decoder import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 import gevent
 import requests
+from gevent.pool import Pool
 
 from rotkehlchen.assets.asset import Asset, AssetWithOracles
 from rotkehlchen.constants import ZERO
@@ -53,6 +55,7 @@ from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import ExternalService, Price, Timestamp
 from rotkehlchen.utils.misc import pairwise, set_user_agent, ts_now
 from rotkehlchen.utils.mixins.penalizable_oracle import PenalizablePriceOracleMixin
+from rotkehlchen.utils.network import create_session
 from rotkehlchen.utils.serialization import jsonloads_dict
 
 if TYPE_CHECKING:
@@ -159,6 +162,9 @@ CRYPTOCOMPARE_SPECIAL_CASES_MAPPING = {
 }
 CRYPTOCOMPARE_SPECIAL_CASES = CRYPTOCOMPARE_SPECIAL_CASES_MAPPING.keys()
 CRYPTOCOMPARE_HOURQUERYLIMIT = 2000
+CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY = 4  # pages of a pair queried at the same time
+CRYPTOCOMPARE_BACKFILL_PAIRS_CONCURRENCY = 2  # pairs backfilled at the same time
+CRYPTOCOMPARE_PRICE_MAX_DISTANCE = 3600  # seconds from a cached price that it is still used
 
 
 def _multiply_str_nums(a: str, b: str) -> str:
@@ -198,7 +204,7 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
             service_name=ExternalService.CRYPTOCOMPARE,
         )
         PenalizablePriceOracleMixin.__init__(self)
-        self.session = requests.session()
+        self.session = create_session()
         set_user_agent(self.session)
         self.last_histohour_query_ts = 0
         self.last_rate_limit = 0
@@ -557,9 +563,20 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
         msg = '_get_histohour_data_for_range from_timestamp should be bigger than to_timestamp'
         assert from_timestamp >= to_timestamp, msg
 
-        calculated_history: deque[dict[str, Any]] = deque()
-        end_date = from_timestamp
-        while True:
+        def page_end_dates() -> Iterator[Timestamp]:
+            """The end dates of the pages to query, going backwards in time"""
+            end_date = from_timestamp
+            while True:
+                yield end_date
+                end_date = Timestamp(end_date - (CRYPTOCOMPARE_HOURQUERYLIMIT * 3600))
+                if end_date - to_timestamp <= 3600:
+                    break  # the previous page was the last one
+
+        def query_page(
+                end_date: Timestamp,
+        ) -> tuple[Timestamp, dict[str, Any] | RemoteError | PriceQueryUnsupportedAsset]:
+            """Errors are returned so that they are raised in order and only if the page
+            is needed, since the pages after the end of the available prices may fail"""
             log.debug(
                 'Querying cryptocompare for hourly historical price',
                 from_asset=from_asset,
@@ -567,53 +584,69 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
                 cryptocompare_hourquerylimit=CRYPTOCOMPARE_HOURQUERYLIMIT,
                 end_date=end_date,
             )
-            resp = self.query_endpoint_histohour(
-                from_asset=from_asset,
-                to_asset=to_asset,
-                limit=2000,
-                to_timestamp=end_date,
-            )
-            if all(FVal(x['close']) == ZERO for x in resp['Data']):
-                # all prices zero Means we have reached the end of available prices
-                break
-
-            end_date = Timestamp(end_date - (CRYPTOCOMPARE_HOURQUERYLIMIT * 3600))
-            if end_date != resp['TimeFrom']:
-                # If we get more than we needed, since we are close to the now_ts
-                # then skip all the already included entries
-                diff = abs(end_date - resp['TimeFrom'])
-                # If the start date has less than 3600 secs difference from previous
-                # end date then do nothing. If it has more skip all already included entries
-                if diff >= 3600:
-                    if resp['Data'][diff // 3600]['time'] != end_date:
-                        raise RemoteError(
-                            'Unexpected data format in cryptocompare query_endpoint_histohour. '
-                            'Expected to find the previous date timestamp during '
-                            'cryptocompare historical data fetching',
-                        )
-                    # just add only the part from the previous timestamp and on
-                    resp['Data'] = resp['Data'][diff // 3600:]
-
-            # If last time slot and first new are the same, skip the first new slot
-            last_entry_equal_to_first = (
-                len(calculated_history) != 0 and
-                calculated_history[0]['time'] == resp['Data'][-1]['time']
-            )
-            if last_entry_equal_to_first:
-                resp['Data'] = resp['Data'][:-1]
-            if len(calculated_history) != 0:
-                calculated_history.extendleft(reversed(resp['Data']))
-            else:
-                calculated_history = deque(resp['Data'])
+            try:
+                return end_date, self.query_endpoint_histohour(
+                    from_asset=from_asset,
+                    to_asset=to_asset,
+                    limit=2000,
+                    to_timestamp=end_date,
+                )
+            except (RemoteError, PriceQueryUnsupportedAsset) as e:
+                return end_date, e
 
-            if end_date - to_timestamp <= 3600:
-                # Ending the loop query. Also pop any extra timestamps
-                while (
-                        len(calculated_history) != 0 and
-                        calculated_history[0]['time'] <= to_timestamp
-                ):
-                    calculated_history.popleft()
-                break
+        # The pages are queried concurrently but processed in order. Don't add to the
+        # load if we got rate limited recently
+        concurrency = 1 if self.rate_limited_in_last() else CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY
+        pool = Pool(size=concurrency)
+        calculated_history: deque[dict[str, Any]] = deque()
+        try:
+            for page_end_date, resp in pool.imap(query_page, page_end_dates(), maxsize=concurrency):  # noqa: E501
+                if isinstance(resp, Exception):
+                    raise resp
+
+                if all(FVal(x['close']) == ZERO for x in resp['Data']):
+                    # all prices zero Means we have reached the end of available prices
+                    break
+
+                end_date = Timestamp(page_end_date - (CRYPTOCOMPARE_HOURQUERYLIMIT * 3600))
+                if end_date != resp['TimeFrom']:
+                    # If we get more than we needed, since we are close to the now_ts
+                    # then skip all the already included entries
+                    diff = abs(end_date - resp['TimeFrom'])
+                    # If the start date has less than 3600 secs difference from previous
+                    # end date then do nothing. If it has more skip all already included entries
+                    if diff >= 3600:
+                        if resp['Data'][diff // 3600]['time'] != end_date:
+                            raise RemoteError(
+                                'Unexpected data format in cryptocompare query_endpoint_histohour. '  # noqa: E501
+                                'Expected to find the previous date timestamp during '
+                                'cryptocompare historical data fetching',
+                            )
+                        # just add only the part from the previous timestamp and on
+                        resp['Data'] = resp['Data'][diff // 3600:]
+
+                # If last time slot and first new are the same, skip the first new slot
+                last_entry_equal_to_first = (
+                    len(calculated_history) != 0 and
+                    calculated_history[0]['time'] == resp['Data'][-1]['time']
+                )
+                if last_entry_equal_to_first:
+                    resp['Data'] = resp['Data'][:-1]
+                if len(calculated_history) != 0:
+                    calculated_history.extendleft(reversed(resp['Data']))
+                else:
+                    calculated_history = deque(resp['Data'])
+
+                if end_date - to_timestamp <= 3600:
+                    # Ending the loop query. Also pop any extra timestamps
+                    while (
+                            len(calculated_history) != 0 and
+                            calculated_history[0]['time'] <= to_timestamp
+                    ):
+                        calculated_history.popleft()
+                    break
+        finally:
+            pool.kill()  # stop querying pages that are past the end of the available prices
 
         return calculated_history
 
@@ -672,6 +705,7 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
         - May raise RemoteError if there is a problem reaching the cryptocompare server
         or with reading the response returned by the server
         - May raise UnsupportedAsset if from/to asset is not supported by cryptocompare
+        - May raise PriceQueryUnsupportedAsset if cryptocompare does not know from/to asset
         """
         log.debug(
             'Retrieving historical hour price data from cryptocompare',
@@ -750,6 +784,64 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
         GlobalDBHandler.add_historical_prices(prices)
         self.last_histohour_query_ts = ts_now()  # also save when last query finished
 
+    def query_and_store_historical_data_for_pairs(
+            self,
+            pairs: Sequence[tuple[AssetWithOracles, AssetWithOracles]],
+            timestamp: Timestamp,
+    ) -> None:
+        """Get historical hour price data from cryptocompare for many asset pairs
+        concurrently and populate the global DB
+
+        Failing to query a pair is logged and does not stop the rest of the pairs.
+        """
+        def query_pair(from_asset: AssetWithOracles, to_asset: AssetWithOracles) -> None:
+            try:
+                self.query_and_store_historical_data(
+                    from_asset=from_asset,
+                    to_asset=to_asset,
+                    timestamp=timestamp,
+                )
+            except (RemoteError, UnsupportedAsset, PriceQueryUnsupportedAsset) as e:
+                log.warning(
+                    f'Failed to query cryptocompare historical prices for '
+                    f'{from_asset} / {to_asset} due to {e!s}',
+                )
+
+        pool = Pool(size=CRYPTOCOMPARE_BACKFILL_PAIRS_CONCURRENCY)
+        for from_asset, to_asset in pairs:
+            pool.spawn(query_pair, from_asset=from_asset, to_asset=to_asset)
+        pool.join()
+
+    @staticmethod
+    def query_cached_historical_prices(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamps: list[Timestamp],
+    ) -> list[Price | None]:
+        """Get the prices that query_historical_price would find in the cached cryptocompare
+        prices for each of the given timestamps, reading the DB in bulk. None
+        for the timestamps whose price is not cached and would be queried remotely.
+
+        May raise:
+        - PriceQueryUnsupportedAsset if from/to asset is not known
+        """
+        try:
+            from_asset = from_asset.resolve_to_asset_with_oracles()
+            to_asset = to_asset.resolve_to_asset_with_oracles()
+        except (UnknownAsset, WrongAssetType) as e:
+            raise PriceQueryUnsupportedAsset(e.identifier) from e
+
+        return [
+            entry.price if entry is not None and entry.price != ZERO_PRICE else None
+            for entry in GlobalDBHandler.get_historical_prices_for_pair(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamps=timestamps,
+                max_seconds_distance=CRYPTOCOMPARE_PRICE_MAX_DISTANCE,
+                source=HistoricalPriceOracle.CRYPTOCOMPARE,
+            )
+        ]
+
     def query_historical_price(
             self,
             from_asset: Asset,
@@ -782,7 +874,7 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleWithCoinList
             from_asset=from_asset,
             to_asset=to_asset,
             timestamp=timestamp,
-            max_seconds_distance=3600,
+            max_seconds_distance=CRYPTOCOMPARE_PRICE_MAX_DISTANCE,
             source=HistoricalPriceOracle.CRYPTOCOMPARE,
         )
         if price_cache_entry and price_cache_entry.price != ZERO_PRICE:
@@ -42,6 +42,11 @@ from rotkehlchen.types import (
 )
 from rotkehlchen.utils.data_structures import LRUCacheWithRemove
 from rotkehlchen.utils.misc import hex_or_bytes_to_int, set_user_agent
+from rotkehlchen.utils.network import (
+    create_session,
+    remove_host_rate_limit,
+    set_host_rate_limit,
+)
 from rotkehlchen.utils.serialization import jsonloads_dict
 
 if TYPE_CHECKING:
@@ -50,6 +55,7 @@ if TYPE_CHECKING:
 
 ETHERSCAN_QUERY_LIMIT = 10000
 TRANSACTIONS_BATCH_NUM = 10
+ETHERSCAN_NO_API_KEY_REQUESTS_PER_SECOND = 0.2  # the limit for queries without an api key
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -107,7 +113,8 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
             SupportedBlockchain.SCROLL,
         ) else 'api-'
         self.base_url = base_url
-        self.session = requests.session()
+        self.session = create_session()
+        self.rate_limited = False  # whether the keyless rate limit is applied to the host
         self.warning_given = False
         set_user_agent(self.session)
         self.timestamp_to_block_cache: LRUCacheWithRemove[Timestamp, int] = LRUCacheWithRemove(maxsize=32)  # noqa: E501
@@ -127,6 +134,20 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
         else:  # Polygon POS
             self.earliest_ts = 1590856200
 
+    def _set_rate_limit(self, has_api_key: bool) -> None:
+        """Limit the queries to the rate allowed without an api key if there is none.
+        The limits of api keys depend on their plan so queries with one are not limited
+        and rely on backing off when etherscan reports that the limit is reached."""
+        if (should_limit := has_api_key is False) == self.rate_limited:
+            return  # the limit already follows the api key
+
+        host = f'{self.prefix_url}{self.base_url}'
+        if should_limit:
+            set_host_rate_limit(host=host, requests_per_second=ETHERSCAN_NO_API_KEY_REQUESTS_PER_SECOND)  # noqa: E501
+        else:
+            remove_host_rate_limit(host)
+        self.rate_limited = should_limit
+
     @overload
     def _query(
             self,
@@ -230,6 +251,7 @@ class Etherscan(ExternalServiceWithApiKey, ABC):
                 query_str += f'&{name}={value}'
 
         api_key = self._get_api_key()
+        self._set_rate_limit(has_api_key=api_key is not None)
         if api_key is None:
             if not self.warning_given:
                 self.msg_aggregator.add_message(
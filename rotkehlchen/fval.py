@@ -60,19 +60,19 @@ class FVal:
 
     def __gt__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) == Decimal(1)
+        return self.num > evaluated_other
 
     def __lt__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) == Decimal(-1)
+        return self.num < evaluated_other
 
     def __le__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) in (Decimal(-1), Decimal(0))
+        return self.num <= evaluated_other
 
     def __ge__(self, other: AcceptableFValOtherInput) -> bool:
         evaluated_other = _evaluate_input(other)
-        return self.num.compare_signal(evaluated_other) in (Decimal(1), Decimal(0))
+        return self.num >= evaluated_other
 
     def __eq__(self, other: object) -> bool:
         evaluated_other: Decimal | int
@@ -83,62 +83,62 @@ class FVal:
         else:
             evaluated_other = other
 
-        return self.num.compare_signal(evaluated_other) == Decimal(0)
+        return self.num.compare_signal(evaluated_other).is_zero()
 
     def __add__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__add__(evaluated_other))
+        return _new_fval(self.num.__add__(evaluated_other))
 
     def __sub__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__sub__(evaluated_other))
+        return _new_fval(self.num.__sub__(evaluated_other))
 
     def __mul__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__mul__(evaluated_other))
+        return _new_fval(self.num.__mul__(evaluated_other))
 
     def __truediv__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__truediv__(evaluated_other))
+        return _new_fval(self.num.__truediv__(evaluated_other))
 
     def __floordiv__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__floordiv__(evaluated_other))
+        return _new_fval(self.num.__floordiv__(evaluated_other))
 
     def __pow__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__pow__(evaluated_other))
+        return _new_fval(self.num.__pow__(evaluated_other))
 
     def __radd__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__radd__(evaluated_other))
+        return _new_fval(self.num.__radd__(evaluated_other))
 
     def __rsub__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__rsub__(evaluated_other))
+        return _new_fval(self.num.__rsub__(evaluated_other))
 
     def __rmul__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__rmul__(evaluated_other))
+        return _new_fval(self.num.__rmul__(evaluated_other))
 
     def __rtruediv__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__rtruediv__(evaluated_other))
+        return _new_fval(self.num.__rtruediv__(evaluated_other))
 
     def __rfloordiv__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__rfloordiv__(evaluated_other))
+        return _new_fval(self.num.__rfloordiv__(evaluated_other))
 
     def __mod__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__mod__(evaluated_other))
+        return _new_fval(self.num.__mod__(evaluated_other))
 
     def __rmod__(self, other: AcceptableFValOtherInput) -> 'FVal':
         evaluated_other = _evaluate_input(other)
-        return FVal(self.num.__rmod__(evaluated_other))
+        return _new_fval(self.num.__rmod__(evaluated_other))
 
     def __round__(self, ndigits: int) -> 'FVal':
-        return FVal(round(self.num, ndigits))
+        return _new_fval(round(self.num, ndigits))
 
     def __float__(self) -> float:
         return float(self.num)
@@ -146,10 +146,10 @@ class FVal:
     # --- Unary operands
 
     def __neg__(self) -> 'FVal':
-        return FVal(self.num.__neg__())
+        return _new_fval(self.num.__neg__())
 
     def __abs__(self) -> 'FVal':
-        return FVal(self.num.copy_abs())
+        return _new_fval(self.num.copy_abs())
 
     # --- Other operations
 
@@ -160,7 +160,7 @@ class FVal:
         """
         evaluated_other = _evaluate_input(other)
         evaluated_third = _evaluate_input(third)
-        return FVal(self.num.fma(evaluated_other, evaluated_third))
+        return _new_fval(self.num.fma(evaluated_other, evaluated_third))
 
     def to_percentage(self, precision: int = 4, with_perc_sign: bool = True) -> str:
         return f'{self.num * 100:.{precision}f}{"%" if with_perc_sign else ""}'
@@ -187,6 +187,14 @@ class FVal:
         return diff_num <= evaluated_max_diff.num
 
 
+def _new_fval(num: Decimal) -> FVal:
+    """Wrap the Decimal result of an operation in an FVal skipping the input
+    type checks of the constructor, since the arithmetic hot loops create lots of them"""
+    value = object.__new__(FVal)
+    value.num = num
+    return value
+
+
 def _evaluate_input(other: Any) -> Decimal | int:
     """Evaluate 'other' and return its Decimal representation"""
     if isinstance(other, FVal):
@@ -2,6 +2,7 @@ import logging
 import os
 import shutil
 import sqlite3
+from bisect import bisect_left
 from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, cast, overload
@@ -1256,29 +1257,108 @@ class GlobalDBHandler:
     ) -> list[Optional['HistoricalPrice']]:
         """Given a list of from/to/timestamp data to query returns all values
         that could be found in the DB and None for those that could not be found.
+
+        The queries are grouped per asset pair and each group is answered by
+        get_historical_prices_for_pair so that the DB is hit once per pair and
+        time range instead of once per entry.
         """
+        pair_to_indices: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+        for idx, (from_asset, to_asset, _) in enumerate(query_data):
+            pair_to_indices[(from_asset.identifier, to_asset.identifier)].append(idx)
+
+        prices_results: list[HistoricalPrice | None] = [None] * len(query_data)
+        for indices in pair_to_indices.values():
+            from_asset, to_asset, _ = query_data[indices[0]]
+            pair_results = GlobalDBHandler.get_historical_prices_for_pair(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamps=[query_data[idx][2] for idx in indices],
+                max_seconds_distance=max_seconds_distance,
+                source=source,
+            )
+            for idx, result in zip(indices, pair_results, strict=True):
+                prices_results[idx] = result
+
+        return prices_results
+
+    @staticmethod
+    def get_historical_prices_for_pair(
+            from_asset: 'Asset',
+            to_asset: 'Asset',
+            timestamps: list[Timestamp],
+            max_seconds_distance: int,
+            source: HistoricalPriceOracle | None = None,
+    ) -> list[Optional['HistoricalPrice']]:
+        """Find the closest price to each of the given timestamps for a single asset pair.
+
+        The requested timestamps are split in clusters whose search windows overlap and
+        for each cluster the relevant price_history slice is loaded once, sorted by
+        timestamp. Each timestamp is then answered with a binary search. The result is
+        the same as running get_historical_price for each timestamp, with ties between
+        an earlier and a later price resolved in favor of the earlier one.
+
+        Returns a list with an entry per requested timestamp, in the same order, that is
+        None if no price within max_seconds_distance was found.
+
+        May raise:
+        - DeserializationError if a matched price entry can't be deserialized
+        - UnknownAsset if an asset of a matched price entry does not exist
+        """
+        results: list[HistoricalPrice | None] = [None] * len(timestamps)
+        if len(timestamps) == 0:
+            return results
+
         querystr = (
-            'SELECT from_asset, to_asset, source_type, timestamp, price, MIN(ABS(timestamp - ?)) '
-            'FROM price_history WHERE from_asset=? AND to_asset=? AND timestamp BETWEEN ? AND ?'
+            'SELECT from_asset, to_asset, source_type, timestamp, price FROM price_history '
+            'WHERE from_asset=? AND to_asset=? AND timestamp BETWEEN ? AND ?'
         )
-        querylist: list[tuple] = []
         if source is not None:
-            querystr += ' AND source_type=? '
-            serialized_source = source.serialize_for_db()
-            for from_asset, to_asset, timestamp in query_data:
-                querylist.append((timestamp, from_asset.identifier, to_asset.identifier, timestamp - max_seconds_distance, timestamp + max_seconds_distance, serialized_source))  # noqa: E501
+            querystr += ' AND source_type=?'
+        querystr += ' ORDER BY timestamp ASC'
 
-        else:
-            for from_asset, to_asset, timestamp in query_data:
-                querylist.append((timestamp, from_asset.identifier, to_asset.identifier, timestamp - max_seconds_distance, timestamp + max_seconds_distance))  # noqa: E501
+        sorted_indices = sorted(range(len(timestamps)), key=lambda x: timestamps[x])
+        clusters: list[list[int]] = [[sorted_indices[0]]]
+        for idx in sorted_indices[1:]:  # split where the search windows don't overlap
+            if timestamps[idx] - timestamps[clusters[-1][-1]] > 2 * max_seconds_distance:
+                clusters.append([idx])
+            else:
+                clusters[-1].append(idx)
 
-        prices_results = []
         with GlobalDBHandler().conn.read_ctx() as cursor:
-            for entry in querylist:
-                result = cursor.execute(querystr, entry).fetchone()  # below last index of the result tuple is ignored in deserialize  # noqa: E501
-                prices_results.append(None if result[0] is None else HistoricalPrice.deserialize_from_db(result))  # noqa: E501
+            for cluster in clusters:
+                bindings: tuple = (
+                    from_asset.identifier,
+                    to_asset.identifier,
+                    timestamps[cluster[0]] - max_seconds_distance,
+                    timestamps[cluster[-1]] + max_seconds_distance,
+                )
+                if source is not None:
+                    bindings += (source.serialize_for_db(),)
+                rows = cursor.execute(querystr, bindings).fetchall()
+                if len(rows) == 0:
+                    continue
 
-        return prices_results
+                row_timestamps = [row[3] for row in rows]
+                deserialized: dict[int, HistoricalPrice] = {}
+                for idx in cluster:
+                    timestamp = timestamps[idx]
+                    position = bisect_left(row_timestamps, timestamp)
+                    best = None
+                    if position != len(rows):  # first entry at or after timestamp
+                        best = position
+                    if position != 0:  # entries before timestamp. Keep the earliest on ties
+                        before = bisect_left(row_timestamps, row_timestamps[position - 1])
+                        if best is None or timestamp - row_timestamps[before] <= row_timestamps[best] - timestamp:  # noqa: E501
+                            best = before
+
+                    if best is None or abs(row_timestamps[best] - timestamp) > max_seconds_distance:  # noqa: E501
+                        continue
+
+                    if best not in deserialized:
+                        deserialized[best] = HistoricalPrice.deserialize_from_db(rows[best])
+                    results[idx] = deserialized[best]
+
+        return results
 
     @staticmethod
     def add_historical_prices(entries: list['HistoricalPrice']) -> None:
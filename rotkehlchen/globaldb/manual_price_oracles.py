@@ -54,6 +54,25 @@ class ManualPriceOracle:
             time=timestamp,
         )
 
+    @staticmethod
+    def query_cached_historical_prices(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamps: list[Timestamp],
+    ) -> list[Price | None]:
+        """Get the manual price of each of the given timestamps, reading the DB in bulk.
+        None for the timestamps that have no manual price"""
+        return [
+            entry.price if entry is not None else None
+            for entry in GlobalDBHandler.get_historical_prices_for_pair(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamps=timestamps,
+                max_seconds_distance=3600,
+                source=HistoricalPriceOracle.MANUAL,
+            )
+        ]
+
 
 class ManualCurrentOracle(CurrentPriceOracleInterface):
 
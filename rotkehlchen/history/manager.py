@@ -1,16 +1,21 @@
+import heapq
 import logging
 from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable, Iterator
+from itertools import groupby
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 from rotkehlchen.constants import ZERO
 from rotkehlchen.db.filtering import (
     AssetMovementsFilterQuery,
     EvmTransactionsFilterQuery,
     HistoryEventFilterQuery,
+    T_FilterQ,
     TradesFilterQuery,
 )
 from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.utils import iterate_in_keyset_pages
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.exchanges.data_structures import AssetMovement, Trade
 from rotkehlchen.exchanges.manager import SUPPORTED_EXCHANGES, ExchangeManager
@@ -38,13 +43,35 @@ log = RotkehlchenLogsAdapter(logger)
 #    chain.receipts
 #    chain.tx decoding
 #
-# reading from the db trades, asset movements, margin positions
 # eth2
-# base history entries
+# counting the trades, asset movements and reading margin positions from the db
+# counting the base history entries
 #
 # Please, update this number each time a history query step is either added or removed
 NUM_HISTORY_QUERY_STEPS_EXCL_EXCHANGES = 3 + 3 * len(EVM_CHAINS_WITH_TRANSACTIONS)
 STEPS_PER_CEX = 5
+# Entries of each DB table read at once when streaming the history
+HISTORY_STREAM_PAGE_SIZE = 5000
+
+T = TypeVar('T')
+
+
+def history_sort_key(event: 'AccountingEventMixin') -> tuple[int, int]:
+    """Sort events first by timestamp and if history base by sequence index"""
+    return (
+        event.get_timestamp(),
+        event.sequence_index if isinstance(event, HistoryBaseEntry) else 1,
+    )
+
+
+def _sort_history_events_by_second(
+        events: Iterator[HistoryBaseEntry],
+) -> Iterator[HistoryBaseEntry]:
+    """History events are read sorted by their timestamp in milliseconds but the
+    history is sorted by timestamp in seconds and sequence index. So sort the
+    events within each second before they are merged with the rest of the history."""
+    for _, same_second_events in groupby(events, key=lambda x: x.get_timestamp()):
+        yield from sorted(same_second_events, key=lambda x: x.sequence_index)
 
 
 class HistoryQueryingManager:
@@ -299,6 +326,28 @@ class HistoryQueryingManager:
         Creates all events history from start_ts to end_ts. Returns it
         sorted by ascending timestamp.
         """
+        empty_or_error, _, events = self.get_history_stream(
+            start_ts=start_ts,
+            end_ts=end_ts,
+            has_premium=has_premium,
+        )
+        return empty_or_error, list(events)
+
+    def get_history_stream(
+            self,
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            has_premium: bool,
+    ) -> tuple[str, int, Generator['AccountingEventMixin', None, None]]:
+        """
+        Queries all history sources up to end_ts and returns the number of events
+        along with a generator of the events sorted by ascending timestamp.
+
+        The events are read lazily in pages from the trades, asset movements and history
+        events tables which are merged as they are consumed, so the entire history is never
+        loaded in memory. The number of events is counted in the DB and is an upper bound
+        since events that fail to deserialize are skipped.
+        """
         self._reset_variables()
         step = 0
         total_steps = (
@@ -310,8 +359,7 @@ class HistoryQueryingManager:
             start_ts=start_ts,
             end_ts=end_ts,
         )
-        # start creating the all trades history list
-        history: list[AccountingEventMixin] = []
+        eth2_events: list[AccountingEventMixin] = []
         empty_or_error = ''
 
         def fail_history_cb(error_msg: str) -> None:
@@ -337,32 +385,6 @@ class HistoryQueryingManager:
             # each exchange instance executes STEPS_PER_CEX steps out of the total_steps
             step = self._increase_progress(step, total_steps, step_by=STEPS_PER_CEX)
 
-        # Query all trades, asset movements and margin positions from the DB for all
-        # possible locations.
-        self.processing_state_name = 'Reading trades, asset movements and margin positions from the DB'  # noqa: E501
-        with self.db.conn.read_ctx() as cursor:
-            # Include all trades
-            trades = self.db.get_trades(
-                cursor,
-                filter_query=TradesFilterQuery.make(to_ts=end_ts),
-                has_premium=True,  # we need all trades for accounting -- limit happens later
-            )
-            history.extend(trades)
-
-            # Include all asset movements
-            asset_movements = self.db.get_asset_movements(
-                cursor,
-                filter_query=AssetMovementsFilterQuery.make(to_ts=end_ts),
-                has_premium=True,  # we need all trades for accounting -- limit happens later
-            )
-            history.extend(asset_movements)
-
-            # Include all margin positions
-            margin_positions = self.db.get_margin_positions(cursor, to_ts=end_ts)
-            history.extend(margin_positions)
-
-        step = self._increase_progress(step, total_steps)
-
         for blockchain in EVM_CHAINS_WITH_TRANSACTIONS:
             str_blockchain = str(blockchain)
             self.processing_state_name = f'Querying {str_blockchain} transactions history'
@@ -391,7 +413,10 @@ class HistoryQueryingManager:
             step = self._increase_progress(step, total_steps)
 
             self.processing_state_name = f'Decoding {str_blockchain} raw transactions'
-            evm_manager.transactions_decoder.get_and_decode_undecoded_transactions(limit=None)
+            evm_manager.transactions_decoder.get_and_decode_undecoded_transactions(
+                limit=None,
+                batch_writes=True,
+            )
             step = self._increase_progress(step, total_steps)
 
         # include eth2 staking events
@@ -400,11 +425,10 @@ class HistoryQueryingManager:
             self.processing_state_name = 'Querying ETH2 staking history'
             if self.should_query_eth2_daily_stats:
                 try:
-                    eth2_events = self.chains_aggregator.refresh_eth2_get_daily_stats(
+                    eth2_events.extend(self.chains_aggregator.refresh_eth2_get_daily_stats(
                         from_timestamp=Timestamp(0),
                         to_timestamp=end_ts,
-                    )
-                    history.extend(eth2_events)
+                    ))
                 except RemoteError as e:
                     self.msg_aggregator.add_error(
                         f'Eth2 daily stats are not included in the PnL report due to {e!s}',
@@ -412,28 +436,91 @@ class HistoryQueryingManager:
             # make sure that eth2 events and history events are combined
             eth2.combine_block_with_tx_events()
 
+        step = self._increase_progress(step, total_steps)
+        # Query all trades, asset movements and margin positions from the DB for all
+        # possible locations. Only the margin positions are read here since they are few.
+        self.processing_state_name = 'Reading trades, asset movements and margin positions from the DB'  # noqa: E501
+        trades_filter = TradesFilterQuery.make(to_ts=end_ts)
+        asset_movements_filter = AssetMovementsFilterQuery.make(to_ts=end_ts)
+        with self.db.conn.read_ctx() as cursor:
+            margin_positions = self.db.get_margin_positions(cursor, to_ts=end_ts)
+            events_num = (
+                self.db.get_trades_count(cursor, filter_query=trades_filter) +
+                self.db.get_asset_movements_count(cursor, filter_query=asset_movements_filter) +
+                len(margin_positions) + len(eth2_events)
+            )
+
         step = self._increase_progress(step, total_steps)
         self.processing_state_name = 'Querying base history events'
-        # Include all base history entries
         history_events_db = DBHistoryEvents(self.db)
+        history_events_filter = HistoryEventFilterQuery.make(
+            # We need to have history since before the range
+            from_ts=Timestamp(0),
+            to_ts=end_ts,
+        )
         with self.db.conn.read_ctx() as cursor:
-            base_entries = history_events_db.get_history_events(
+            events_num += history_events_db.get_history_events_count(
                 cursor=cursor,
-                filter_query=HistoryEventFilterQuery.make(
-                    # We need to have history since before the range
-                    from_ts=Timestamp(0),
-                    to_ts=end_ts,
-                ),
-                has_premium=True,  # ignore limits here. Limit applied at processing
-                group_by_event_ids=False,
-            )
-        history.extend(base_entries)
+                query_filter=history_events_filter,
+            )[0]
         self._increase_progress(step, total_steps)
 
-        history.sort(  # sort events first by timestamp and if history base by sequence index
-            key=lambda x: (
-                x.get_timestamp(),
-                x.sequence_index if isinstance(x, HistoryBaseEntry) else 1,
+        return empty_or_error, events_num, self._iterate_history(
+            trades_filter=trades_filter,
+            asset_movements_filter=asset_movements_filter,
+            history_events_filter=history_events_filter,
+            in_memory_events=[*margin_positions, *eth2_events],
+        )
+
+    def _iterate_history(
+            self,
+            trades_filter: TradesFilterQuery,
+            asset_movements_filter: AssetMovementsFilterQuery,
+            history_events_filter: HistoryEventFilterQuery,
+            in_memory_events: list['AccountingEventMixin'],
+    ) -> Generator['AccountingEventMixin', None, None]:
+        """Merge the time-sorted events of each source into a single sorted stream.
+
+        The merge is stable so events with the same sort key keep the order of their
+        sources as they would if all of them were concatenated and sorted.
+        """
+        history_events_db = DBHistoryEvents(self.db)
+        yield from heapq.merge(
+            self._iterate_in_pages(
+                filter_query=trades_filter,
+                # we need all trades for accounting -- limit happens later
+                iterate=lambda cursor, filter_query: self.db.iterate_trades(cursor, filter_query=filter_query, has_premium=True),  # noqa: E501
+            ),
+            self._iterate_in_pages(
+                filter_query=asset_movements_filter,
+                iterate=lambda cursor, filter_query: self.db.iterate_asset_movements(cursor, filter_query=filter_query, has_premium=True),  # noqa: E501
             ),
+            sorted(in_memory_events, key=history_sort_key),
+            _sort_history_events_by_second(self._iterate_in_pages(
+                filter_query=history_events_filter,
+                # ignore limits here. Limit applied at processing
+                iterate=lambda cursor, filter_query: history_events_db.iterate_history_events(cursor=cursor, filter_query=filter_query, has_premium=True),  # noqa: E501
+            )),
+            key=history_sort_key,
         )
-        return empty_or_error, history
+
+    def _iterate_in_pages(
+            self,
+            filter_query: T_FilterQ,
+            iterate: Callable[['DBCursor', T_FilterQ], Iterable[T]],
+    ) -> Iterator[T]:
+        """Read the entries of the filter query in pages of HISTORY_STREAM_PAGE_SIZE
+        ordered by their keyset columns, e.g. (timestamp, id) for trades.
+
+        Each page is read in its own short read so that no cursor is kept open on the
+        shared connection while other greenlets write to it. Continuing after the last
+        row read means that entries are never returned twice or skipped even if the
+        table changes between pages.
+        """
+        for entries in iterate_in_keyset_pages(
+                connection=self.db.conn,
+                filter_query=filter_query,
+                page_size=HISTORY_STREAM_PAGE_SIZE,
+                read_page=iterate,
+        ):
+            yield from entries
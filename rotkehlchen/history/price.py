@@ -9,14 +9,18 @@ from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ONE
 from rotkehlchen.constants.assets import A_KFEE, A_USD
 from rotkehlchen.constants.prices import ZERO_PRICE
+from rotkehlchen.constants.timing import HOUR_IN_SECONDS
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
+from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.manual_price_oracles import ManualPriceOracle
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import Price, Timestamp
+from rotkehlchen.utils.data_structures import LRUCacheWithRemove
+from rotkehlchen.utils.misc import ts_now
 
 from .types import HistoricalPriceOracle, HistoricalPriceOracleInstance
 
@@ -29,6 +33,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+HISTORICAL_PRICE_CACHE_SIZE = 32768
+# seconds for which a missing price is cached, since the oracles may store it later
+HISTORICAL_PRICE_MISSING_CACHE_TTL = 600
+# from asset, to asset, hour bucket of the timestamp, oracles order
+HistoricalPriceCacheKey = tuple[str, str, int, tuple[HistoricalPriceOracle, ...]]
+
 
 def query_usd_price_or_use_default(
         asset: Asset,
@@ -82,6 +92,11 @@ class PriceHistorian:
     _manual: ManualPriceOracle  # This is used when iterating through all oracles
     _oracles: Sequence[HistoricalPriceOracle] | None = None
     _oracle_instances: list[HistoricalPriceOracleInstance] | None = None
+    # Resolved prices per hour bucket with the time they were cached.
+    # None means that no price was found
+    _price_cache: LRUCacheWithRemove[HistoricalPriceCacheKey, tuple[Price | None, Timestamp]]
+    _price_cache_hits: int
+    _price_cache_misses: int
 
     def __new__(
             cls,
@@ -104,6 +119,9 @@ class PriceHistorian:
         PriceHistorian._coingecko = coingecko
         PriceHistorian._defillama = defillama
         PriceHistorian._manual = ManualPriceOracle()
+        PriceHistorian._price_cache = LRUCacheWithRemove(maxsize=HISTORICAL_PRICE_CACHE_SIZE)
+        PriceHistorian._price_cache_hits = 0
+        PriceHistorian._price_cache_misses = 0
 
         return PriceHistorian.__instance
 
@@ -115,6 +133,23 @@ class PriceHistorian:
         instance = PriceHistorian()
         instance._oracles = oracles
         instance._oracle_instances = [getattr(instance, f'_{oracle!s}') for oracle in oracles]
+        PriceHistorian.clear_price_cache()
+
+    @staticmethod
+    def clear_price_cache() -> None:
+        """Clear the in-memory cache of historical prices. Should be called whenever
+        the stored prices change in a way that can affect already resolved prices,
+        like when manual prices are edited or an oracle's cached prices are deleted."""
+        PriceHistorian._price_cache.clear()
+
+    @staticmethod
+    def get_price_cache_stats() -> dict[str, int]:
+        """Return the hits, misses and current size of the in-memory price cache"""
+        return {
+            'hits': PriceHistorian._price_cache_hits,
+            'misses': PriceHistorian._price_cache_misses,
+            'size': len(PriceHistorian._price_cache.cache),
+        }
 
     @staticmethod
     def get_price_for_special_asset(
@@ -153,6 +188,82 @@ class PriceHistorian:
             return Price(usd_price * price_mapping)
         return None
 
+    @staticmethod
+    def _price_cache_key(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamp: Timestamp,
+    ) -> HistoricalPriceCacheKey:
+        return (
+            from_asset.identifier,
+            to_asset.identifier,
+            timestamp // HOUR_IN_SECONDS,
+            tuple(PriceHistorian()._oracles or ()),
+        )
+
+    @staticmethod
+    def cache_stored_historical_prices(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamps: list[Timestamp],
+    ) -> list[Timestamp]:
+        """Put in the in-memory cache the prices of the pair at the given timestamps that
+        query_historical_price would find in the locally stored prices, reading them in
+        bulk instead of with a DB query per timestamp.
+
+        Only the leading oracles whose answer is known without a remote query are used.
+        Manual prices are only stored locally, so a missing one moves to the next oracle.
+        For cryptocompare a missing cached price means a remote query, so it's the last
+        oracle checked. Special and fiat pairs are left to query_historical_price.
+
+        Returns the timestamps whose price was not cached and needs to be queried.
+        """
+        if from_asset in (to_asset, A_KFEE):
+            return timestamps
+
+        with suppress(UnknownAsset, WrongAssetType):
+            from_asset.resolve_to_fiat_asset()
+            to_asset.resolve_to_fiat_asset()
+            return timestamps  # fiat pairs are first queried from the forex apis
+
+        instance = PriceHistorian()
+        assert instance._oracles is not None and instance._oracle_instances is not None, (
+            'PriceHistorian should never be called before setting the oracles'
+        )
+        missing_timestamps = [
+            timestamp for timestamp in timestamps
+            if instance._price_cache.get(instance._price_cache_key(from_asset, to_asset, timestamp)) is None  # noqa: E501
+        ]
+        for oracle, oracle_instance in zip(instance._oracles, instance._oracle_instances, strict=True):  # noqa: E501
+            if len(missing_timestamps) == 0 or oracle not in (HistoricalPriceOracle.MANUAL, HistoricalPriceOracle.CRYPTOCOMPARE):  # noqa: E501
+                break
+
+            try:
+                prices = oracle_instance.query_cached_historical_prices(  # type: ignore[union-attr]  # only manual and cryptocompare
+                    from_asset=from_asset,
+                    to_asset=to_asset,
+                    timestamps=missing_timestamps,
+                )
+            except (PriceQueryUnsupportedAsset, DeserializationError, UnknownAsset) as e:
+                log.debug(f'Could not read the stored {oracle} prices of {from_asset} -> {to_asset} due to {e!s}')  # noqa: E501
+                break
+
+            still_missing = []
+            for timestamp, price in zip(missing_timestamps, prices, strict=True):
+                if price is None:
+                    still_missing.append(timestamp)
+                else:
+                    instance._price_cache.add(
+                        instance._price_cache_key(from_asset, to_asset, timestamp),
+                        (price, ts_now()),
+                    )
+
+            missing_timestamps = still_missing
+            if oracle != HistoricalPriceOracle.MANUAL:
+                break
+
+        return missing_timestamps
+
     @staticmethod
     def query_historical_price(
             from_asset: Asset,
@@ -170,6 +281,12 @@ class PriceHistorian:
                         know the price.
             timestamp: The timestamp at which to query the price
 
+        Resolved prices, and the fact that no price could be found, are kept in an
+        in-memory cache per hour bucket of the timestamp so repeated queries for the
+        same pair and hour don't hit the DB or the network again. The fact that no price
+        exists is only cached for HISTORICAL_PRICE_MISSING_CACHE_TTL seconds and only if
+        all oracles were queried and answered that they have no price.
+
         May raise:
         - NoPriceForGivenTimestamp if we can't find a price for the asset in the given
         timestamp from the external service.
@@ -183,6 +300,45 @@ class PriceHistorian:
         if from_asset == to_asset:
             return Price(ONE)
 
+        instance = PriceHistorian()
+        cache_key = instance._price_cache_key(from_asset, to_asset, timestamp)
+        if (cached_entry := instance._price_cache.get(cache_key)) is not None:
+            cached_price, cached_at = cached_entry
+            if cached_price is not None:
+                PriceHistorian._price_cache_hits += 1
+                return cached_price
+
+            if ts_now() - cached_at <= HISTORICAL_PRICE_MISSING_CACHE_TTL:
+                PriceHistorian._price_cache_hits += 1
+                raise NoPriceForGivenTimestamp(
+                    from_asset=from_asset,
+                    to_asset=to_asset,
+                    time=timestamp,
+                )
+
+        PriceHistorian._price_cache_misses += 1
+        try:
+            price = PriceHistorian._query_historical_price(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                timestamp=timestamp,
+            )
+        except NoPriceForGivenTimestamp as e:
+            if e.rate_limited is False and e.oracles_unavailable is False:
+                instance._price_cache.add(cache_key, (None, ts_now()))
+            raise
+
+        instance._price_cache.add(cache_key, (price, ts_now()))
+        return price
+
+    @staticmethod
+    def _query_historical_price(
+            from_asset: Asset,
+            to_asset: Asset,
+            timestamp: Timestamp,
+    ) -> Price:
+        """Query the historical price without going through the in-memory cache.
+        Check query_historical_price for the arguments and the possible exceptions."""
         special_asset_price = PriceHistorian().get_price_for_special_asset(
             from_asset=from_asset,
             to_asset=to_asset,
@@ -211,14 +367,15 @@ class PriceHistorian:
         assert oracles is not None and oracle_instances is not None, (
             'PriceHistorian should never be called before setting the oracles'
         )
-        rate_limited = False
+        rate_limited = oracles_unavailable = False
         for oracle, oracle_instance in zip(oracles, oracle_instances, strict=True):
             can_query_history = oracle_instance.can_query_history(
                 from_asset=from_asset,
                 to_asset=to_asset,
                 timestamp=timestamp,
             )
-            if can_query_history is False:
+            if can_query_history is False:  # penalized or recently rate limited
+                oracles_unavailable = True
                 continue
 
             try:
@@ -240,6 +397,7 @@ class PriceHistorian:
                     rate_limited is True or
                     e.error_code == HTTPStatus.TOO_MANY_REQUESTS
                 )
+                oracles_unavailable = True
                 continue
 
             log.debug(
@@ -256,4 +414,5 @@ class PriceHistorian:
             to_asset=to_asset,
             time=timestamp,
             rate_limited=rate_limited,
+            oracles_unavailable=oracles_unavailable,
         )
@@ -183,7 +183,18 @@ class PremiumSyncManager:
 
         with self.data.db.conn.read_ctx() as cursor:
             our_last_write_ts = self.data.db.get_setting(cursor=cursor, name='last_write_ts')
-        if our_last_write_ts <= metadata.last_modify_ts and not force_upload:
+        if our_last_write_ts == metadata.last_modify_ts and not force_upload:
+            # the remote is what we last uploaded and nothing changed locally since then
+            message = 'Remote database is up to date'
+            log.debug(f'upload to server stopped -- no local changes since {our_last_write_ts}')
+            self.data.msg_aggregator.add_message(
+                message_type=WSMessageType.DATABASE_UPLOAD_RESULT,
+                data={'uploaded': False, 'actionable': False, 'message': message},
+            )
+            self.last_upload_attempt_ts = ts_now()
+            return False, message
+
+        if our_last_write_ts < metadata.last_modify_ts and not force_upload:
             message = 'Remote database is more recent than local'
             log.debug(
                 f'upload to server stopped -- remote db({metadata.last_modify_ts}) '
@@ -196,7 +207,9 @@ class PremiumSyncManager:
             self.last_upload_attempt_ts = ts_now()
             return False, message
 
-        data, our_hash = self.data.compress_and_encrypt_db()
+        data, our_hash = self.data.compress_and_encrypt_db(
+            skip_if_hash=None if force_upload else metadata.data_hash,
+        )
         log.debug(
             'CAN_PUSH',
             ours=our_hash,
@@ -252,7 +265,9 @@ class PremiumSyncManager:
         self.last_data_upload_ts = ts_now()
         self.last_upload_attempt_ts = self.last_data_upload_ts
         self.last_remote_data_upload_ts = self.last_data_upload_ts
-        with self.data.db.user_write() as cursor:
+        # don't update last_write_ts since this is not a change of the uploaded data.
+        # Otherwise the whole DB would be exported again at the next upload check.
+        with self.data.db.conn.write_ctx() as cursor:
             self.data.db.set_static_cache(
                 write_cursor=cursor,
                 name=DBCacheStatic.LAST_DATA_UPLOAD_TS,
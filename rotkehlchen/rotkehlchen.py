@@ -870,16 +870,18 @@ class Rotkehlchen:
             start_ts: Timestamp,
             end_ts: Timestamp,
     ) -> tuple[int, str]:
-        error_or_empty, events = self.history_querying_manager.get_history(
+        error_or_empty, events_num, events = self.history_querying_manager.get_history_stream(
             start_ts=start_ts,
             end_ts=end_ts,
             has_premium=self.premium is not None,
         )
-        report_id = self.accountant.process_history(
-            start_ts=start_ts,
-            end_ts=end_ts,
-            events=events,
-        )
+        with contextlib.closing(events):  # release the DB cursors even if processing stops early
+            report_id = self.accountant.process_history(
+                start_ts=start_ts,
+                end_ts=end_ts,
+                events=events,
+                events_num=events_num,
+            )
         return report_id, error_or_empty
 
     def query_balances(
@@ -59,6 +59,12 @@ from rotkehlchen.tasks.calendar import (
     maybe_create_ens_reminders,
     notify_reminders,
 )
+from rotkehlchen.tasks.scheduling import (
+    RESOURCE_CONCURRENCY_LIMITS,
+    TaskResource,
+    TaskRuntimes,
+    get_task_properties,
+)
 from rotkehlchen.tasks.utils import query_missing_prices_of_base_entries, should_run_periodic_task
 from rotkehlchen.types import (
     EVM_CHAINS_WITH_TRANSACTIONS,
@@ -95,6 +101,7 @@ log = RotkehlchenLogsAdapter(logger)
 CRYPTOCOMPARE_QUERY_AFTER_SECS = 86400  # a day
 DEFAULT_MAX_TASKS_NUM = 2
 CRYPTOCOMPARE_HISTOHOUR_FREQUENCY = 240  # at least 4 mins apart
+CRYPTOCOMPARE_QUERIES_PER_TASK = 4  # asset histories backfilled by each task
 XPUB_DERIVATION_FREQUENCY = 3600  # every hour
 EVM_TX_QUERY_FREQUENCY = 3600  # every hour
 EXCHANGE_QUERY_FREQUENCY = 3600  # every hour
@@ -158,6 +165,7 @@ class TaskManager:
         self.premium_sync_manager: Optional[PremiumSyncManager] = premium_sync_manager
         self.data_updater = data_updater
         self.username = username
+        self.task_runtimes = TaskRuntimes()
 
         self.potential_tasks: list[Callable[[], Optional[list[gevent.Greenlet]]]] = [
             self._maybe_schedule_cryptocompare_query,
@@ -250,7 +258,7 @@ class TaskManager:
         self.prepared_cryptocompare_query = True
 
     def _maybe_schedule_cryptocompare_query(self) -> Optional[list[gevent.Greenlet]]:
-        """Schedules a cryptocompare query for a single asset history"""
+        """Schedules a cryptocompare query for the history of a few assets"""
         if self.prepared_cryptocompare_query is False:
             self._prepare_cryptocompare_queries()
 
@@ -270,16 +278,20 @@ class TaskManager:
         if now_ts - self.cryptocompare.last_histohour_query_ts <= CRYPTOCOMPARE_HISTOHOUR_FREQUENCY:  # noqa: E501
             return None
 
-        query = self.cryptocompare_queries.pop()
-        task_name = f'Cryptocompare historical prices {query.from_asset} / {query.to_asset} query'
+        queries = [
+            self.cryptocompare_queries.pop()
+            for _ in range(min(CRYPTOCOMPARE_QUERIES_PER_TASK, len(self.cryptocompare_queries)))
+        ]
+        task_name = 'Cryptocompare historical prices {} query'.format(
+            ', '.join(f'{query.from_asset} / {query.to_asset}' for query in queries),
+        )
         log.debug(f'Scheduling task for {task_name}')
         return [self.greenlet_manager.spawn_and_track(
             after_seconds=None,
             task_name=task_name,
             exception_is_error=False,
-            method=self.cryptocompare.query_and_store_historical_data,
-            from_asset=query.from_asset,
-            to_asset=query.to_asset,
+            method=self.cryptocompare.query_and_store_historical_data_for_pairs,
+            pairs=[(query.from_asset, query.to_asset) for query in queries],
             timestamp=now_ts,
         )]
 
@@ -473,6 +485,7 @@ class TaskManager:
                 exception_is_error=True,
                 method=evm_inquirer.transactions_decoder.get_and_decode_undecoded_transactions,
                 limit=TX_DECODING_LIMIT,
+                batch_writes=True,
             )]
         return None
 
@@ -977,8 +990,14 @@ class TaskManager:
         if not_proceed:
             return  # too busy
 
+        # start the most important tasks first and among those the shortest ones
         random.shuffle(self.potential_tasks)
+        self.potential_tasks.sort(key=lambda fn: (
+            get_task_properties(fn.__name__).priority,
+            self.task_runtimes.get(fn.__name__),
+        ))
         max_tasks = min(self.max_tasks_num - current_greenlets, len(self.potential_tasks))
+        resources_in_use = self._get_resources_in_use()
 
         spawned_new = 0
         for scheduling_fn in self.potential_tasks:
@@ -986,12 +1005,33 @@ class TaskManager:
                 break  # no more task slots left
             if scheduling_fn in self.running_greenlets:
                 continue  # the specified task is already running
+            task_name = scheduling_fn.__name__
+            resources = get_task_properties(task_name).resources
+            if any(resources_in_use[x] >= RESOURCE_CONCURRENCY_LIMITS[x] for x in resources):
+                continue  # the resources this task needs are busy
             new_greenlets = scheduling_fn()
             if new_greenlets is None:
                 continue  # The scheduling function for the specific task decided to not schedule it  # noqa: E501
             self.running_greenlets[scheduling_fn] = new_greenlets
+            self.task_runtimes.track(task_name=task_name, greenlets=new_greenlets)
+            for resource in resources:
+                resources_in_use[resource] += 1
             spawned_new += 1
 
+    def _get_resources_in_use(self) -> defaultdict[TaskResource, int]:
+        """Count the running background tasks using each resource. User facing API tasks
+        also count as DB writers so that background tasks don't make them wait on the
+        DB write lock."""
+        resources_in_use: defaultdict[TaskResource, int] = defaultdict(int)
+        for scheduling_fn in self.running_greenlets:
+            for resource in get_task_properties(scheduling_fn.__name__).resources:
+                resources_in_use[resource] += 1
+
+        resources_in_use[TaskResource.DB_WRITE] += sum(
+            not greenlet.dead for greenlet in self.api_task_greenlets
+        )
+        return resources_in_use
+
     def schedule(self) -> None:
         """Schedules background task while holding the scheduling lock
 
@@ -0,0 +1,116 @@
+import logging
+import time
+from collections.abc import Sequence
+from enum import Enum, IntEnum, auto
+from typing import Final, NamedTuple
+
+import gevent
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+
+class TaskPriority(IntEnum):
+    """Order in which due background tasks are considered. Lower goes first"""
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class TaskResource(Enum):
+    """The resources that background tasks contend for"""
+    DB_WRITE = auto()  # the user DB writer, shared with the user facing API calls
+    ETHERSCAN = auto()  # etherscan-like indexers and their rate limits
+    NODE_RPC = auto()  # evm nodes
+    EXCHANGES = auto()  # centralized exchange and other service APIs of the user
+    PRICE_ORACLES = auto()
+    EXTERNAL_API = auto()  # anything else that queries a remote
+    CPU = auto()
+
+
+class TaskProperties(NamedTuple):
+    priority: TaskPriority
+    resources: tuple[TaskResource, ...]
+
+
+# How many background tasks can use each resource at the same time
+RESOURCE_CONCURRENCY_LIMITS: Final = {
+    TaskResource.DB_WRITE: 1,
+    TaskResource.ETHERSCAN: 1,
+    TaskResource.NODE_RPC: 2,
+    TaskResource.EXCHANGES: 1,
+    TaskResource.PRICE_ORACLES: 1,
+    TaskResource.EXTERNAL_API: 2,
+    TaskResource.CPU: 1,
+}
+# For tasks not in TASK_PROPERTIES
+DEFAULT_TASK_PROPERTIES: Final = TaskProperties(priority=TaskPriority.NORMAL, resources=())
+# Keyed by the name of the TaskManager method scheduling the task
+TASK_PROPERTIES: Final = {
+    '_maybe_check_premium_status': TaskProperties(TaskPriority.HIGH, (TaskResource.EXTERNAL_API,)),
+    '_maybe_check_data_updates': TaskProperties(TaskPriority.HIGH, (TaskResource.EXTERNAL_API, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_trigger_calendar_reminder': TaskProperties(TaskPriority.HIGH, ()),
+    '_maybe_create_calendar_reminder': TaskProperties(TaskPriority.NORMAL, (TaskResource.DB_WRITE,)),  # noqa: E501
+    '_maybe_delete_past_calendar_events': TaskProperties(TaskPriority.LOW, (TaskResource.DB_WRITE,)),  # noqa: E501
+    '_maybe_schedule_db_upload': TaskProperties(TaskPriority.HIGH, (TaskResource.EXTERNAL_API, TaskResource.CPU)),  # noqa: E501
+    '_maybe_update_snapshot_balances': TaskProperties(TaskPriority.HIGH, (TaskResource.NODE_RPC, TaskResource.EXCHANGES, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_query_evm_transactions': TaskProperties(TaskPriority.NORMAL, (TaskResource.ETHERSCAN, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_schedule_evm_txreceipts': TaskProperties(TaskPriority.NORMAL, (TaskResource.NODE_RPC, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_decode_evm_transactions': TaskProperties(TaskPriority.NORMAL, (TaskResource.CPU, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_schedule_exchange_history_query': TaskProperties(TaskPriority.NORMAL, (TaskResource.EXCHANGES, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_query_monerium': TaskProperties(TaskPriority.NORMAL, (TaskResource.EXCHANGES, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_schedule_xpub_derivation': TaskProperties(TaskPriority.NORMAL, (TaskResource.EXTERNAL_API, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_query_produced_blocks': TaskProperties(TaskPriority.NORMAL, (TaskResource.EXTERNAL_API, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_query_withdrawals': TaskProperties(TaskPriority.NORMAL, (TaskResource.ETHERSCAN, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_detect_withdrawal_exits': TaskProperties(TaskPriority.LOW, (TaskResource.EXTERNAL_API, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_run_events_processing': TaskProperties(TaskPriority.NORMAL, (TaskResource.CPU, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_detect_evm_accounts': TaskProperties(TaskPriority.NORMAL, (TaskResource.ETHERSCAN, TaskResource.NODE_RPC)),  # noqa: E501
+    '_maybe_query_graph_delegated_tokens': TaskProperties(TaskPriority.LOW, (TaskResource.ETHERSCAN, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_schedule_cryptocompare_query': TaskProperties(TaskPriority.LOW, (TaskResource.PRICE_ORACLES,)),  # noqa: E501
+    '_maybe_query_missing_prices': TaskProperties(TaskPriority.LOW, (TaskResource.PRICE_ORACLES,)),
+    '_maybe_update_yearn_vaults': TaskProperties(TaskPriority.LOW, (TaskResource.EXTERNAL_API,)),
+    '_maybe_update_ilk_cache': TaskProperties(TaskPriority.LOW, (TaskResource.NODE_RPC,)),
+    '_maybe_update_aave_v3_underlying_assets': TaskProperties(TaskPriority.LOW, (TaskResource.NODE_RPC,)),  # noqa: E501
+    '_maybe_detect_new_spam_tokens': TaskProperties(TaskPriority.LOW, (TaskResource.DB_WRITE,)),
+    '_maybe_augmented_detect_new_spam_tokens': TaskProperties(TaskPriority.LOW, (TaskResource.NODE_RPC, TaskResource.DB_WRITE)),  # noqa: E501
+    '_maybe_update_owned_assets': TaskProperties(TaskPriority.LOW, (TaskResource.DB_WRITE,)),
+}
+RUNTIME_SMOOTHING: Final = 0.3  # weight of the latest run in the average runtime of a task
+
+
+def get_task_properties(task_name: str) -> TaskProperties:
+    return TASK_PROPERTIES.get(task_name, DEFAULT_TASK_PROPERTIES)
+
+
+class TaskRuntimes:
+    """Keeps a moving average of how long each background task takes to finish"""
+
+    def __init__(self) -> None:
+        self.averages: dict[str, float] = {}
+
+    def get(self, task_name: str) -> float:
+        """Average runtime of the task in seconds. Tasks that never ran count as instant
+        so that they get to run and be measured."""
+        return self.averages.get(task_name, 0.0)
+
+    def track(self, task_name: str, greenlets: Sequence[gevent.Greenlet]) -> None:
+        """Measure the time until all the given greenlets of a task have finished"""
+        start, remaining = time.monotonic(), len(greenlets)
+
+        def greenlet_finished(_greenlet: gevent.Greenlet) -> None:
+            nonlocal remaining
+            remaining -= 1
+            if remaining != 0:
+                return
+
+            runtime = time.monotonic() - start
+            if (average := self.averages.get(task_name)) is None:
+                self.averages[task_name] = runtime
+            else:
+                self.averages[task_name] = average + RUNTIME_SMOOTHING * (runtime - average)
+            log.debug(f'Background task {task_name} took {runtime:.2f} seconds')
+
+        for greenlet in greenlets:
+            greenlet.link(greenlet_finished)
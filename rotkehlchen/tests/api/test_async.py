@@ -1,9 +1,11 @@
+import json
 from http import HTTPStatus
 from unittest.mock import patch
 
 import gevent
 import pytest
 import requests
+from gevent.event import Event
 
 from rotkehlchen.tests.utils.api import (
     api_url_for,
@@ -12,6 +14,7 @@ from rotkehlchen.tests.utils.api import (
     assert_proper_response,
     assert_proper_sync_response_with_result,
     assert_simple_ok_response,
+    wait_for_async_task_with_result,
 )
 from rotkehlchen.tests.utils.exchanges import mock_binance_balance_response, try_get_first_exchange
 from rotkehlchen.types import Location
@@ -186,3 +189,54 @@ def test_cancel_async_task(rotkehlchen_api_server_with_exchanges):
     response = requests.get(api_url_for(server, 'asynctasksresource'))
     result = assert_proper_sync_response_with_result(response)
     assert result == {'completed': [], 'pending': []}
+
+
+def test_query_async_task_result_chunks(rotkehlchen_api_server):
+    """Test that the chunks of a task producing its result incrementally can be read
+    while it runs, streamed, or all received with the task's outcome"""
+    server = rotkehlchen_api_server
+    produce_last_chunk = Event()
+
+    def produce_chunks(rest_api):  # pylint: disable=unused-argument
+        def chunks():
+            yield [{'identifier': 1}, {'identifier': 2}]
+            produce_last_chunk.wait()
+            yield [{'identifier': 3}]
+        return {'result': chunks(), 'message': ''}
+
+    task_ids = [
+        json.loads(server.rest_api._query_async(command=produce_chunks).get_data())['result']['task_id']
+        for _ in range(2)
+    ]
+    gevent.sleep(0.1)  # let the tasks produce their first chunk
+    response = requests.get(api_url_for(server, 'asynctaskchunksresource', task_id=task_ids[0]))
+    assert assert_proper_sync_response_with_result(response) == {
+        'status': 'pending',
+        'chunks': [[{'identifier': 1}, {'identifier': 2}]],
+    }
+    response = requests.get(api_url_for(server, 'asynctaskchunksresource', task_id=task_ids[0]))
+    assert assert_proper_sync_response_with_result(response) == {'status': 'pending', 'chunks': []}
+
+    produce_last_chunk.set()
+    response = requests.get(
+        api_url_for(server, 'asynctaskchunksresource', task_id=task_ids[0]),
+        params={'stream': True},
+        stream=True,
+    )
+    assert response.headers['Content-Type'] == 'application/x-ndjson'
+    assert [json.loads(line) for line in response.iter_lines()] == [
+        {'chunk': [{'identifier': 3}]},
+        {'status': 'completed', 'outcome': {'result': [], 'message': ''}},
+    ]
+    response = requests.get(api_url_for(server, 'asynctaskchunksresource', task_id=task_ids[0]))
+    assert_error_response(
+        response=response,
+        contained_in_msg=f'No task with id {task_ids[0]} found',
+        status_code=HTTPStatus.NOT_FOUND,
+    )
+
+    # the chunks that were never read are the result of the task's outcome
+    assert wait_for_async_task_with_result(server, task_ids[1]) == [
+        [{'identifier': 1}, {'identifier': 2}],
+        [{'identifier': 3}],
+    ]
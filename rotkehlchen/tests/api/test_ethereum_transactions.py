@@ -984,11 +984,12 @@ def test_query_transactions_check_decoded_events(
     with rotki.data.db.conn.read_ctx() as cursor:
         for name, count in (
                 ('evm_transactions', 4), ('evm_internal_transactions', 0),
-                ('evmtx_receipts', 4), ('evmtx_receipt_log_topics', 6),
+                ('evmtx_receipts', 4),
                 ('evmtx_address_mappings', 4), ('evm_tx_mappings', 4),
                 ('history_events_mappings', 2),
         ):
             assert cursor.execute(f'SELECT COUNT(*) from {name}').fetchone()[0] == count
+        assert cursor.execute('SELECT SUM(LENGTH(topics)) / 32 FROM evmtx_receipt_logs').fetchone()[0] == 6  # noqa: E501
 
     # Now purge all transactions of this address and see data is deleted BUT that
     # the edited/added event and all it's tied to is not
@@ -999,11 +1000,12 @@ def test_query_transactions_check_decoded_events(
     with rotki.data.db.conn.read_ctx() as cursor:
         for name, count in (
                 ('evm_transactions', 2), ('evm_internal_transactions', 0),
-                ('evmtx_receipts', 2), ('evmtx_receipt_log_topics', 6),
+                ('evmtx_receipts', 2),
                 ('evmtx_address_mappings', 2), ('evm_tx_mappings', 0),
                 ('history_events_mappings', 2),
         ):
             assert cursor.execute(f'SELECT COUNT(*) from {name}').fetchone()[0] == count
+        assert cursor.execute('SELECT SUM(LENGTH(topics)) / 32 FROM evmtx_receipt_logs').fetchone()[0] == 6  # noqa: E501
         customized_events = dbevents.get_history_events(cursor, EvmEventFilterQuery.make(), True)
 
         # Check if related cache is removed
@@ -1040,7 +1042,7 @@ def test_query_transactions_check_decoded_events(
     with rotki.data.db.conn.read_ctx() as cursor:
         for name in (
                 'evm_transactions', 'evm_internal_transactions',
-                'evmtx_receipts', 'evmtx_receipt_log_topics',
+                'evmtx_receipts', 'evmtx_receipt_logs',
                 'evmtx_address_mappings', 'evm_tx_mappings',
                 'history_events_mappings',
         ):
@@ -26,6 +26,7 @@ from rotkehlchen.tests.utils.api import (
     assert_proper_response,
     assert_proper_sync_response_with_result,
     assert_simple_ok_response,
+    wait_for_async_task_with_result,
 )
 from rotkehlchen.tests.utils.history_base_entry import (
     KEYS_IN_ENTRY_TYPE,
@@ -550,6 +551,33 @@ def test_get_events(rotkehlchen_api_server: 'APIServer'):
     ]
 
 
+def test_get_events_in_chunks(rotkehlchen_api_server: 'APIServer'):
+    """Test that all the events can be produced in chunks by an async task"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    add_entries(events_db=DBHistoryEvents(rotki.data.db))
+    response = requests.post(api_url_for(rotkehlchen_api_server, 'historyeventresource'))
+    expected_entries = assert_proper_sync_response_with_result(response)['entries']
+
+    response = requests.post(
+        api_url_for(rotkehlchen_api_server, 'historyeventresource'),
+        json={'chunked': True},
+    )
+    task_id = assert_ok_async_response(response)
+    chunks = wait_for_async_task_with_result(rotkehlchen_api_server, task_id)
+    assert [entry for chunk in chunks for entry in chunk] == expected_entries
+
+    for extra_args in ({'group_by_event_ids': True}, {'limit': 1, 'offset': 0}):
+        response = requests.post(
+            api_url_for(rotkehlchen_api_server, 'historyeventresource'),
+            json={'chunked': True} | extra_args,
+        )
+        assert_error_response(
+            response=response,
+            contained_in_msg='chunked events can not be grouped or paginated',
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+
+
 @pytest.mark.parametrize('number_of_eth_accounts', [0])
 @pytest.mark.parametrize('added_exchanges', [(Location.KRAKEN,)])
 def test_query_new_events(rotkehlchen_api_server_with_exchanges: 'APIServer'):
@@ -22,6 +22,7 @@ from rotkehlchen.tests.utils.api import (
 )
 from rotkehlchen.types import ChainID, Location, SupportedBlockchain
 from rotkehlchen.utils.misc import get_system_spec
+from rotkehlchen.utils.network import HTTP_ADAPTER, HostStats
 
 
 def generate_expected_info(
@@ -416,6 +417,60 @@ def test_manage_nodes(rotkehlchen_api_server):
         assert_proper_response(response)
 
 
+def test_query_nodes_stats(rotkehlchen_api_server):
+    """Test that the stats of the queried evm nodes can be seen and that they are
+    only available for evm chains"""
+    ethereum_inquirer = rotkehlchen_api_server.rest_api.rotkehlchen.chains_aggregator.ethereum.node_inquirer  # noqa: E501
+    etherscan_node = ethereum_inquirer.etherscan_node.node_info
+    ethereum_inquirer.nodes_stats[etherscan_node].record(latency=0.25, failed=False)
+    ethereum_inquirer.nodes_stats[etherscan_node].record(latency=1, failed=True)
+
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'rpcnodesstatsresource', blockchain='eth'),
+    )
+    result = assert_proper_sync_response_with_result(response)
+    assert result == [{
+        'name': ETHEREUM_ETHERSCAN_NODE_NAME,
+        'endpoint': etherscan_node.endpoint,
+        'owned': False,
+        'connected': False,
+        'is_pruned': None,
+        'is_archive': None,
+        'requests': 2,
+        'errors': 1,
+        'hedged': 0,
+        'recent_error_rate': 0.5,
+        'median_latency': 1,
+        'p90_latency': 1,
+        'weight_factor': 1,  # not enough calls yet to affect the call order
+    }]
+
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'rpcnodesstatsresource', blockchain='btc'),
+    )
+    assert_error_response(
+        response=response,
+        contained_in_msg='Blockchain name btc is not allowed in this endpoint',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+
+
+def test_query_network_stats(rotkehlchen_api_server):
+    """Test that the stats of the requests made to each host can be queried"""
+    with patch.dict(HTTP_ADAPTER.stats, clear=True):
+        HTTP_ADAPTER.stats['api.etherscan.io'] = HostStats(requests=2, errors=1, total_latency=1)
+        response = requests.get(api_url_for(rotkehlchen_api_server, 'networkstatsresource'))
+
+    assert assert_proper_sync_response_with_result(response) == {'api.etherscan.io': {
+        'requests': 2,
+        'errors': 1,
+        'rate_limited': 0,
+        'retries': 0,
+        'average_latency': 0.5,
+        'throttled_seconds': 0,
+    }}
+
+
 @pytest.mark.parametrize('max_size_in_mb_all_logs', [659])
 def test_configuration(rotkehlchen_api_server):
     """Test that the configuration endpoint returns the expected information"""
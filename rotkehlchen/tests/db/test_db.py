@@ -127,7 +127,6 @@ TABLES_AT_INIT = [
     'evm_internal_transactions',
     'evmtx_receipts',
     'evmtx_receipt_logs',
-    'evmtx_receipt_log_topics',
     'evmtx_address_mappings',
     'evm_tx_mappings',
     'manually_tracked_balances',
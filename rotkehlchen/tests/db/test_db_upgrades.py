@@ -1,6 +1,7 @@
 import json
 import os
 import shutil
+from collections import defaultdict
 from contextlib import ExitStack, contextmanager, suppress
 from pathlib import Path
 from unittest.mock import patch
@@ -2385,6 +2386,13 @@ def test_upgrade_db_42_to_43(user_data_dir, messages_aggregator, data_dir):
             'INSERT INTO user_credentials VALUES (?, ?, ?, ?, ?)',
             ('coinbasepro', Location.COINBASEPRO.serialize_for_db(), 'api_key', 'api_secret', 'passphrase'),  # noqa: E501
         ).rowcount == 1
+        topics = defaultdict(bytes)
+        for log_id, topic in cursor.execute(
+                'SELECT log, topic FROM evmtx_receipt_log_topics ORDER BY log, topic_index',
+        ):
+            topics[log_id] += topic
+        log_ids = {row[0] for row in cursor.execute('SELECT identifier FROM evmtx_receipt_logs')}
+        assert len(topics) != 0
 
     # create csv files that will be deleted in the db upgrade and a parquet one to keep
     airdrops_dir = data_dir / APPDIR_NAME / AIRDROPSDIR_NAME
@@ -2425,6 +2433,13 @@ def test_upgrade_db_42_to_43(user_data_dir, messages_aggregator, data_dir):
             'SELECT COUNT(*) FROM user_credentials WHERE location=?',
             (Location.COINBASEPRO.serialize_for_db(),),
         ).fetchone()[0] == 0
+        # all logs got their topics packed in the logs table and the topics table is gone
+        assert dict(cursor.execute('SELECT identifier, topics FROM evmtx_receipt_logs')) == {
+            log_id: topics[log_id] for log_id in log_ids
+        }
+        assert cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='evmtx_receipt_log_topics'",  # noqa: E501
+        ).fetchone()[0] == 0
 
     assert uniswap_path.exists() is False
     assert zk_path.exists() is False
@@ -2482,7 +2497,7 @@ def test_latest_upgrade_correctness(user_data_dir):
     views_after_creation = {x[0] for x in result}
 
     assert cursor.execute('SELECT value FROM settings WHERE name="version"').fetchone()[0] == '43'
-    removed_tables = set()
+    removed_tables = {'evmtx_receipt_log_topics'}
     removed_views = set()
     missing_tables = tables_before - tables_after_upgrade
     missing_views = views_before - views_after_upgrade
@@ -307,3 +307,60 @@ def test_query_also_internal_evm_transactions(data_dir, username, sql_vm_instruc
             has_premium=True,
         )
         assert result == [tx1, tx3, tx4]
+
+
+def test_get_receipts(database):
+    """Test that receipts of many transactions are read in bulk with their logs and topics
+    in order"""
+    dbevmtx = DBEvmTx(database)
+    tx_hashes = [make_evm_tx_hash() for _ in range(3)]
+    log_address = make_evm_address()
+    with database.user_write() as write_cursor:
+        dbevmtx.add_evm_transactions(
+            write_cursor=write_cursor,
+            evm_transactions=[EvmTransaction(
+                tx_hash=tx_hash,
+                chain_id=ChainID.ETHEREUM,
+                timestamp=Timestamp(1451606400),
+                block_number=1,
+                from_address=ETH_ADDRESS1,
+                to_address=ETH_ADDRESS3,
+                value=0,
+                gas=1,
+                gas_price=1,
+                gas_used=1,
+                input_data=MOCK_INPUT_DATA,
+                nonce=1,
+            ) for tx_hash in tx_hashes],
+            relevant_address=ETH_ADDRESS1,
+        )
+        for tx_hash in tx_hashes[:2]:  # the last transaction has no receipt
+            dbevmtx.add_or_ignore_receipt_data(
+                write_cursor=write_cursor,
+                chain_id=ChainID.ETHEREUM,
+                data={
+                    'transactionHash': tx_hash.hex(),
+                    'contractAddress': None,
+                    'status': 1,
+                    'type': '0x2',
+                    'logs': [{
+                        'logIndex': log_index,
+                        'data': '0x01',
+                        'address': log_address,
+                        'removed': False,
+                        'topics': [f'0x{topic_index:064x}' for topic_index in range(log_index)],
+                    } for log_index in range(4)],
+                },
+            )
+
+    with database.conn.read_ctx() as cursor:
+        receipts = dbevmtx.get_receipts(cursor, tx_hashes, ChainID.ETHEREUM)
+        assert set(receipts) == set(tx_hashes[:2])
+        for tx_hash, receipt in receipts.items():
+            assert receipt.tx_hash == tx_hash
+            assert [log.log_index for log in receipt.logs] == [0, 1, 2, 3]
+            assert [log.topics for log in receipt.logs] == [
+                [topic_index.to_bytes(32, 'big') for topic_index in range(log_index)]
+                for log_index in range(4)
+            ]
+            assert dbevmtx.get_receipt(cursor, tx_hash, ChainID.ETHEREUM) == receipt
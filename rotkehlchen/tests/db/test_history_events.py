@@ -1,3 +1,4 @@
+from itertools import pairwise
 from typing import Any
 from unittest.mock import patch
 
@@ -16,7 +17,7 @@ from rotkehlchen.db.filtering import (
     EvmEventFilterQuery,
     HistoryEventFilterQuery,
 )
-from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.history_events import DBHistoryEvents, history_events_columns_and_joins
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryBaseEntryType, HistoryEvent
 from rotkehlchen.history.events.structures.eth2 import EthDepositEvent, EthWithdrawalEvent
@@ -493,3 +494,145 @@ def test_get_history_events_free_filter(database: 'DBHandler'):
                 for free_event in free_result:
                     assert free_event.identifier is not None
                     assert free_event.identifier > 3, 'Free sub-events should be from the latest 3 event groups'  # noqa: E501
+
+
+def test_get_history_events_keyset_pagination(database: 'DBHandler') -> None:
+    """Test that paginating the events by cursor goes through all of them in the order
+    of the query, including events with the same timestamp and sequence index"""
+    db = DBHistoryEvents(database)
+    with database.user_write() as write_cursor:
+        for idx in range(20):
+            db.add_history_event(
+                write_cursor=write_cursor,
+                event=HistoryEvent(
+                    event_identifier=f'TEST{idx % 7}',
+                    sequence_index=idx // 7,
+                    timestamp=TimestampMS(1000 * (idx % 7 % 3)),
+                    location=Location.ETHEREUM,
+                    event_type=HistoryEventType.TRADE,
+                    event_subtype=HistoryEventSubType.NONE,
+                    asset=A_ETH,
+                    balance=Balance(FVal(idx)),
+                ),
+            )
+
+    def get_events(filter_query: HistoryEventFilterQuery) -> list[HistoryEvent]:
+        with database.conn.read_ctx() as cursor:
+            return db.get_history_events(cursor=cursor, filter_query=filter_query, has_premium=True)  # type: ignore[return-value]  # only HistoryEvents were added  # noqa: E501
+
+    order_by_rules = [('timestamp', False), ('sequence_index', True)]
+    all_events = get_events(HistoryEventFilterQuery.make(order_by_rules=order_by_rules))
+    paginated_events, cursor_token = [], None
+    while True:
+        filter_query = HistoryEventFilterQuery.make(order_by_rules=order_by_rules)
+        filter_query.set_keyset_pagination(limit=3, cursor=cursor_token)
+        events = get_events(filter_query)
+        assert len(events) <= 3
+        paginated_events.extend(events)
+        if (cursor_token := filter_query.next_page_cursor(events)) is None:
+            break
+
+    assert len(paginated_events) == 20
+    assert len({x.identifier for x in paginated_events}) == len(paginated_events)
+    assert [x.timestamp for x in paginated_events] == sorted((x.timestamp for x in all_events), reverse=True)  # noqa: E501
+    for previous, event in pairwise(paginated_events):
+        if previous.timestamp == event.timestamp:
+            assert (previous.sequence_index, previous.identifier) < (event.sequence_index, event.identifier)  # noqa: E501
+
+
+def test_iterate_history_events_in_pages(database: 'DBHandler') -> None:
+    """Test that reading the events in pages returns all of them once and in order even
+    if events are added between the pages"""
+    db = DBHistoryEvents(database)
+
+    def make_event(idx: int) -> HistoryEvent:
+        return HistoryEvent(
+            event_identifier=f'TEST{idx}',
+            sequence_index=0,
+            timestamp=TimestampMS(1000 * idx),
+            location=Location.ETHEREUM,
+            event_type=HistoryEventType.TRADE,
+            event_subtype=HistoryEventSubType.NONE,
+            asset=A_ETH,
+            balance=Balance(FVal(idx)),
+        )
+
+    with database.user_write() as write_cursor:
+        for idx in range(1, 8):
+            db.add_history_event(write_cursor=write_cursor, event=make_event(idx))
+
+    pages = []
+    for page in db.iterate_history_events_in_pages(
+            filter_query=HistoryEventFilterQuery.make(),
+            has_premium=True,
+            page_size=3,
+    ):
+        pages.append(page)
+        if len(pages) == 1:  # an event after the first page is still read
+            with database.user_write() as write_cursor:
+                db.add_history_event(write_cursor=write_cursor, event=make_event(8))
+
+    assert [len(page) for page in pages] == [3, 3, 2]
+    assert [x.timestamp for page in pages for x in page] == [TimestampMS(1000 * idx) for idx in range(1, 9)]  # noqa: E501
+
+
+def test_iterate_history_events_in_pages_skips_undeserializable(database: 'DBHandler') -> None:
+    """Test that paging continues after the rows that fail to deserialize, reading each of
+    them once, and does not stop at a page in which all the rows fail"""
+    db = DBHistoryEvents(database)
+    with database.user_write() as write_cursor:
+        for idx in range(1, 8):
+            db.add_history_event(write_cursor=write_cursor, event=HistoryEvent(
+                event_identifier=f'TEST{idx}',
+                sequence_index=0,
+                timestamp=TimestampMS(1000 * idx),
+                location=Location.ETHEREUM,
+                event_type=HistoryEventType.TRADE,
+                event_subtype=HistoryEventSubType.NONE,
+                asset=A_ETH,
+                balance=Balance(FVal(idx)),
+            ))
+        # the whole first page and the end of the second page can't be deserialized
+        write_cursor.execute(
+            "UPDATE history_events SET type='invalid' WHERE event_identifier IN "
+            "('TEST1', 'TEST2', 'TEST3', 'TEST5', 'TEST6')",
+        )
+
+    with patch('rotkehlchen.db.history_events.log.error') as log_error:
+        pages = list(db.iterate_history_events_in_pages(
+            filter_query=HistoryEventFilterQuery.make(),
+            has_premium=True,
+            page_size=3,
+        ))
+
+    assert [[x.event_identifier for x in page] for page in pages] == [['TEST4'], ['TEST7']]
+    assert log_error.call_count == 5
+
+
+def test_history_events_query_joins_only_needed_tables() -> None:
+    """Test that only the info tables of the entry types a filter can match are joined"""
+    for filter_query, expected_tables in (
+        (HistoryEventFilterQuery.make(), {'evm_events_info', 'eth_staking_events_info'}),
+        (HistoryEventFilterQuery.make(
+            entry_types=IncludeExcludeFilterData(values=[HistoryBaseEntryType.HISTORY_EVENT]),
+        ), set()),
+        (HistoryEventFilterQuery.make(
+            entry_types=IncludeExcludeFilterData(
+                values=[
+                    HistoryBaseEntryType.HISTORY_EVENT,
+                    HistoryBaseEntryType.EVM_EVENT,
+                    HistoryBaseEntryType.ETH_DEPOSIT_EVENT,
+                ],
+                operator='NOT IN',
+            ),
+        ), {'eth_staking_events_info'}),
+        (EvmEventFilterQuery.make(), {'evm_events_info'}),
+        (EthDepositEventFilterQuery.make(), {'evm_events_info', 'eth_staking_events_info'}),
+    ):
+        query = history_events_columns_and_joins(filter_query.get_entry_types())
+        assert {
+            table for table in ('evm_events_info', 'eth_staking_events_info')
+            if f'LEFT JOIN {table}' in query
+        } == expected_tables
+        # the row layout stays the same whatever is joined
+        assert query.count(',') == history_events_columns_and_joins(set(HistoryBaseEntryType)).count(',')  # noqa: E501
@@ -1,6 +1,8 @@
 import pytest
 
-from rotkehlchen.chain.bitcoin.xpub import XpubData
+from rotkehlchen.chain.accounts import BlockchainAccountData
+from rotkehlchen.chain.bitcoin.xpub import XpubData, XpubDerivedAddressData
+from rotkehlchen.constants import ZERO
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.types import SupportedBlockchain
 
@@ -19,6 +21,31 @@ def test_get_last_consecutive_xpub_derived_indices(setup_db_for_xpub_tests):
         assert change_idx == 0
 
 
+def test_get_last_consecutive_xpub_derived_indices_unordered(setup_db_for_xpub_tests):
+    """Test that the derived indices are consecutive regardless of the order the
+    mappings were saved in. Addresses with transactions are saved before the ones
+    without transactions preceding them."""
+    db, _, _, xpub3, _ = setup_db_for_xpub_tests
+    root = xpub3.xpub.derive_child(0)
+    derived_addresses_data = [
+        XpubDerivedAddressData(0, idx, root.derive_child(idx).address(), ZERO)
+        for idx in (0, 3, 4, 7, 1, 2)
+    ]
+    with db.user_write() as write_cursor:
+        db.add_blockchain_accounts(write_cursor, account_data=[
+            BlockchainAccountData(chain=xpub3.blockchain, address=x.address)
+            for x in derived_addresses_data
+        ])
+        db.ensure_xpub_mappings_exist(
+            write_cursor,
+            xpub_data=xpub3,
+            derived_addresses_data=derived_addresses_data,
+        )
+
+    with db.conn.read_ctx() as cursor:
+        assert db.get_last_consecutive_xpub_derived_indices(cursor, xpub3) == (4, 0)
+
+
 def test_get_addresses_to_xpub_mapping(setup_db_for_xpub_tests):
     db, xpub1, xpub2, _, all_addresses = setup_db_for_xpub_tests
     # Also add a non-existing address in there for fun
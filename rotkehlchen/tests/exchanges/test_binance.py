@@ -864,6 +864,36 @@ def test_binance_query_trade_history_custom_markets(function_scope_binance):
     assert count == len(markets)
 
 
+def test_binance_query_trade_history_resumes_from_market_cursor(function_scope_binance):
+    """Test that querying a later range resumes each market from the trade after the
+    last one already queried, while an overlapping range scans the market again"""
+    binance = function_scope_binance
+    binance.selected_pairs = ['BNBBTC', 'ETHBTC']
+    queried_from_ids = []
+
+    def mock_my_trades(url, params, *args, **kwargs):  # pylint: disable=unused-argument
+        if 'myTrades' in url:
+            queried_from_ids.append((params['symbol'], params['fromId']))
+            text = BINANCE_MYTRADES_RESPONSE if params['symbol'] == 'BNBBTC' else '[]'
+        else:
+            text = '[]'
+        return MockResponse(200, text)
+
+    with patch.object(binance.session, 'request', side_effect=mock_my_trades):
+        trades, _ = binance.query_online_trade_history(start_ts=0, end_ts=1564301134)
+        assert len(trades) == 1
+        assert sorted(queried_from_ids) == [('BNBBTC', 0), ('ETHBTC', 0)]
+
+        queried_from_ids.clear()  # the trade at 1499865549 is before the new range
+        binance.query_online_trade_history(start_ts=1564301135, end_ts=1664301134)
+        assert sorted(queried_from_ids) == [('BNBBTC', 28458), ('ETHBTC', 0)]
+
+        queried_from_ids.clear()  # an earlier range has to see the trade again
+        trades, _ = binance.query_online_trade_history(start_ts=1499865549, end_ts=1564301134)
+        assert len(trades) == 1
+        assert sorted(queried_from_ids) == [('BNBBTC', 0), ('ETHBTC', 0)]
+
+
 @pytest.mark.parametrize('default_mock_price_value', [ONE])
 def test_binance_query_lending_interests_history(
         function_scope_binance: 'Binance',
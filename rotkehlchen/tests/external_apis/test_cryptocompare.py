@@ -2,6 +2,7 @@ import datetime
 import os
 from unittest.mock import patch
 
+import gevent
 import pytest
 
 from rotkehlchen.assets.asset import Asset
@@ -18,7 +19,10 @@ from rotkehlchen.constants.assets import (
     A_EUR,
     A_USD,
 )
+from rotkehlchen.errors.misc import RemoteError
+from rotkehlchen.errors.price import PriceQueryUnsupportedAsset
 from rotkehlchen.externalapis.cryptocompare import (
+    CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY,
     CRYPTOCOMPARE_HOURQUERYLIMIT,
     CRYPTOCOMPARE_SPECIAL_CASES_MAPPING,
     Cryptocompare,
@@ -341,3 +345,60 @@ def test_cryptocompare_query_with_api_key(cryptocompare):
         match_main_currency=False,
     )
     assert price is not None
+
+
+def test_cryptocompare_histohour_pages_queried_concurrently(cryptocompare):
+    """Test that the concurrently queried histohour pages are stitched in order and that
+    querying stops at the first page with no prices, ignoring the pages after it"""
+    genesis_ts, from_ts = 1500000000, 1700000000
+    queried_pages = []
+
+    def mock_histohour(from_asset, to_asset, limit, to_timestamp):  # pylint: disable=unused-argument
+        queried_pages.append(to_timestamp)
+        if to_timestamp < genesis_ts - limit * 3600:  # pages after the all zeros one fail
+            raise RemoteError('Should not be raised')
+
+        gevent.sleep(0.01 if to_timestamp == from_ts else 0)  # first page finishes last
+        end_ts = to_timestamp - to_timestamp % 3600
+        start_ts = end_ts - limit * 3600
+        return {'TimeFrom': start_ts, 'TimeTo': end_ts, 'Data': [
+            {'time': ts, 'close': 0 if ts < genesis_ts else 1}
+            for ts in range(start_ts, end_ts + 1, 3600)
+        ]}
+
+    with patch.object(cryptocompare, 'query_endpoint_histohour', side_effect=mock_histohour):
+        result = cryptocompare._get_histohour_data_for_range(
+            from_asset=A_ETH,
+            to_asset=A_USD,
+            from_timestamp=Timestamp(from_ts),
+            to_timestamp=Timestamp(0),
+        )
+
+    timestamps = [entry['time'] for entry in result]
+    assert timestamps == list(range(timestamps[0], from_ts - from_ts % 3600 + 1, 3600))
+    assert timestamps[0] <= genesis_ts
+    assert len(queried_pages) <= (from_ts - genesis_ts) // (CRYPTOCOMPARE_HOURQUERYLIMIT * 3600) + 2 + CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY  # noqa: E501
+
+
+def test_cryptocompare_pairs_query_continues_after_unsupported_asset(cryptocompare):
+    """Test that a pair cryptocompare does not know is logged and skipped without stopping
+    the queries of the other pairs"""
+    queried_pairs = []
+
+    def mock_query(from_asset, to_asset, timestamp):  # pylint: disable=unused-argument
+        queried_pairs.append((from_asset, to_asset))
+        if from_asset == A_DAO:
+            raise PriceQueryUnsupportedAsset(from_asset.identifier)
+
+    with (
+        patch.object(cryptocompare, 'query_and_store_historical_data', side_effect=mock_query),
+        patch('rotkehlchen.externalapis.cryptocompare.log.warning') as warning,
+    ):
+        cryptocompare.query_and_store_historical_data_for_pairs(
+            pairs=[(A_DAO, A_USD), (A_ETH, A_USD)],
+            timestamp=Timestamp(1700000000),
+        )
+
+    assert set(queried_pairs) == {(A_DAO, A_USD), (A_ETH, A_USD)}
+    assert warning.call_count == 1
+    assert A_DAO.identifier in warning.call_args.args[0]
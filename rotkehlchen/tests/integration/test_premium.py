@@ -175,6 +175,58 @@ def test_upload_data_to_server_same_hash(rotkehlchen_instance):
         assert not post_mock.called
 
 
+@pytest.mark.parametrize('start_with_valid_premium', [True])
+def test_upload_data_to_server_no_changes(rotkehlchen_instance: 'Rotkehlchen') -> None:
+    """Test that after an upload the DB is not exported again while nothing changed"""
+    with rotkehlchen_instance.data.db.user_write() as write_cursor:
+        # Write anything in the DB to set a non-zero last_write_ts
+        rotkehlchen_instance.data.db.set_settings(write_cursor, ModifiableDBSettings(main_currency=A_EUR.resolve_to_asset_with_oracles()))  # noqa: E501
+
+    with rotkehlchen_instance.data.db.conn.read_ctx() as cursor:
+        last_write_ts = rotkehlchen_instance.data.db.get_setting(cursor, name='last_write_ts')
+
+    assert rotkehlchen_instance.premium is not None
+    patched_post = patch.object(
+        rotkehlchen_instance.premium.session,
+        'post',
+        return_value=MockResponse(200, '{"success": true}'),
+    )
+    patched_compress = patch.object(
+        rotkehlchen_instance.data,
+        'compress_and_encrypt_db',
+        wraps=rotkehlchen_instance.data.compress_and_encrypt_db,
+    )
+    with patched_post as post_mock, patched_compress as compress_mock:
+        with create_patched_requests_get_for_premium(
+            session=rotkehlchen_instance.premium.session,
+            metadata_last_modify_ts=0,
+            metadata_data_hash='',
+            metadata_data_size=2,
+            saved_data=b'foo',
+        ):
+            assert rotkehlchen_instance.premium_sync_manager.maybe_upload_data_to_server() == (True, None)  # noqa: E501
+
+        assert post_mock.call_count == compress_mock.call_count == 1
+        with (
+            create_patched_requests_get_for_premium(  # the server now has what we uploaded
+                session=rotkehlchen_instance.premium.session,
+                metadata_last_modify_ts=post_mock.call_args.kwargs['data']['last_modify_ts'],
+                metadata_data_hash=post_mock.call_args.kwargs['data']['original_hash'],
+                metadata_data_size=len(post_mock.call_args.kwargs['files']['db_file']),
+                saved_data=b'foo',
+            ),
+            patch.object(rotkehlchen_instance.data.msg_aggregator, 'add_message') as message_mock,
+        ):
+            assert rotkehlchen_instance.premium_sync_manager.maybe_upload_data_to_server() == (False, 'Remote database is up to date')  # noqa: E501
+
+        assert post_mock.call_count == compress_mock.call_count == 1
+        # nothing changed so there is nothing for the user to do
+        assert message_mock.call_args.kwargs['data'] == {'uploaded': False, 'actionable': False, 'message': 'Remote database is up to date'}  # noqa: E501
+
+    with rotkehlchen_instance.data.db.conn.read_ctx() as cursor:
+        assert rotkehlchen_instance.data.db.get_setting(cursor, name='last_write_ts') == last_write_ts  # noqa: E501
+
+
 @pytest.mark.parametrize('start_with_valid_premium', [True])
 @pytest.mark.parametrize('db_settings', [
     {'ask_user_upon_size_discrepancy': True},
@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 import pytest
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.pnl import PNL, PnlTotals
 from rotkehlchen.accounting.structures.balance import Balance
+from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
 from rotkehlchen.accounting.types import MissingPrice
 from rotkehlchen.assets.asset import EvmToken
 from rotkehlchen.chain.ethereum.modules.eth2.structures import ValidatorDailyStats
@@ -12,8 +16,10 @@ from rotkehlchen.chain.evm.decoding.cowswap.constants import CPT_COWSWAP
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_BTC, A_COMP, A_ETH, A_EUR, A_USD, A_USDC, A_WBTC
 from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.db.filtering import ReportDataFilterQuery
+from rotkehlchen.db.reports import DBAccountingReports
 from rotkehlchen.exchanges.data_structures import Trade
-from rotkehlchen.fval import FVal
+from rotkehlchen.fval import AcceptableFValOtherInput, FVal, _evaluate_input
 from rotkehlchen.history.events.structures.base import HistoryEvent
 from rotkehlchen.history.events.structures.evm_event import EvmEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
@@ -65,6 +71,84 @@ def test_simple_accounting(accountant, google_service, expected_pnls):
     check_pnls_and_csv(accountant, expected_pnls, google_service)
 
 
+@pytest.mark.parametrize('db_settings', [
+    {'cost_basis_method': CostBasisMethod.FIFO},
+    {'cost_basis_method': CostBasisMethod.ACB},
+])
+@pytest.mark.parametrize('mocked_price_queries', [prices])
+def test_accounting_resumes_from_checkpoint(accountant: 'Accountant') -> None:
+    """Test that a report starting after a yearly checkpoint resumes from it with
+    the same results and that changing an event before it invalidates it"""
+    start_ts, end_ts = Timestamp(1451606400), Timestamp(1495751688)  # 2016-01-01
+    accounting_history_process(accountant, start_ts, end_ts, history1)
+    no_message_errors(accountant.msg_aggregator)
+    pnls = dict(accountant.pots[0].pnls)
+    processed_events_num = len(accountant.pots[0].processed_events)
+    with accountant.db.conn_transient.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT timestamp, events_num FROM accounting_checkpoints',
+        ).fetchall() == [(start_ts, 2)]
+
+    # the two buys of 2015 are restored from the checkpoint and not processed again
+    accounting_history_process(accountant, start_ts, end_ts, history1)
+    no_message_errors(accountant.msg_aggregator)
+    assert dict(accountant.pots[0].pnls) == pnls
+    assert len(accountant.pots[0].processed_events) == processed_events_num - 2
+
+    # changing an event before the checkpoint makes the report process everything again
+    history = [replace(history1[0], amount=AssetAmount(FVal(83))), *history1[1:]]
+    accounting_history_process(accountant, start_ts, end_ts, history)
+    no_message_errors(accountant.msg_aggregator)
+    assert len(accountant.pots[0].processed_events) == processed_events_num
+
+
+@pytest.mark.parametrize('db_settings', [
+    {'cost_basis_method': CostBasisMethod.FIFO},
+    {'cost_basis_method': CostBasisMethod.ACB},
+])
+@pytest.mark.parametrize('mocked_price_queries', [prices])
+def test_fval_operations_keep_report_results(accountant: 'Accountant') -> None:
+    """Test that an accounting report has the same overview and events when FVal creates
+    its results through the constructor and compares with compare_signal, as it did before
+    those operations were made cheaper"""
+    def compare_signal_in(*signals: int) -> Callable[[FVal, AcceptableFValOtherInput], bool]:
+        return lambda self, other: self.num.compare_signal(_evaluate_input(other)) in signals
+
+    def report_results() -> tuple[dict[str, Any], list[ProcessedAccountingEvent]]:
+        report_id = accountant.process_history(
+            start_ts=Timestamp(1436979735),
+            end_ts=Timestamp(1495751688),
+            events=history1,
+        )
+        no_message_errors(accountant.msg_aggregator)
+        dbpnl = DBAccountingReports(accountant.db)
+        report = dbpnl.get_reports(report_id=report_id, with_limit=False)[0][0]
+        events = dbpnl.get_report_data(
+            filter_=ReportDataFilterQuery.make(report_id=report_id),
+            with_limit=False,
+        )[0]
+        return report, events
+
+    report, events = report_results()
+    with (
+        patch('rotkehlchen.fval._new_fval', new=FVal),
+        patch.multiple(
+            FVal,
+            __gt__=compare_signal_in(1),
+            __lt__=compare_signal_in(-1),
+            __le__=compare_signal_in(-1, 0),
+            __ge__=compare_signal_in(1, 0),
+        ),
+    ):
+        reference_report, reference_events = report_results()
+
+    assert len(events) != 0
+    assert report['overview'] == reference_report['overview']
+    assert report['processed_actions'] == reference_report['processed_actions']
+    assert events == reference_events
+    assert [(str(x.pnl.taxable), str(x.pnl.free)) for x in events] == [(str(x.pnl.taxable), str(x.pnl.free)) for x in reference_events]  # noqa: E501
+
+
 @pytest.mark.parametrize('mocked_price_queries', [prices])
 @pytest.mark.parametrize(('db_settings', 'expected_pnl_totals'), [
     (
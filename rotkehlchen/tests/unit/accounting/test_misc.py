@@ -1,12 +1,15 @@
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
 from rotkehlchen.accounting.mixins.event import AccountingEventMixin, AccountingEventType
 from rotkehlchen.accounting.pnl import PNL, PnlTotals
 from rotkehlchen.accounting.structures.balance import Balance
+from rotkehlchen.accounting.structures.types import ActionType
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_ETH, A_ETH2, A_EUR, A_KFEE, A_USD, A_USDT
+from rotkehlchen.errors.price import NoPriceForGivenTimestamp
 from rotkehlchen.exchanges.data_structures import Trade
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryEvent
@@ -226,3 +229,139 @@ def test_main_currency_is_respected(
     assert len(warnings) == len(errors) == 0
     # Check that the price is correctly computed in GBP
     assert accountant.pots[0].processed_events[0].price == trade_rate * mocked_price_queries['USD']['GBP'][1609537953]  # noqa: E501
+
+
+@pytest.mark.parametrize('mocked_price_queries', [prices])
+def test_prefetch_rates_in_profit_currency(accountant: 'Accountant') -> None:
+    """Test that the prices needed by the events are prefetched once per asset
+    and hour, in chronological order per asset and skipping the profit currency
+    and events after the end of the period"""
+    history: list[AccountingEventMixin] = [
+        Trade(
+            timestamp=Timestamp(timestamp),
+            location=Location.EXTERNAL,
+            base_asset=A_ETH,
+            quote_asset=quote_asset,
+            trade_type=TradeType.BUY,
+            amount=AssetAmount(ONE),
+            rate=Price(ONE),
+            fee=None,
+            fee_currency=None,
+            link=None,
+        ) for timestamp, quote_asset in (
+            (1539713238, A_EUR),
+            (1539713300, A_EUR),  # same hour as the previous one
+            (1539720000, A_USDT),
+            (1624395186, A_EUR),  # after the end of the period
+        )
+    ]
+    pot = accountant.pots[0]
+    pot.profit_currency = A_EUR
+    queried = []
+
+    def mock_get_rate(asset, timestamp):
+        queried.append((asset, timestamp))
+        return ONE
+
+    with patch.object(pot, 'get_rate_in_profit_currency', side_effect=mock_get_rate):
+        pot.prefetch_rates_in_profit_currency(
+            events=history,
+            start_ts=Timestamp(0),
+            end_ts=Timestamp(1600000000),
+            calculate_past_cost_basis=True,
+            ignored_ids_mapping={},
+        )
+
+    assert sorted(queried, key=lambda x: (x[0].identifier, x[1])) == [
+        (A_ETH, 1539713238),
+        (A_ETH, 1539720000),
+        (A_USDT, 1539720000),
+    ]
+
+
+@pytest.mark.parametrize('mocked_price_queries', [prices])
+@pytest.mark.parametrize('db_settings', [{'calculate_past_cost_basis': False}])
+def test_prefetch_rates_skips_events_not_processed(accountant: 'Accountant') -> None:
+    """Test that no price is queried for the events that processing skips. Those before
+    the start of the period when past cost basis is not calculated and those ignored"""
+    history: list[AccountingEventMixin] = [
+        Trade(
+            timestamp=Timestamp(timestamp),
+            location=Location.EXTERNAL,
+            base_asset=base_asset,
+            quote_asset=A_EUR,
+            trade_type=TradeType.BUY,
+            amount=AssetAmount(ONE),
+            rate=Price(ONE),
+            fee=None,
+            fee_currency=None,
+            link=link,
+        ) for timestamp, base_asset, link in (
+            (1446979735, A_ETH, None),  # before the start of the period
+            (1476979735, A_ETH, 'ignored_trade'),
+            (1486979735, A_USDT, None),  # ignored asset
+            (1496979735, A_ETH, None),
+        )
+    ]
+    with accountant.db.user_write() as write_cursor:
+        accountant.db.add_to_ignored_action_ids(
+            write_cursor=write_cursor,
+            action_type=ActionType.TRADE,
+            identifiers=[history[1].get_identifier()],
+        )
+        accountant.db.add_to_ignored_assets(write_cursor=write_cursor, asset=A_USDT)
+    pot = accountant.pots[0]
+    queried = []
+    original_get_rate = pot.get_rate_in_profit_currency
+
+    def mock_get_rate(asset, timestamp):
+        queried.append((asset, timestamp))
+        return original_get_rate(asset=asset, timestamp=timestamp)
+
+    with patch.object(pot, 'get_rate_in_profit_currency', side_effect=mock_get_rate):
+        accounting_history_process(
+            accountant=accountant,
+            start_ts=Timestamp(1466979735),
+            end_ts=Timestamp(1519693374),
+            history_list=history,
+        )
+
+    assert queried != []
+    assert all(timestamp == 1496979735 for _, timestamp in queried)
+
+
+def test_prefetch_rates_stops_when_oracle_unavailable(accountant: 'Accountant') -> None:
+    """Test that price prefetching stops once an oracle is rate limited or penalized
+    instead of querying it further"""
+    history: list[AccountingEventMixin] = [
+        Trade(
+            timestamp=Timestamp(1539713238 + idx * 3600),
+            location=Location.EXTERNAL,
+            base_asset=A_ETH,
+            quote_asset=A_EUR,
+            trade_type=TradeType.BUY,
+            amount=AssetAmount(ONE),
+            rate=Price(ONE),
+            fee=None,
+            fee_currency=None,
+            link=None,
+        ) for idx in range(5)
+    ]
+    pot = accountant.pots[0]
+    pot.profit_currency = A_EUR
+    queried = []
+
+    def mock_get_rate(asset, timestamp):
+        queried.append((asset, timestamp))
+        raise NoPriceForGivenTimestamp(asset, A_EUR, timestamp, oracles_unavailable=True)
+
+    with patch.object(pot, 'get_rate_in_profit_currency', side_effect=mock_get_rate):
+        pot.prefetch_rates_in_profit_currency(
+            events=history,
+            start_ts=Timestamp(0),
+            end_ts=Timestamp(1600000000),
+            calculate_past_cost_basis=True,
+            ignored_ids_mapping={},
+        )
+
+    assert queried == [(A_ETH, 1539713238)]
@@ -550,6 +550,40 @@ def test_lst_complete_delayed_withdrawals(database, ethereum_inquirer, ethereum_
     assert balances[ethereum_accounts[0]].assets[cbeth] == Balance()
 
 
+@pytest.mark.vcr(filter_query_parameters=['apikey'])
+@pytest.mark.parametrize('ethereum_accounts', [['0x6Ee701145E1F44C9AA9fc8889F80863198838145']])
+def test_lst_complete_delayed_withdrawals_in_one_batch(database, ethereum_inquirer, ethereum_transaction_decoder, eth_transactions, ethereum_accounts, inquirer):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that when the queuing and the completion of a withdrawal are decoded in the same
+    batch of writes the completion still finds the queued withdrawal and marks it completed"""
+    queue_tx_hash = deserialize_evm_tx_hash('0xeab48010e80d50b7d35fd43a886448ffca1e798b641baf7c8877fc04075d972b')  # noqa: E501
+    tx_hash = deserialize_evm_tx_hash('0x2c9a7caf78126fdfe43760dedbf3648c6a3255ee17a7bc312372dba26e16132b')  # noqa: E501
+    for hash_to_query in (queue_tx_hash, tx_hash):
+        eth_transactions.get_or_query_transaction_receipt(tx_hash=hash_to_query)
+
+    events = ethereum_transaction_decoder.decode_transaction_hashes(
+        ignore_cache=True,
+        tx_hashes=[queue_tx_hash, tx_hash],
+        batch_writes=True,
+    )
+    cbeth = Asset('eip155:1/erc20:0xBe9895146f7AF43049ca1c1AE358B0541Ea49704')
+    assert [(event.tx_hash, event.event_type, event.event_subtype, event.notes) for event in events if event.tx_hash == tx_hash and event.counterparty == CPT_EIGENLAYER] == [  # noqa: E501
+        (tx_hash, HistoryEventType.INFORMATIONAL, HistoryEventSubType.NONE, 'Complete eigenlayer withdrawal of cbETH'),  # noqa: E501
+        (tx_hash, HistoryEventType.WITHDRAWAL, HistoryEventSubType.REMOVE_ASSET, 'Withdraw 0.108703837292797063 cbETH from Eigenlayer'),  # noqa: E501
+    ]
+    with database.conn.read_ctx() as cursor:
+        queued_events = DBHistoryEvents(database).get_history_events(
+            cursor=cursor,
+            filter_query=EvmEventFilterQuery.make(
+                tx_hashes=[queue_tx_hash],
+                event_subtypes=[HistoryEventSubType.REMOVE_ASSET],
+            ),
+            has_premium=True,
+        )
+    assert len(queued_events) == 1
+    assert queued_events[0].asset == cbeth
+    assert queued_events[0].extra_data['completed'] is True
+
+
 @pytest.mark.vcr(filter_query_parameters=['apikey'])
 @pytest.mark.parametrize('ethereum_accounts', [['0xCd2bCdE423F36E1B81a25168D5373f908546c9BE', '0xf17606D3FFbd5B07454542146a74712Eb797Ac0a']])  # noqa: E501
 def test_claim_delayed_withdrawals(database, ethereum_inquirer, ethereum_accounts):
@@ -789,6 +789,59 @@ def test_accounting_hifo_order(accountant: Accountant):
     ]
 
 
+def test_hifo_spend_uses_many_acquisitions(accountant: Accountant):
+    """Check that a spend using up many small acquisitions consumes them from the highest
+    rate down, splits them at the taxfree period and leaves the rest in the same order
+    after the state is serialized and restored"""
+    asset = A_BTC
+    cost_basis = accountant.pots[0].cost_basis
+    cost_basis.reset(DBSettings(cost_basis_method=CostBasisMethod.HIFO, taxfree_after_period=100))
+    asset_events = cost_basis.get_events(asset)
+    acquisitions = [AssetAcquisitionEvent(
+        amount=FVal('0.1'),
+        timestamp=Timestamp(i),
+        rate=Price(FVal(i % 50 + 1)),
+        index=i,
+    ) for i in range(1000)]
+    for acquisition in acquisitions:
+        asset_events.acquisitions_manager.add_in_event(acquisition)
+
+    expected_order = sorted(acquisitions, key=lambda x: (-x.rate, x.timestamp))
+    cinfo = asset_events.acquisitions_manager.calculate_spend_cost_basis(
+        spending_amount=FVal('60.05'),
+        spending_asset=asset,
+        timestamp=Timestamp(600),
+        missing_acquisitions=cost_basis.missing_acquisitions,
+        used_acquisitions=asset_events.used_acquisitions,
+        settings=cost_basis.settings,
+        timestamp_to_date=cost_basis.timestamp_to_date,
+    )
+    assert cinfo.is_complete is True
+    assert [x.event for x in cinfo.matched_acquisitions] == expected_order[:601]
+    assert cinfo.matched_acquisitions[-1].amount == FVal('0.05')
+    assert asset_events.used_acquisitions == expected_order[:600]
+    assert all(x.taxable is (x.event.timestamp >= 500) for x in cinfo.matched_acquisitions)
+    taxable_amount, taxable_bought_cost, taxfree_bought_cost = ZERO, ZERO, ZERO
+    for matched in cinfo.matched_acquisitions:
+        if matched.taxable:
+            taxable_amount += matched.amount
+            taxable_bought_cost += matched.amount * matched.event.rate
+        else:
+            taxfree_bought_cost += matched.amount * matched.event.rate
+    assert cinfo.taxable_amount == taxable_amount
+    assert cinfo.taxable_bought_cost == taxable_bought_cost
+    assert cinfo.taxfree_bought_cost == taxfree_bought_cost
+
+    remaining = asset_events.acquisitions_manager.get_acquisitions()
+    assert list(remaining) == expected_order[600:]
+    assert remaining[0].remaining_amount == FVal('0.05')
+    state = cost_basis.serialize_state()
+    cost_basis.reset(cost_basis.settings)
+    cost_basis.restore_state(state)
+    restored = cost_basis.get_events(asset).acquisitions_manager.get_acquisitions()
+    assert [(x.index, x.remaining_amount) for x in restored] == [(x.index, x.remaining_amount) for x in remaining]  # noqa: E501
+
+
 def test_missing_acquisitions(accountant: Accountant):
     """Test that missing acquisitions are added properly by
     reduce_asset_amount and calculate_spend_cost_basis
@@ -992,6 +1045,28 @@ def test_accounting_average_cost_basis(accountant: Accountant):
                     assert value == event.cost_basis.taxable_bought_cost
 
 
+def test_average_cost_basis_multi_acquisition_spend():
+    """Check that a spend using up several acquisitions reduces the total ACB once per
+    acquisition, which rounds differently from reducing it once for the whole spend"""
+    manager = AverageCostBasisMethod()
+    for idx, (amount, rate) in enumerate((('0.3', 10), ('0.3', 20), ('2.9', 30))):
+        manager.add_in_event(AssetAcquisitionEvent(
+            amount=FVal(amount),
+            timestamp=Timestamp(idx),
+            rate=Price(FVal(rate)),
+            index=idx,
+        ))
+
+    assert manager.current_total_acb == FVal(96)
+    assert manager.current_amount == FVal('3.5')
+    consumption = manager.consume(amount=FVal('0.7'), asset=A_ETH)
+    assert [x[1] for x in consumption.matched] == [FVal('0.3'), FVal('0.3'), FVal('0.1')]
+    assert consumption.missing_amount == ZERO
+    assert manager.current_amount == FVal('2.8')
+    # reducing it once for the whole spend would give exactly 96 * 2.8 / 3.5 = 76.8
+    assert manager.current_total_acb == FVal('76.8000000000000000000000000000000000000000000000000000000000000000000000000001')  # noqa: E501
+
+
 @pytest.mark.parametrize('mocked_price_queries', [{
     A_ETH: {A_EUR: {1469020840: ONE}},
     A_3CRV: {A_EUR: {1469020840: ONE}},
@@ -1,5 +1,8 @@
+import json
+from collections import defaultdict
 from unittest.mock import patch
 
+import gevent
 import pytest
 
 from rotkehlchen.chain.accounts import BlockchainAccountData
@@ -7,8 +10,10 @@ from rotkehlchen.chain.ethereum.constants import ETHEREUM_ETHERSCAN_NODE_NAME
 from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
 from rotkehlchen.chain.evm.decoding.constants import ERC20_OR_ERC721_TRANSFER
 from rotkehlchen.chain.evm.decoding.kyber.constants import KYBER_AGGREGATOR_SWAPPED
+from rotkehlchen.chain.evm.node_inquirer import MULTICALL_CHUNKS_PER_NODE, RECEIPTS_BATCH_SIZE
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
-from rotkehlchen.chain.evm.types import string_to_evm_address
+from rotkehlchen.chain.evm.types import NodeName, Web3Node, WeightedNode, string_to_evm_address
+from rotkehlchen.constants import ONE
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.errors.misc import EventNotInABI, RemoteError
 from rotkehlchen.tests.utils.checks import assert_serialized_dicts_equal
@@ -20,7 +25,8 @@ from rotkehlchen.tests.utils.ethereum import (
     INFURA_ETH_NODE,
     wait_until_all_nodes_connected,
 )
-from rotkehlchen.tests.utils.factories import make_evm_address
+from rotkehlchen.tests.utils.factories import make_evm_address, make_evm_tx_hash
+from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import ChainID, EvmTransaction, SupportedBlockchain, deserialize_evm_tx_hash
 from rotkehlchen.utils.hexbytes import hexstring_to_bytes
 
@@ -437,3 +443,144 @@ def test_get_contract_deployed_block(ethereum_inquirer):
     """Test that getting deployed block of a contract address works"""
     assert ethereum_inquirer.get_contract_deployed_block('0x5a464C28D19848f44199D003BeF5ecc87d090F87') == 12251871  # noqa: E501
     assert ethereum_inquirer.get_contract_deployed_block('0x9531C059098e3d194fF87FebB587aB07B30B1306') is None  # noqa: E501
+
+
+def test_query_transaction_receipts_batches(ethereum_inquirer):
+    """Test that receipts are queried in JSON-RPC batches spread over the connected
+    nodes, falling back to the next node if one fails, that receipts missing from
+    the batch responses are not returned and that an owned node keeps its preference"""
+    nodes = [NodeName(
+        name=f'node{idx}',
+        endpoint=f'https://node{idx}.com',
+        owned=False,
+        blockchain=SupportedBlockchain.ETHEREUM,
+    ) for idx in range(2)]
+    tx_hashes = [make_evm_tx_hash() for _ in range(RECEIPTS_BATCH_SIZE + 5)]
+    missing_hash = tx_hashes[3]
+    queried_batches = defaultdict(list)
+
+    def mock_post(url, **kwargs):
+        queried_batches[url].append([entry['params'][0] for entry in kwargs['json']])
+        if url == nodes[1].endpoint:
+            return MockResponse(500, 'node is down')
+        return MockResponse(200, json.dumps([{
+            'jsonrpc': '2.0',
+            'id': entry['id'],
+            'result': None if entry['params'][0] == missing_hash.hex() else {
+                'transactionHash': entry['params'][0],
+                'blockNumber': '0x1',
+                'cumulativeGasUsed': '0x5208',
+                'gasUsed': '0x5208',
+                'status': '0x1',
+                'transactionIndex': '0x2',
+                'logs': [{'logIndex': '0x3', 'topics': [], 'data': '0x'}],
+            },
+        } for entry in kwargs['json']]))
+
+    def query_batches(connected_nodes):
+        with (
+            patch.object(ethereum_inquirer, 'web3_mapping', {
+                node: Web3Node(web3_instance=None, is_pruned=False, is_archive=True)
+                for node in connected_nodes
+            }),
+            patch.object(ethereum_inquirer, 'default_call_order', return_value=[
+                WeightedNode(node_info=node, active=True, weight=ONE) for node in connected_nodes
+            ]),
+            patch.object(ethereum_inquirer.session, 'post', side_effect=mock_post),
+        ):
+            return list(ethereum_inquirer.query_transaction_receipts_batches(tx_hashes))
+
+    batches = query_batches(nodes)
+    assert [batch for batch, _ in batches] == [tx_hashes[:RECEIPTS_BATCH_SIZE], tx_hashes[RECEIPTS_BATCH_SIZE:]]  # noqa: E501
+    # the second batch was sent to the failing node first and then to the working one
+    queried_hashes = [[tx_hash.hex() for tx_hash in batch] for batch, _ in batches]
+    assert queried_batches[nodes[0].endpoint] == queried_hashes
+    assert queried_batches[nodes[1].endpoint] == queried_hashes[1:]
+    receipts = batches[0][1] | batches[1][1]
+    assert set(receipts) == set(tx_hashes) - {missing_hash}
+    assert receipts[tx_hashes[0]]['status'] == 1
+    assert receipts[tx_hashes[0]]['logs'][0]['logIndex'] == 3
+    assert receipts[tx_hashes[0]]['logs'][0]['transactionIndex'] == 2
+
+    # with an owned node connected no batch is sent to the other nodes
+    owned_node = NodeName(
+        name='own',
+        endpoint='https://own.com',
+        owned=True,
+        blockchain=SupportedBlockchain.ETHEREUM,
+    )
+    queried_batches.clear()
+    assert query_batches([owned_node, *nodes]) == batches
+    assert queried_batches == {owned_node.endpoint: queried_hashes}
+
+
+def test_multicall_chunks_run_concurrently(ethereum_inquirer):
+    """Test that multicall chunks are queried concurrently starting from different nodes,
+    with bounded concurrency per node even for fallbacks, that an owned node keeps its
+    preference and that the output keeps the order of the calls"""
+    nodes = [NodeName(
+        name=f'node{idx}',
+        endpoint=f'https://node{idx}.com',
+        owned=False,
+        blockchain=SupportedBlockchain.ETHEREUM,
+    ) for idx in range(3)]
+    calls = [(make_evm_address(), f'0x{idx:02x}') for idx in range(20)]
+    queried_nodes, running, max_running = [], defaultdict(int), defaultdict(int)
+
+    def mock_call(arguments, call_order, **kwargs):
+        node = call_order[0].node_info
+        queried_nodes.append(node)
+        running[node] += 1
+        max_running[node] = max(max_running[node], running[node])
+        gevent.sleep(0.01 * (len(queried_nodes) % 3))  # finish out of order
+        running[node] -= 1
+        if node == nodes[2]:
+            raise RemoteError('node is down')
+        return 1, [data for _, data in arguments[0]]
+
+    def query_multicall(connected_nodes):
+        queried_nodes.clear()
+        max_running.clear()
+        with (
+            patch.object(ethereum_inquirer, 'web3_mapping', {
+                node: Web3Node(web3_instance=None, is_pruned=False, is_archive=True)
+                for node in connected_nodes
+            }),
+            patch.object(ethereum_inquirer.contract_multicall, 'call', side_effect=mock_call),
+        ):
+            return ethereum_inquirer.multicall(
+                calls=calls,
+                call_order=[WeightedNode(node_info=node, active=True, weight=ONE) for node in connected_nodes],  # noqa: E501
+                calls_chunk_size=2,
+            )
+
+    # the chunks of the failing node fall back to the others within their limit
+    assert query_multicall(nodes) == [data for _, data in calls]
+    assert queried_nodes.count(nodes[2]) > 1
+    assert sum(max_running.values()) > len(nodes)
+    assert max(max_running.values()) <= MULTICALL_CHUNKS_PER_NODE
+
+    # with an owned node connected the other nodes are not queried
+    owned_node = NodeName(
+        name='own',
+        endpoint='https://own.com',
+        owned=True,
+        blockchain=SupportedBlockchain.ETHEREUM,
+    )
+    assert query_multicall([owned_node, *nodes]) == [data for _, data in calls]
+    assert queried_nodes == [owned_node] * 10
+    assert max_running[owned_node] == MULTICALL_CHUNKS_PER_NODE
+
+    with (
+        patch.object(ethereum_inquirer, 'web3_mapping', {
+            node: Web3Node(web3_instance=None, is_pruned=False, is_archive=True)
+            for node in nodes
+        }),
+        patch.object(ethereum_inquirer.contract_multicall, 'call', side_effect=RemoteError('boom')),  # noqa: E501
+        pytest.raises(RemoteError, match='boom'),
+    ):
+        ethereum_inquirer.multicall(
+            calls=calls,
+            call_order=[WeightedNode(node_info=node, active=True, weight=ONE) for node in nodes],
+            calls_chunk_size=2,
+        )
@@ -6,7 +6,8 @@ import pytest
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.chain.ethereum.modules.gitcoin.constants import GITCOIN_GRANTS_OLD1
 from rotkehlchen.chain.evm.constants import GENESIS_HASH
-from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
+from rotkehlchen.chain.evm.decoding.constants import CPT_GAS, ERC20_OR_ERC721_TRANSFER
+from rotkehlchen.chain.evm.decoding.utils import DECODED_TOPICS_ATTRIBUTE
 from rotkehlchen.chain.evm.l2_with_l1_fees.types import L2WithL1FeesTransaction
 from rotkehlchen.chain.evm.types import EvmAccount, string_to_evm_address
 from rotkehlchen.constants.assets import A_ETH, A_SAI
@@ -192,6 +193,62 @@ def test_tx_decode(ethereum_transaction_decoder, database):
         assert write_cursor.execute('SELECT COUNT(*) from evm_tx_mappings').fetchone()[0] == 0
 
 
+@pytest.mark.parametrize('use_custom_database', ['ethtxs.db'])
+def test_tx_decode_batched_writes(ethereum_transaction_decoder, database):
+    """Test that decoding with batched DB writes stores the same events and marks all
+    transactions as decoded while using fewer write transactions"""
+    dbevmtx = DBEvmTx(database)
+    tx_hashes = dbevmtx.get_transaction_hashes_not_decoded(chain_id=ChainID.ETHEREUM, limit=None)
+    assert len(tx_hashes) > 2
+
+    decoder = ethereum_transaction_decoder
+    with (
+        patch('rotkehlchen.chain.evm.decoding.decoder.DECODING_WRITE_BATCH_SIZE', 2),
+        patch.object(decoder, '_flush_decoded_batch', wraps=decoder._flush_decoded_batch) as flush_mock,  # noqa: E501
+    ):
+        events = decoder.decode_transaction_hashes(
+            ignore_cache=False,
+            tx_hashes=tx_hashes,
+            batch_writes=True,
+        )
+
+    # one flush per full batch plus the final one
+    assert flush_mock.call_count == len(tx_hashes) // 2 + 1
+    assert dbevmtx.count_hashes_not_decoded(chain_id=ChainID.ETHEREUM) == 0
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) from evm_tx_mappings').fetchone()[0] == len(tx_hashes)  # noqa: E501
+        db_events = DBHistoryEvents(database).get_history_events(
+            cursor=cursor,
+            filter_query=EvmEventFilterQuery.make(tx_hashes=tx_hashes),
+            has_premium=True,
+        )
+    assert len(db_events) == len(events)
+
+    # decoding again just reads the events from the DB
+    with patch.object(decoder, '_decode_transaction') as decode_mock:
+        decoder.decode_transaction_hashes(ignore_cache=False, tx_hashes=tx_hashes, batch_writes=True)  # noqa: E501
+    assert decode_mock.call_count == 0
+
+
+@pytest.mark.parametrize('use_custom_database', ['ethtxs.db'])
+def test_decode_undecoded_transactions_in_shards(ethereum_transaction_decoder, database):
+    """Test that decoding the undecoded transactions in shards decodes all of them and
+    flushes the pending writes at the end of every shard"""
+    dbevmtx = DBEvmTx(database)
+    undecoded_num = dbevmtx.count_hashes_not_decoded(chain_id=ChainID.ETHEREUM)
+    assert undecoded_num > 1
+
+    decoder = ethereum_transaction_decoder
+    with (
+        patch('rotkehlchen.chain.evm.decoding.decoder.DECODING_SHARD_SIZE', 1),
+        patch.object(decoder, '_flush_decoded_batch', wraps=decoder._flush_decoded_batch) as flush_mock,  # noqa: E501
+    ):
+        decoder.get_and_decode_undecoded_transactions(batch_writes=True)
+
+    assert flush_mock.call_count >= undecoded_num
+    assert dbevmtx.count_hashes_not_decoded(chain_id=ChainID.ETHEREUM) == 0
+
+
 @pytest.mark.vcr(filter_query_parameters=['apikey'])
 @pytest.mark.parametrize('ethereum_accounts', [['0x9531C059098e3d194fF87FebB587aB07B30B1306', '0xc37b40ABdB939635068d3c5f13E7faF686F03B65']])  # noqa: E501
 @pytest.mark.parametrize('optimism_accounts', [['0x9531C059098e3d194fF87FebB587aB07B30B1306']])
@@ -296,3 +353,21 @@ def test_genesis_remove_address(
         )
 
     assert len(genesis_tx) == 0, 'Genesis transaction should have been deleted'
+
+
+def test_event_rules_topic_index(ethereum_transaction_decoder: 'EthereumTransactionDecoder'):
+    """Check that the topic index of the event rules contains exactly the rules that declare
+    each topic plus the rules without declared topics and that the rules order is kept"""
+    decoder = ethereum_transaction_decoder
+    all_rules = decoder.rules.event_rules
+    assert decoder.catch_all_event_rules == [
+        rule for rule in all_rules if getattr(rule, DECODED_TOPICS_ATTRIBUTE, None) is None
+    ]
+    assert ERC20_OR_ERC721_TRANSFER in decoder.event_rules_by_topic
+    for topic, rules in decoder.event_rules_by_topic.items():
+        assert rules == [
+            rule for rule in all_rules
+            if (topics := getattr(rule, DECODED_TOPICS_ATTRIBUTE, None)) is None or topic in topics
+        ]
+
+    assert len(decoder.event_rules_by_topic[ERC20_OR_ERC721_TRANSFER]) < len(all_rules)
@@ -1,4 +1,6 @@
+import itertools
 import math
+from decimal import InvalidOperation
 
 import pytest
 
@@ -175,3 +177,24 @@ def test_calculations_with_large_values():
     assert FVal(
         115792089237316195423570985008687907853269984665640564039457584007913129639936,
     ) + 1 == FVal(115792089237316195423570985008687907853269984665640564039457584007913129639937)
+
+
+def test_operations_match_decimal():
+    """Test that FVal operations give the exact same results as the underlying
+    Decimal operations, including comparisons against ints and NaN handling"""
+    values = ['0', '1', '-1', '5.21', '-23.124', '0.000000000000000001', '1.49298E+12', '3']
+    for x, y in itertools.product(values, repeat=2):
+        a, b = FVal(x), FVal(y)
+        assert (a + b).num == a.num + b.num
+        assert (a - b).num == a.num - b.num
+        assert (a * b).num == a.num * b.num
+        assert (a < b, a <= b, a > b, a >= b, a == b) == (a.num < b.num, a.num <= b.num, a.num > b.num, a.num >= b.num, a.num == b.num)  # noqa: E501
+        assert (a < 1, a <= 1, a > 1, a >= 1, a == 1) == (a.num < 1, a.num <= 1, a.num > 1, a.num >= 1, a.num == 1)  # noqa: E501
+        if b != ZERO:
+            assert (a / b).num == a.num / b.num
+            assert isinstance(a / b, FVal)
+
+    with pytest.raises(InvalidOperation):
+        assert FVal('NaN') < 1
+    with pytest.raises(InvalidOperation):
+        assert FVal('NaN') == FVal(1)
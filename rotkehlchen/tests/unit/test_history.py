@@ -1,3 +1,6 @@
+from dataclasses import replace
+from unittest.mock import patch
+
 import pytest
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
@@ -5,15 +8,18 @@ from rotkehlchen.accounting.pnl import PNL, PnlTotals
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.chain.ethereum.modules.eth2.structures import ValidatorDailyStats
 from rotkehlchen.constants import ZERO
-from rotkehlchen.constants.assets import A_ETH, A_ETH2
+from rotkehlchen.constants.assets import A_BTC, A_ETH, A_ETH2, A_EUR
+from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.exchanges.data_structures import AssetMovement, Trade
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.events.structures.base import HistoryEvent
 from rotkehlchen.history.events.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.history.manager import history_sort_key
 from rotkehlchen.history.types import HistoricalPriceOracle
 from rotkehlchen.tests.utils.accounting import accounting_history_process, check_pnls_and_csv
 from rotkehlchen.tests.utils.history import prices
 from rotkehlchen.tests.utils.messages import no_message_errors
-from rotkehlchen.types import Location
+from rotkehlchen.types import AssetMovementCategory, Location, Timestamp, TimestampMS, TradeType
 
 
 @pytest.mark.parametrize(('value', 'result'), [
@@ -92,3 +98,73 @@ def test_pnl_processing_with_eth2_staking_setting(accountant, db_settings):
             AccountingEventType.STAKING: PNL(taxable=FVal('20.55537445038'), free=ZERO),
         })
     check_pnls_and_csv(accountant, expected_pnls, None)
+
+
+def test_history_stream_is_sorted(history_querying_manager, database):
+    """Test that merging the streams of the DB tables gives the same order as sorting
+    all the events together, including history events of the same second that are
+    stored out of sequence index order"""
+    trades = [Trade(
+        timestamp=Timestamp(timestamp),
+        location=Location.KRAKEN,
+        base_asset=A_BTC,
+        quote_asset=A_EUR,
+        trade_type=TradeType.BUY,
+        amount=FVal(idx + 1),
+        rate=FVal(100),
+        fee=None,
+        fee_currency=None,
+        link=str(idx),
+    ) for idx, timestamp in enumerate((1600000010, 1600000015, 1600000020, 1600000040))]
+    movements = [AssetMovement(
+        location=Location.KRAKEN,
+        category=AssetMovementCategory.DEPOSIT,
+        address=None,
+        transaction_id=None,
+        timestamp=Timestamp(timestamp),
+        asset=A_BTC,
+        amount=FVal(1),
+        fee_asset=A_BTC,
+        fee=ZERO,
+        link=str(idx),
+    ) for idx, timestamp in enumerate((1600000010, 1600000030))]
+    history_events = [HistoryEvent(
+        event_identifier=f'event{idx}',
+        sequence_index=sequence_index,
+        timestamp=TimestampMS(timestamp),
+        location=Location.KRAKEN,
+        event_type=HistoryEventType.RECEIVE,
+        event_subtype=HistoryEventSubType.NONE,
+        asset=A_ETH,
+        balance=Balance(amount=FVal(1)),
+    ) for idx, (timestamp, sequence_index) in enumerate((
+        (1600000010100, 2),
+        (1600000010900, 0),
+        (1600000010500, 1),
+        (1600000020000, 0),
+        (1600000050000, 3),
+        (1600000050001, 2),
+    ))]
+    with database.user_write() as write_cursor:
+        database.add_trades(write_cursor, trades)
+        database.add_asset_movements(write_cursor, movements)
+        DBHistoryEvents(database).add_history_events(write_cursor, history_events)
+
+    with patch('rotkehlchen.history.manager.HISTORY_STREAM_PAGE_SIZE', 2):
+        _, events_num, stream = history_querying_manager.get_history_stream(
+            start_ts=Timestamp(0),
+            end_ts=Timestamp(1600000040),
+            has_premium=True,
+        )
+        streamed = [next(stream)]
+        # a trade written while streaming before the position already read is not returned
+        # and the entries of the pages already read are not returned again
+        with database.user_write() as write_cursor:
+            database.add_trades(write_cursor, [replace(trades[0], link='new')])
+        streamed.extend(stream)
+
+    assert events_num == 10  # the events after the end timestamp are not counted
+    expected = sorted([*trades, *movements, *history_events[:4]], key=history_sort_key)
+    assert [(x.get_timestamp(), type(x)) for x in streamed] == [(x.get_timestamp(), type(x)) for x in expected]  # noqa: E501
+    assert [x.event_identifier for x in streamed if isinstance(x, HistoryEvent)] == ['event1', 'event2', 'event0', 'event3']  # noqa: E501
+    assert [x.identifier for x in streamed if isinstance(x, Trade)] == [x.identifier for x in trades]  # noqa: E501
@@ -1,18 +1,21 @@
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_BTC, A_USD
 from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsupportedAsset
 from rotkehlchen.externalapis.coingecko import Coingecko
 from rotkehlchen.externalapis.cryptocompare import Cryptocompare
 from rotkehlchen.externalapis.defillama import Defillama
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.manual_price_oracles import ManualPriceOracle
-from rotkehlchen.history.price import PriceHistorian
+from rotkehlchen.history.price import HISTORICAL_PRICE_MISSING_CACHE_TTL, PriceHistorian
 from rotkehlchen.history.types import (
     DEFAULT_HISTORICAL_PRICE_ORACLES_ORDER,
     HistoricalPrice,
@@ -180,6 +183,80 @@ def test_token_to_fiat_via_second_oracle(fake_price_historian):
         assert oracle_instance.query_historical_price.call_count == 1
 
 
+def test_historical_price_cache(fake_price_historian):
+    """Test that resolved prices and missing prices are cached per hour bucket and
+    that the cache is cleared when the oracles are reordered"""
+    price_historian = fake_price_historian
+    expected_price = Price(FVal('30000'))
+    oracle_instances = price_historian._oracle_instances
+    oracle_instances[1].query_historical_price.return_value = expected_price
+    timestamp = Timestamp(1611594000)  # start of an hour
+    for offset in (0, 100, 3599):  # all in the same hour
+        assert price_historian.query_historical_price(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            timestamp=Timestamp(timestamp + offset),
+        ) == expected_price
+    assert oracle_instances[1].query_historical_price.call_count == 1
+    assert price_historian.get_price_cache_stats() == {'hits': 2, 'misses': 1, 'size': 1}
+
+    # missing prices are also cached but not when they are due to rate limiting
+    for instance in oracle_instances[1:]:
+        instance.query_historical_price.side_effect = RemoteError('rate limit', error_code=HTTPStatus.TOO_MANY_REQUESTS)  # noqa: E501
+    for _ in range(2):
+        with pytest.raises(NoPriceForGivenTimestamp):
+            price_historian.query_historical_price(A_BTC, A_USD, Timestamp(timestamp + 3600))
+    assert oracle_instances[1].query_historical_price.call_count == 3
+
+    for instance in oracle_instances[1:]:
+        instance.query_historical_price.side_effect = PriceQueryUnsupportedAsset('bitcoin')
+    for _ in range(2):
+        with pytest.raises(NoPriceForGivenTimestamp):
+            price_historian.query_historical_price(A_BTC, A_USD, Timestamp(timestamp + 3600))
+    assert oracle_instances[1].query_historical_price.call_count == 4
+
+    price_historian.set_oracles_order(price_historian._oracles)
+    assert price_historian.get_price_cache_stats()['size'] == 0
+
+
+def test_historical_price_cache_oracle_recovers(fake_price_historian, freezer):
+    """Test that a missing price is not cached while an oracle is penalized or failing,
+    so that the price is found once the oracle recovers, and that cached missing
+    prices expire"""
+    price_historian = fake_price_historian
+    expected_price = Price(FVal('30000'))
+    oracle_instances = price_historian._oracle_instances
+    penalized_oracle = oracle_instances[1]
+    timestamp = Timestamp(1611594000)
+    for instance in oracle_instances[1:]:
+        instance.query_historical_price.side_effect = PriceQueryUnsupportedAsset('bitcoin')
+    penalized_oracle.can_query_history.return_value = False
+    with pytest.raises(NoPriceForGivenTimestamp):
+        price_historian.query_historical_price(A_BTC, A_USD, timestamp)
+
+    # the oracle is no longer penalized but times out
+    penalized_oracle.can_query_history.return_value = True
+    penalized_oracle.query_historical_price.side_effect = RemoteError('timeout')
+    with pytest.raises(NoPriceForGivenTimestamp):
+        price_historian.query_historical_price(A_BTC, A_USD, timestamp)
+
+    penalized_oracle.query_historical_price.side_effect = None
+    penalized_oracle.query_historical_price.return_value = expected_price
+    assert price_historian.query_historical_price(A_BTC, A_USD, timestamp) == expected_price
+
+    # a price that all oracles answered they don't have is cached for a while
+    missing_ts = Timestamp(timestamp + 3600)
+    penalized_oracle.query_historical_price.side_effect = NoPriceForGivenTimestamp(A_BTC, A_USD, missing_ts)  # noqa: E501
+    with pytest.raises(NoPriceForGivenTimestamp):
+        price_historian.query_historical_price(A_BTC, A_USD, missing_ts)
+    penalized_oracle.query_historical_price.side_effect = None
+    with pytest.raises(NoPriceForGivenTimestamp):
+        price_historian.query_historical_price(A_BTC, A_USD, missing_ts)
+
+    freezer.tick(HISTORICAL_PRICE_MISSING_CACHE_TTL + 1)
+    assert price_historian.query_historical_price(A_BTC, A_USD, missing_ts) == expected_price
+
+
 def test_manual_oracle_correctly_returns_price(globaldb, fake_price_historian):
     """Test that the manual oracle correctly returns price for asset"""
     price_historian = fake_price_historian
@@ -267,3 +344,102 @@ def test_get_historical_prices(globaldb):
         max_seconds_distance=DAY_IN_SECONDS,
     )
     assert [price1, price2, price3, None, price4] == [x.price if x is not None else None for x in result]  # noqa: E501
+
+
+def test_get_historical_prices_for_pair(globaldb):
+    """Test that the bulk lookup for a pair matches the single price lookups, including
+    timestamps given out of order, ties and timestamps far apart from each other"""
+    ts1 = Timestamp(1611595470)
+    entries = [
+        (ts1, 30000),
+        (ts1 + 3600 * 4, 35000),
+        (ts1 + 3600 * 8, 36000),
+        (ts1 + 300 * DAY_IN_SECONDS, 77000),
+    ]
+    globaldb.add_historical_prices([
+        HistoricalPrice(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            price=Price(FVal(price)),
+            timestamp=timestamp,
+            source=HistoricalPriceOracle.MANUAL,
+        ) for timestamp, price in entries
+    ])
+    timestamps = [
+        Timestamp(ts1 + 300 * DAY_IN_SECONDS - 10),
+        Timestamp(ts1 + 3600 * 6),  # tie between two prices, earlier wins
+        Timestamp(ts1 - 3600),
+        Timestamp(ts1 + 100 * DAY_IN_SECONDS),
+        Timestamp(ts1 + 3600 * 4),
+    ]
+    result = globaldb.get_historical_prices_for_pair(
+        from_asset=A_BTC,
+        to_asset=A_USD,
+        timestamps=timestamps,
+        max_seconds_distance=DAY_IN_SECONDS,
+    )
+    assert [x.price if x is not None else None for x in result] == [77000, 35000, 30000, None, 35000]  # noqa: E501
+    for timestamp, entry in zip(timestamps, result, strict=True):
+        if timestamp == ts1 + 3600 * 6:
+            continue  # sqlite does not guarantee which entry wins a tie in get_historical_price
+
+        assert entry == globaldb.get_historical_price(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            timestamp=timestamp,
+            max_seconds_distance=DAY_IN_SECONDS,
+        )
+
+
+def test_cache_stored_historical_prices(globaldb, fake_price_historian):
+    """Test that the locally stored prices of a pair are read in bulk into the cache and
+    that only the timestamps without a stored price are returned to be queried"""
+    price_historian = fake_price_historian
+    ts1 = Timestamp(1611595470)
+    globaldb.add_historical_prices([
+        HistoricalPrice(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            price=Price(FVal(30000)),
+            timestamp=ts1,
+            source=HistoricalPriceOracle.MANUAL,
+        ), HistoricalPrice(
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            price=Price(FVal(31000)),
+            timestamp=Timestamp(ts1 + DAY_IN_SECONDS),
+            source=HistoricalPriceOracle.CRYPTOCOMPARE,
+        ), HistoricalPrice(  # a stored zero price is not a price
+            from_asset=A_BTC,
+            to_asset=A_USD,
+            price=Price(ZERO),
+            timestamp=Timestamp(ts1 + 2 * DAY_IN_SECONDS),
+            source=HistoricalPriceOracle.CRYPTOCOMPARE,
+        ),
+    ])
+    oracle_instances = price_historian._oracle_instances
+    oracle_instances[1].query_cached_historical_prices.side_effect = Cryptocompare.query_cached_historical_prices  # noqa: E501
+    missing_ts = [Timestamp(ts1 + 2 * DAY_IN_SECONDS), Timestamp(ts1 + 3 * DAY_IN_SECONDS)]
+    assert price_historian.cache_stored_historical_prices(
+        from_asset=A_BTC,
+        to_asset=A_USD,
+        timestamps=[Timestamp(ts1 + 60), Timestamp(ts1 + DAY_IN_SECONDS - 60), *missing_ts],
+    ) == missing_ts
+    # cryptocompare was only asked for the timestamps the manual prices did not cover
+    assert oracle_instances[1].query_cached_historical_prices.call_args.kwargs['timestamps'] == [
+        Timestamp(ts1 + DAY_IN_SECONDS - 60), *missing_ts,
+    ]
+    # a cryptocompare miss needs a remote query so later oracles are not checked
+    assert oracle_instances[2].mock_calls == []
+
+    # the cached prices are returned without querying any oracle
+    for oracle_instance in oracle_instances[1:]:
+        oracle_instance.query_historical_price.side_effect = AssertionError('should not be called')
+    assert price_historian.query_historical_price(A_BTC, A_USD, Timestamp(ts1 + 60)) == FVal(30000)
+    assert price_historian.query_historical_price(A_BTC, A_USD, Timestamp(ts1 + DAY_IN_SECONDS - 60)) == FVal(31000)  # noqa: E501
+    # and are not read again
+    assert price_historian.cache_stored_historical_prices(
+        from_asset=A_BTC,
+        to_asset=A_USD,
+        timestamps=[Timestamp(ts1 + 60), *missing_ts],
+    ) == missing_ts
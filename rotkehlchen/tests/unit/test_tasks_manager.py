@@ -1,4 +1,5 @@
 import datetime
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import MagicMock, patch
 
@@ -31,6 +32,12 @@ from rotkehlchen.premium.premium import Premium, PremiumCredentials, Subscriptio
 from rotkehlchen.serialization.deserialize import deserialize_timestamp
 from rotkehlchen.tasks.calendar import ENS_CALENDAR_COLOR
 from rotkehlchen.tasks.manager import PREMIUM_STATUS_CHECK, TaskManager
+from rotkehlchen.tasks.scheduling import (
+    TASK_PROPERTIES,
+    TaskPriority,
+    TaskProperties,
+    TaskResource,
+)
 from rotkehlchen.tasks.utils import should_run_periodic_task
 from rotkehlchen.tests.fixtures.websockets import WebsocketReader
 from rotkehlchen.tests.utils.ethereum import (
@@ -70,6 +77,45 @@ def test_potential_maybe_schedule_task(task_manager: TaskManager):
     """Check that all the _maybe_... tasks are included in the potential tasks."""
     tasks = {function.__name__ for function in task_manager.potential_tasks}
     assert all(func in tasks for func in dir(task_manager) if func.startswith('_maybe_'))
+    assert tasks == TASK_PROPERTIES.keys()
+
+
+@pytest.mark.parametrize('max_tasks_num', [5])
+def test_scheduling_respects_resource_limits(task_manager: TaskManager) -> None:
+    """Check that tasks needing a busy resource are not scheduled, that user facing API
+    tasks count as DB writers and that higher priority tasks are scheduled first"""
+    scheduled = []
+
+    def make_task(name: str, runtime: float = 0.1) -> Callable[[], list[gevent.Greenlet]]:
+        def task() -> list[gevent.Greenlet]:
+            scheduled.append(name)
+            return [gevent.spawn(gevent.sleep, runtime)]
+        task.__name__ = name
+        return task
+
+    db_tasks = [make_task(f'db_task_{idx}') for idx in range(2)]
+    urgent_task = make_task('urgent_task', runtime=0.3)
+    api_task = gevent.spawn(gevent.sleep, 0.1)
+    task_manager.api_task_greenlets.append(api_task)
+    task_manager.potential_tasks = [*db_tasks, urgent_task]
+    with patch.dict(TASK_PROPERTIES, {
+        'db_task_0': TaskProperties(TaskPriority.LOW, (TaskResource.DB_WRITE,)),
+        'db_task_1': TaskProperties(TaskPriority.LOW, (TaskResource.DB_WRITE,)),
+        'urgent_task': TaskProperties(TaskPriority.HIGH, (TaskResource.EXTERNAL_API,)),
+    }):
+        task_manager.schedule()
+        assert scheduled == ['urgent_task']  # the API task is using the DB writer
+
+        api_task.join()
+        task_manager.schedule()
+        assert len(scheduled) == 2  # only one of the DB tasks can run at a time
+        assert scheduled[1].startswith('db_task')
+        running_db_task, = (x for x in db_tasks if x in task_manager.running_greenlets)
+        gevent.wait(task_manager.running_greenlets[running_db_task])
+
+        task_manager.schedule()
+        assert sorted(scheduled[1:]) == ['db_task_0', 'db_task_1']
+        assert task_manager.task_runtimes.get(scheduled[1]) > 0
 
 
 @pytest.mark.parametrize('number_of_eth_accounts', [2])
@@ -1,6 +1,8 @@
 import json
 import sys
+import time
 from datetime import datetime
+from http import HTTPStatus
 from json.decoder import JSONDecodeError
 from unittest.mock import patch
 
@@ -9,8 +11,12 @@ from eth_typing import HexAddress, HexStr
 from eth_utils import to_checksum_address
 from hexbytes import HexBytes
 from packaging.version import Version
+from requests import Response
+from requests.adapters import HTTPAdapter
 
 from rotkehlchen.chain.ethereum.utils import generate_address_via_create2
+from rotkehlchen.crypto import decrypt, decrypt_chunks, encrypt, encrypt_chunks
+from rotkehlchen.errors.misc import UnableToDecryptRemoteData
 from rotkehlchen.errors.serialization import ConversionError
 from rotkehlchen.externalapis.github import Github
 from rotkehlchen.fval import FVal
@@ -28,6 +34,13 @@ from rotkehlchen.utils.misc import (
     timestamp_to_date,
 )
 from rotkehlchen.utils.mixins.cacheable import CacheableMixIn, cache_response_timewise
+from rotkehlchen.utils.network import (
+    HTTP_ADAPTER,
+    create_session,
+    get_hosts_stats,
+    remove_host_rate_limit,
+    set_host_rate_limit,
+)
 from rotkehlchen.utils.serialization import jsonloads_dict, jsonloads_list
 from rotkehlchen.utils.version_check import get_current_version
 
@@ -418,3 +431,48 @@ def test_pairwise():
     a = [1, 2, 3, 4, 5]
     assert [x + y for x, y in pairwise(a)] == [3, 7]
     assert list(pairwise_longest(a)) == [(1, 2), (3, 4), (5, None)]
+
+
+def test_encrypt_decrypt_chunks():
+    """Test that data encrypted in chunks decrypts the same as the whole data at once,
+    whatever the size of the chunks, and that a wrong key is detected"""
+    data = bytes(range(256)) * 100
+    chunks = [data[:5], data[5:5000], data[5000:]]
+    encrypted = b''.join(encrypt_chunks(b'key', chunks))
+    assert decrypt(b'key', encrypted) == data
+    assert b''.join(decrypt_chunks(b'key', [encrypted[:3], encrypted[3:17], encrypted[17:]])) == data  # noqa: E501
+    assert b''.join(decrypt_chunks(b'key', [encrypt(b'key', data)])) == data
+    with pytest.raises(UnableToDecryptRemoteData):
+        decrypt(b'other_key', encrypted)
+
+
+def test_pooled_http_adapter_rate_limit_and_stats():
+    """Test that sessions share the host rate limits and stats of the pooled adapter"""
+    host = 'rate.limited.test'
+    statuses = iter([HTTPStatus.TOO_MANY_REQUESTS] + [HTTPStatus.OK] * 3)
+
+    def mock_send(_adapter, request, *args, **kwargs):  # pylint: disable=unused-argument
+        response = Response()
+        response.status_code = next(statuses)
+        return response
+
+    set_host_rate_limit(host=host, requests_per_second=20, burst=2)
+    try:
+        with patch.object(HTTPAdapter, 'send', autospec=True, side_effect=mock_send):
+            start = time.monotonic()
+            responses = [
+                session.get(f'https://{host}/api')
+                for session in (create_session(), create_session()) for _ in range(2)
+            ]
+            assert time.monotonic() - start >= 0.09  # two requests over the burst at 20/sec
+
+        assert [x.status_code for x in responses] == [HTTPStatus.TOO_MANY_REQUESTS] + [HTTPStatus.OK] * 3  # noqa: E501
+
+        stats = get_hosts_stats()[host]
+        assert stats['requests'] == 4
+        assert stats['rate_limited'] == 1
+        assert stats['errors'] == 0
+        assert stats['throttled_seconds'] >= 0.09
+    finally:
+        remove_host_rate_limit(host)
+        HTTP_ADAPTER.stats.pop(host)
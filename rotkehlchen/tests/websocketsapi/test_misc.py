@@ -1,8 +1,12 @@
+import json
 import platform
 
 import gevent
 import pytest
 
+from rotkehlchen.api.websockets.notifier import RotkiNotifier
+from rotkehlchen.api.websockets.typedefs import WSMessageType
+
 
 def _send_stuff(msg_aggregator, websocket_connection, string_len):
     for _ in range(10):
@@ -36,3 +40,43 @@ def test_websockets_concurrent_use(rotkehlchen_api_server, websocket_connection)
             isinstance(x.exception, gevent.exceptions.ConcurrentObjectUseError) is False
             for x in [g1, g2] + rotki.greenlet_manager.greenlets
         ), 'At least one ConcurrentObjectUseError exception happened'
+
+
+class MockWebsocket:
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.messages: list[dict] = []
+
+    def send(self, message: str) -> None:
+        gevent.sleep(0.001)  # a slow websocket to make the messages pile up
+        self.messages.append(json.loads(message))
+
+
+def test_websockets_progress_messages_coalescing():
+    """Test that progress messages waiting to be sent are superseded by newer ones while
+    the start and end of the progress and other messages are all sent in order"""
+    notifier, websocket = RotkiNotifier(), MockWebsocket()
+    notifier.subscribe(websocket)
+    for processed in range(101):
+        notifier.broadcast(
+            message_type=WSMessageType.EVM_UNDECODED_TRANSACTIONS,
+            to_send_data={'chain': 'ethereum', 'total': 100, 'processed': processed},
+        )
+        if processed == 50:
+            notifier.broadcast(
+                message_type=WSMessageType.LEGACY,
+                to_send_data={'verbosity': 'error', 'value': 'an error'},
+            )
+
+    with gevent.Timeout(5):
+        while len(websocket.messages) != 4:
+            gevent.sleep(0.1)
+
+    assert [(x['type'], x['data'].get('processed')) for x in websocket.messages] == [
+        ('evm_undecoded_transactions', 0),
+        ('legacy', None),
+        ('evm_undecoded_transactions', 99),
+        ('evm_undecoded_transactions', 100),
+    ]
+    notifier.unsubscribe(websocket)
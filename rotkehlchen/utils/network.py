@@ -1,11 +1,17 @@
 import json
 import logging
+import time
+from collections import defaultdict
 from collections.abc import Callable
+from dataclasses import dataclass
 from http import HTTPStatus
-from typing import Any, Literal, overload
+from typing import Any, Final, Literal, overload
+from urllib.parse import urlparse
 
 import gevent
 import requests
+from gevent.lock import Semaphore
+from requests.adapters import HTTPAdapter
 
 from rotkehlchen.constants import GLOBAL_REQUESTS_TIMEOUT
 from rotkehlchen.db.settings import CachedSettings
@@ -15,6 +21,119 @@ from rotkehlchen.logging import RotkehlchenLogsAdapter
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+HTTP_POOL_HOSTS: Final = 64  # number of hosts whose connections are kept open
+HTTP_POOL_CONNECTIONS_PER_HOST: Final = 10  # connections kept open per host
+
+
+def get_host(url: str) -> str:
+    return urlparse(url).hostname or ''
+
+
+class TokenBucket:
+    """Rate limiter allowing `rate` requests per second with bursts of up to
+    `capacity` requests. Requests over the limit reserve the next free slot so
+    waiting greenlets are let through in order."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = Semaphore()
+
+    def acquire(self) -> float:
+        """Wait until a request can be made. Returns the seconds waited"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+        if wait != 0:
+            gevent.sleep(wait)
+        return wait
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0  # requests that failed to get a response
+    rate_limited: int = 0  # 429 responses
+    retries: int = 0
+    total_latency: float = 0  # seconds spent waiting for responses
+    throttled: float = 0  # seconds spent waiting for the host's rate limit
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'rate_limited': self.rate_limited,
+            'retries': self.retries,
+            'average_latency': self.total_latency / self.requests if self.requests != 0 else 0,
+            'throttled_seconds': self.throttled,
+        }
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """Transport adapter shared by all the sessions created with create_session so that
+    connections to each host are reused across services and greenlets. Also applies
+    the rate limits set for hosts and keeps per host stats."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            pool_connections=HTTP_POOL_HOSTS,
+            pool_maxsize=HTTP_POOL_CONNECTIONS_PER_HOST,
+        )
+        self.rate_limits: dict[str, TokenBucket] = {}
+        self.stats: defaultdict[str, HostStats] = defaultdict(HostStats)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> requests.Response:  # noqa: E501
+        host = get_host(str(request.url))
+        stats = self.stats[host]
+        if (rate_limit := self.rate_limits.get(host)) is not None:
+            stats.throttled += rate_limit.acquire()
+
+        start = time.monotonic()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except requests.exceptions.RequestException:
+            stats.errors += 1
+            raise
+        finally:
+            stats.requests += 1
+            stats.total_latency += time.monotonic() - start
+
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            stats.rate_limited += 1
+            log.debug(f'Got rate limited by {host}')
+        return response
+
+
+HTTP_ADAPTER: Final = PooledHTTPAdapter()
+
+
+def create_session() -> requests.Session:
+    """Create a session whose connections are pooled with all other sessions"""
+    session = requests.session()
+    session.mount('http://', HTTP_ADAPTER)
+    session.mount('https://', HTTP_ADAPTER)
+    return session
+
+
+def set_host_rate_limit(host: str, requests_per_second: float, burst: int = 1) -> None:
+    """Limit the requests made to the host from all sessions created with create_session"""
+    HTTP_ADAPTER.rate_limits[host] = TokenBucket(rate=requests_per_second, capacity=burst)
+
+
+def remove_host_rate_limit(host: str) -> None:
+    """Stop limiting the requests made to the host"""
+    HTTP_ADAPTER.rate_limits.pop(host, None)
+
+
+def get_hosts_stats() -> dict[str, dict[str, Any]]:
+    return {host: stats.serialize() for host, stats in HTTP_ADAPTER.stats.items()}
+
 
 def request_get(
         url: str,
@@ -105,12 +224,16 @@ def retry_calls(
                 )
                 gevent.sleep(backoff_in_seconds)
                 tries -= 1
+                if (url := kwargs.get('url')) is not None:
+                    HTTP_ADAPTER.stats[get_host(url)].retries += 1
                 continue
 
             return result  # noqa: TRY300
 
         except requests.exceptions.RequestException as e:
             tries -= 1
+            if (url := kwargs.get('url')) is not None:
+                HTTP_ADAPTER.stats[get_host(url)].retries += 1
             log.debug(
                 f'In retry_call for {location}-{method_name}. Got error {e!s} '
                 f'Trying again ... with {tries} tries left',